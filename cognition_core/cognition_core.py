@@ -28,23 +28,45 @@ Utilisation :
                          input_type="intent", output_type="text")
 """
 
+import asyncio
+import base64
+import binascii
+import concurrent.futures
+import functools
+import gc
 import json
 import logging
+import mmap
+import struct
 import time
 import uuid
 import threading
 import sqlite3
 import gzip
 import pickle
+import os
 import re
+import shutil
+import sys
+import weakref
+import zlib
+from array import array
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple, Set, Union
+from typing import (Dict, List, Optional, Any, Tuple, Set, Union, Iterable, Iterator, Callable, Sequence,
+                    AsyncIterable, AsyncIterator)
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from collections import defaultdict, OrderedDict
+from collections import defaultdict, OrderedDict, deque
 from abc import ABC, abstractmethod
 import hashlib
+import heapq
+import itertools
+import math
+import numpy as np
+import random
+import tempfile
+from contextlib import contextmanager, ExitStack, nullcontext
 
 __version__ = "10.0.0"
 logger = logging.getLogger("CognitionCore")
@@ -67,13 +89,66 @@ CONFIG = {
     "freezing_threshold": 0.1,
     "disk_threshold": 0.3,
     "promotion_threshold": 10,  # accès pour promotion
+    "cooling_curves": {},       # type de mémoire → "linear" (défaut) ou "exponential"
+    "relation_half_life_h": {   # demi-vie des poids de relations par type de mémoire (absent : pas d'oubli)
+        "litteraire_roman": 168.0,
+        "episodique": 72.0,
+        "social": 336.0,
+        "narrative": 144.0,
+    },
+    "relation_prune_threshold": 0.3,  # poids sous lequel la consolidation retire une relation
+    "relation_reinforcement": 0.1,    # part de l'écart à 1 regagnée par un usage de la relation
+    "temperature_reinforcement": 0.05,  # part de l'écart à 1 regagnée par un accès au concept
+
+    "disk_backend": "sqlite",      # "sqlite" (WAL) ou "files" (ancien format, un fichier par concept)
+    "disk_batch_size": 512,        # écritures regroupées par transaction
+    "disk_auto_migrate": True,     # migre disk/*.json.gz vers SQLite au démarrage
+    "index_journal_max_entries": 10000,  # compaction du journal d'index en instantané
+    "index_journal_fsync": False,        # fsync à chaque mutation (durabilité stricte)
+    "write_behind_interval_s": 1.0,      # latence max avant écriture d'un concept modifié
+    "write_behind_batch": 128,           # concepts sérialisés par prise du verrou
+    "write_behind_max_dirty": 4096,      # réveil anticipé de l'écrivain au-delà
+    "lookup_filter": True,               # filtre de Bloom devant get() (échecs sans E/S)
+    "lookup_filter_fp_rate": 0.01,       # taux de faux positifs visé
+    "lookup_filter_min_capacity": 100_000,
+    "startup_snapshot": True,            # instantané binaire des index et du Gem, réutilisé au démarrage
+    "bulk_load_batch": 5000,             # concepts par transaction lors d'un chargement en masse
+    "maintenance_slice_ms": 2.0,         # détention max du verrou par tranche (refroidissement, consolidation)
+    "cooling_ram_pressure": 0.9,         # occupation de la RAM déclenchant un refroidissement anticipé
+    "cooling_ram_target": 0.75,          # occupation visée après un refroidissement sous pression
+    "cooling_pressure_min_interval_s": 60.0,  # écart minimal entre deux refroidissements sous pression
+    "consolidation_min_interval_h": 12,  # écart minimal entre deux consolidations (signal de sommeil)
+    "consolidation_phases": ("deep_sleep",),  # phases circa/phase déclenchant la consolidation
+    "maintenance_history": 256,          # exécutions de maintenance gardées pour les statistiques
+    "maintenance_stop_timeout_s": 30.0,  # attente max de la fin d'une maintenance à l'arrêt
+    "access_sample_rate": 16,            # 1 lecture sur N marque le concept à réécrire (compteurs d'accès)
+    "traversal_prefetch_batch": 256,     # concepts du disque chargés par lot pendant un parcours pondéré
+    "closure_cache_size": 1024,          # fermetures transitives gardées en cache
+    "closure_max_depth": 32,
+    "closure_max_nodes": 10_000,
+    "archive_segment_bytes": 8 << 20,    # taille d'un segment d'archives avant rotation
+    "archive_max_bytes": 512 << 20,      # rétention : segments les plus anciens supprimés au-delà
+    "archive_compact_ratio": 0.5,        # part d'enregistrements morts déclenchant la réécriture d'un segment
+    "archive_recall": True,              # get() rappelle les concepts oubliés depuis les archives
+    "archive_recall_budget_ms": 20.0,    # attente max d'un rappel ; au-delà il s'achève en arrière-plan
+    "archive_recall_temperature": 0.5,   # température d'un concept rappelé
+    "signature_thresholds": {"vocale": 0.75, "visage": 0.6},  # similarité cosinus minimale d'une reconnaissance
+    "signature_top_k": 5,                # candidats rendus par search_signatures
+    "signature_min_dim": 8,              # en deçà, une signature n'est pas traitée comme un plongement
+    "signature_ivf_min_size": 4096,      # en deçà, recherche exacte sur toutes les signatures
+    "signature_ivf_nprobe": 16,          # listes inversées parcourues par recherche
+    "signature_ivf_train_iterations": 10,
     
     "nightly_hour": 2,
     "context_ttl_seconds": 300,
+    "context_wheel_tick_s": 1.0,         # granularité de la roue d'expiration des contextes
+    "context_max_frames": 100_000,       # contextes (conversation, interlocuteur) gardés au plus
+    "context_history_size": 32,          # derniers intents gardés par contexte
     "max_pending_fragments": 5,
     "min_confidence": 0.3,
     
-    "sentence_cache_size": 100
+    "sentence_cache_size": 100,
+    "intent_route_memo": 4096           # textes dont le routage est mémorisé
 }
 
 # ============================================================
@@ -136,6 +211,18 @@ class RelationType(str, Enum):
     INFERE_DE = "infere_de"
     CONFLIT_AVEC = "conflit_avec"
 
+# Relations dont l'inverse est ajoutée automatiquement sur la cible
+INVERSE_RELATIONS = {
+    RelationType.EST_UN: RelationType.A_POUR_INSTANCE,
+    RelationType.A_POUR_INSTANCE: RelationType.EST_UN,
+    RelationType.CONTIENT: RelationType.FAIT_PARTIE_DE,
+    RelationType.FAIT_PARTIE_DE: RelationType.CONTIENT,
+    RelationType.PRECEDE: RelationType.SUIT,
+    RelationType.SUIT: RelationType.PRECEDE,
+    RelationType.A_ECRIT: RelationType.EST_ECRIT_PAR,
+    RelationType.EST_ECRIT_PAR: RelationType.A_ECRIT
+}
+
 class SourceWeight(float, Enum):
     OBSERVATION = 1.0
     SELF = 0.95
@@ -184,7 +271,7 @@ class StorageLevel(str, Enum):
 # MODÈLES DE BASE
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, weakref_slot=True)
 class SourceInfo:
     type: SourceWeight
     speaker: Optional[str] = None
@@ -192,7 +279,7 @@ class SourceInfo:
     confidence: float = 1.0
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class Relation:
     type: RelationType
     cible: str
@@ -201,7 +288,7 @@ class Relation:
     bidirectionnelle: bool = True
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class Propriete:
     nom: str
     valeur: Any
@@ -209,58 +296,342 @@ class Propriete:
     source_info: SourceInfo
     confiance: float = 1.0
 
-@dataclass
+# ============================================================
+# REPRÉSENTATION COMPACTE DES CONCEPTS
+# ============================================================
+
+_SOURCES: 'weakref.WeakValueDictionary[tuple, SourceInfo]' = weakref.WeakValueDictionary()
+
+def intern_source(source: SourceInfo) -> SourceInfo:
+    """Partage les SourceInfo identiques (sans métadonnées) entre relations et propriétés."""
+    if source.metadata:
+        return source
+    key = (source.type, source.speaker, source.timestamp, source.confidence)
+    shared = _SOURCES.get(key)
+    if shared is None:
+        _SOURCES[key] = shared = source
+    return shared
+
+class ConceptIdRegistry:
+    """
+    Identifiants de concepts ↔ entiers, pour stocker les cibles des relations
+    dans des tableaux typés. La table ne rétrécit pas : une entrée par
+    identifiant rencontré depuis le démarrage.
+    """
+    
+    def __init__(self):
+        self._ints: Dict[str, int] = {}
+        self._strs: List[str] = []
+        self._lock = threading.Lock()
+    
+    def to_int(self, concept_id: str) -> int:
+        n = self._ints.get(concept_id)
+        if n is None:
+            with self._lock:
+                n = self._ints.get(concept_id)
+                if n is None:
+                    n = len(self._strs)
+                    self._strs.append(sys.intern(concept_id))
+                    self._ints[self._strs[n]] = n
+        return n
+    
+    def to_str(self, n: int) -> str:
+        return self._strs[n]
+    
+    def __len__(self) -> int:
+        return len(self._strs)
+
+CONCEPT_IDS = ConceptIdRegistry()
+_RELATION_TYPES = list(RelationType)
+_RELATION_INDEX = {t: i for i, t in enumerate(_RELATION_TYPES)}
+
+class RelationList:
+    """
+    Vue « liste de Relation » sur les tableaux d'un concept : les objets
+    Relation sont construits à la lecture, append() écrit dans les tableaux.
+    """
+    __slots__ = ("_concept",)
+    
+    def __init__(self, concept: 'Concept'):
+        self._concept = concept
+    
+    def __len__(self) -> int:
+        return len(self._concept._rel_sources)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._concept._relation_at(k) for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._concept._relation_at(i)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._concept._relation_at(i)
+    
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+    
+    def append(self, relation: Relation):
+        self._concept._append_relation(relation)
+    
+    def extend(self, relations: Iterable[Relation]):
+        for relation in relations:
+            self._concept._append_relation(relation)
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+_NO_SOURCES: Tuple[SourceInfo, ...] = ()
+
 class Concept:
-    id: str
-    nom: str
-    nature: ConceptNature
-    memoire_type: MemoryType = MemoryType.PERMANENT
-    storage_level: StorageLevel = StorageLevel.RAM
+    """
+    Concept du graphe, en représentation compacte : __slots__, sources
+    partagées (intern_source), relations en tableaux typés — paires
+    (indice du type, entier de la cible) dans un array('I'), poids dans un
+    array('f') créé seulement si un poids diffère de 1.0, et attributs rares
+    (bidirectionnelle=False, métadonnées) à part. `relations` reste une vue
+    compatible avec l'ancienne liste de Relation. `referenced` est le bit
+    CLOCK du cache RAM (non persisté).
+    """
+    __slots__ = ("id", "nom", "nature", "memoire_type", "storage_level",
+                 "proprietes", "aliases", "created", "last_accessed", "access_count",
+                 "temperature", "importance", "poids", "referenced",
+                 "_rels", "_rel_sources", "_rel_poids", "_rel_extra")
+    
+    def __init__(self, id: str, nom: str, nature: ConceptNature,
+                 memoire_type: MemoryType = MemoryType.PERMANENT,
+                 storage_level: StorageLevel = StorageLevel.RAM,
+                 relations: Optional[Iterable[Relation]] = None,
+                 proprietes: Optional[Dict[str, Propriete]] = None,
+                 aliases: Optional[Iterable[str]] = None,
+                 created: Optional[float] = None,
+                 last_accessed: Optional[float] = None,
+                 access_count: int = 0,
+                 temperature: float = 1.0,
+                 importance: float = 0.5,  # Pour épisodique
+                 poids: float = 1.0):      # Pour social
+        now = time.time()
+        self.id = id
+        self.nom = nom
+        self.nature = nature
+        self.memoire_type = memoire_type
+        self.storage_level = storage_level
+        self.proprietes = proprietes if proprietes is not None else {}
+        self.aliases = frozenset(aliases) if aliases else frozenset()
+        self.created = now if created is None else created
+        self.last_accessed = now if last_accessed is None else last_accessed
+        self.access_count = access_count
+        self.temperature = temperature
+        self.importance = importance
+        self.poids = poids
+        self.referenced = False
+        self._rels = None
+        self._rel_sources = _NO_SOURCES
+        self._rel_poids = None
+        self._rel_extra = None
+        if relations:
+            self.relations = relations
+    
+    def __repr__(self) -> str:
+        return (f"Concept(id={self.id!r}, nom={self.nom!r}, nature={self.nature.value}, "
+                f"relations={len(self._rel_sources)}, proprietes={len(self.proprietes)})")
+    
+    # --- Relations (tableaux typés) ---
     
-    relations: List[Relation] = field(default_factory=list)
-    proprietes: Dict[str, Propriete] = field(default_factory=dict)
-    aliases: Set[str] = field(default_factory=set)
+    @property
+    def relations(self) -> RelationList:
+        return RelationList(self)
+    
+    @relations.setter
+    def relations(self, relations: Iterable[Relation]):
+        self._rels = None
+        self._rel_sources = _NO_SOURCES
+        self._rel_poids = None
+        self._rel_extra = None
+        for relation in relations:
+            self._append_relation(relation)
+    
+    def _append_relation(self, relation: Relation):
+        if self._rels is None:
+            self._rels = array('I')
+            self._rel_sources = []
+        pos = len(self._rel_sources)
+        type_index = _RELATION_INDEX.get(relation.type)
+        if type_index is None:
+            type_index = _RELATION_INDEX[RelationType(relation.type)]
+        self._rels.append(type_index)
+        self._rels.append(CONCEPT_IDS.to_int(relation.cible))
+        self._rel_sources.append(intern_source(relation.source_info))
+        if relation.poids != 1.0 and self._rel_poids is None:
+            self._rel_poids = array('f', [1.0] * pos)
+        if self._rel_poids is not None:
+            self._rel_poids.append(relation.poids)
+        if not relation.bidirectionnelle or relation.metadata:
+            if self._rel_extra is None:
+                self._rel_extra = {}
+            self._rel_extra[pos] = (relation.bidirectionnelle, relation.metadata)
+    
+    def _relation_at(self, i: int) -> Relation:
+        extra = self._rel_extra.get(i) if self._rel_extra else None
+        return Relation(
+            type=_RELATION_TYPES[self._rels[2 * i]],
+            cible=CONCEPT_IDS.to_str(self._rels[2 * i + 1]),
+            source_info=self._rel_sources[i],
+            poids=self._rel_poids[i] if self._rel_poids is not None else 1.0,
+            bidirectionnelle=extra[0] if extra else True,
+            metadata=extra[1] if extra else {}
+        )
+    
+    def relation_keys(self) -> Iterator[Tuple[str, str]]:
+        """(type, cible) de chaque relation, sans construire d'objets Relation."""
+        rels = self._rels
+        if rels is None:
+            return
+        for i in range(0, len(rels), 2):
+            yield _RELATION_TYPES[rels[i]].value, CONCEPT_IDS.to_str(rels[i + 1])
     
-    created: float = field(default_factory=time.time)
-    last_accessed: float = field(default_factory=time.time)
-    access_count: int = 0
-    temperature: float = 1.0
-    importance: float = 0.5  # Pour épisodique
-    poids: float = 1.0        # Pour social
+    def weighted_relations(self, poids: Optional[Sequence[float]] = None) -> Iterator[Tuple[str, str, float]]:
+        """
+        (type, cible, poids × confiance de la source) de chaque relation, pour
+        les parcours ; `poids` remplace les poids stockés (table des poids).
+        """
+        rels = self._rels
+        if rels is None:
+            return
+        if poids is None:
+            poids = self._rel_poids
+        sources = self._rel_sources
+        for i in range(len(sources)):
+            weight = sources[i].confidence if poids is None else poids[i] * sources[i].confidence
+            yield _RELATION_TYPES[rels[2 * i]].value, CONCEPT_IDS.to_str(rels[2 * i + 1]), weight
     
     def add_relation(self, type: RelationType, cible: str, source: SourceInfo):
-        self.relations.append(Relation(type=type, cible=cible, source_info=source))
+        self._append_relation(Relation(type=type, cible=cible, source_info=source))
         self.last_accessed = time.time()
     
     def add_propriete(self, nom: str, valeur: Any, type: str, source: SourceInfo):
         self.proprietes[nom] = Propriete(
-            nom=nom, valeur=valeur, type=type, source_info=source
+            nom=nom, valeur=valeur, type=type, source_info=intern_source(source)
         )
         self.last_accessed = time.time()
     
     def get_relations(self, type: Optional[RelationType] = None) -> List[Relation]:
         if type:
             return [r for r in self.relations if r.type == type]
-        return self.relations
+        return list(self.relations)
     
+    def relation_position(self, type: RelationType, cible: str) -> Optional[int]:
+        """Rang de la relation (type, cible), ou None si le concept ne l'a pas."""
+        rels = self._rels
+        if rels is None:
+            return None
+        type_index = _RELATION_INDEX[type]
+        target = CONCEPT_IDS.to_int(cible)
+        for i in range(0, len(rels), 2):
+            if rels[i] == type_index and rels[i + 1] == target:
+                return i // 2
+        return None
+
     def cool_down(self, heures: float):
-        """Refroidissement selon le type de mémoire."""
-        if self.memoire_type == MemoryType.PERMANENT:
+        """Refroidissement selon le type de mémoire (pente et courbe de TemperatureTable)."""
+        rate = TemperatureTable.decay_rate(self)
+        if not rate:
             return
+        if TemperatureTable.exponential(self.memoire_type):
+            self.temperature *= math.exp(-rate * heures)
+        else:
+            self.temperature -= rate * heures
+        self.temperature = max(0.0, self.temperature)
+    
+    # --- Sérialisation ---
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Enregistrement sérialisable (types primitifs uniquement), sans asdict."""
+        sources: Dict[int, Dict[str, Any]] = {}
         
-        if self.memoire_type == MemoryType.LITTERAIRE_ROMAN:
-            self.temperature -= CONFIG["cooling_rate_litteraire"] * heures
-        elif self.memoire_type == MemoryType.EPISODIQUE:
-            self.temperature -= CONFIG["cooling_rate_episodique"] * heures * (1 - self.importance)
-        elif self.memoire_type == MemoryType.SOCIAL:
-            protection = min(1.0, self.poids / 10)
-            self.temperature -= CONFIG["cooling_rate_social"] * heures * (1 - protection)
-        elif self.memoire_type == MemoryType.NARRATIVE:
-            self.temperature -= CONFIG["cooling_rate_episodique"] * heures * 0.5
+        def source(s: SourceInfo) -> Dict[str, Any]:
+            rec = sources.get(id(s))
+            if rec is None:
+                rec = sources[id(s)] = {"type": s.type.value, "speaker": s.speaker,
+                                        "timestamp": s.timestamp, "confidence": s.confidence,
+                                        "metadata": s.metadata}
+            return rec
         
-        self.temperature = max(0.0, self.temperature)
+        relations = []
+        rels = self._rels
+        for i, src in enumerate(self._rel_sources):
+            extra = self._rel_extra.get(i) if self._rel_extra else None
+            relations.append({
+                "type": _RELATION_TYPES[rels[2 * i]].value,
+                "cible": CONCEPT_IDS.to_str(rels[2 * i + 1]),
+                "source_info": source(src),
+                "poids": self._rel_poids[i] if self._rel_poids is not None else 1.0,
+                "bidirectionnelle": extra[0] if extra else True,
+                "metadata": extra[1] if extra else {},
+            })
+        
+        return {
+            "id": self.id,
+            "nom": self.nom,
+            "nature": self.nature.value,
+            "memoire_type": self.memoire_type.value,
+            "storage_level": self.storage_level.value,
+            "relations": relations,
+            "proprietes": {
+                nom: {"nom": p.nom, "valeur": p.valeur, "type": p.type,
+                      "source_info": source(p.source_info), "confiance": p.confiance}
+                for nom, p in self.proprietes.items()
+            },
+            "aliases": sorted(self.aliases),
+            "created": self.created,
+            "last_accessed": self.last_accessed,
+            "access_count": self.access_count,
+            "temperature": self.temperature,
+            "importance": self.importance,
+            "poids": self.poids,
+        }
+    
+    @classmethod
+    def from_record(cls, d: Dict[str, Any]) -> 'Concept':
+        """Reconstruit un concept depuis to_record (ou l'ancien format JSON du disque)."""
+        def source(s: Dict[str, Any]) -> SourceInfo:
+            return intern_source(SourceInfo(type=SourceWeight(s["type"]), speaker=s.get("speaker"),
+                                            timestamp=s.get("timestamp", 0.0),
+                                            confidence=s.get("confidence", 1.0),
+                                            metadata=s.get("metadata") or {}))
+        
+        return cls(
+            id=d["id"],
+            nom=d["nom"],
+            nature=ConceptNature(d["nature"]),
+            memoire_type=MemoryType(d.get("memoire_type", MemoryType.PERMANENT)),
+            storage_level=StorageLevel(d.get("storage_level", StorageLevel.DISK)),
+            relations=[
+                Relation(type=RelationType(r["type"]), cible=r["cible"],
+                         source_info=source(r["source_info"]), poids=r.get("poids", 1.0),
+                         bidirectionnelle=r.get("bidirectionnelle", True),
+                         metadata=r.get("metadata") or {})
+                for r in d.get("relations", [])
+            ],
+            proprietes={
+                nom: Propriete(nom=p["nom"], valeur=p["valeur"], type=p["type"],
+                               source_info=source(p["source_info"]),
+                               confiance=p.get("confiance", 1.0))
+                for nom, p in d.get("proprietes", {}).items()
+            },
+            aliases=d.get("aliases", ()),
+            created=d.get("created", 0.0),
+            last_accessed=d.get("last_accessed", 0.0),
+            access_count=d.get("access_count", 0),
+            temperature=d.get("temperature", 1.0),
+            importance=d.get("importance", 0.5),
+            poids=d.get("poids", 1.0)
+        )
 
-@dataclass
+@dataclass(slots=True)
 class Attribute:
     type: str
     value: Any
@@ -271,7 +642,7 @@ class Attribute:
     def confidence(self) -> float:
         return self.source.confidence * self.source.type.value
 
-@dataclass
+@dataclass(slots=True)
 class StructuredIntent:
     id: str
     timestamp: float
@@ -297,7 +668,7 @@ class StructuredIntent:
         }
         return d
 
-@dataclass
+@dataclass(slots=True)
 class ContextFrame:
     conversation_id: str
     turn: int = 0
@@ -312,7 +683,8 @@ class ContextFrame:
     
     pending_fragments: List[str] = field(default_factory=list)
     subjects: List[str] = field(default_factory=list)
-    history: List[str] = field(default_factory=list)
+    # Anneau des derniers intents (context_history_size), le plus ancien écrasé
+    history: deque = field(default_factory=lambda: deque(maxlen=CONFIG["context_history_size"]))
     
     def is_expired(self) -> bool:
         return time.time() - self.last_update > CONFIG["context_ttl_seconds"]
@@ -325,16 +697,139 @@ class ContextFrame:
                 elif k == "pending_fragments" and isinstance(v, list):
                     self.pending_fragments.extend(v)
                     self.pending_fragments = self.pending_fragments[-CONFIG["max_pending_fragments"]:]
+                elif k == "history":
+                    self.history.extend(v if isinstance(v, list) else [v])
                 else:
                     setattr(self, k, v)
         self.last_update = time.time()
         self.turn += 1
     
+    def record(self, intent_id: str, speaker: str, now: float):
+        """Un tour de parole : équivalent à update(who=speaker, history=[intent_id]) daté de `now`."""
+        self.who = speaker
+        self.history.append(intent_id)
+        self.last_update = now
+        self.turn += 1
+    
     def flush_pending(self) -> List[str]:
         frags = list(self.pending_fragments)
         self.pending_fragments = []
         return frags
 
+class ContextStore:
+    """
+    Contextes de conversation, un par couple (conversation, interlocuteur),
+    en dict : recherche et création en O(1). Un texte sans conversation
+    désignée prend le contexte courant de son interlocuteur (conversation
+    "" : nouvel identifiant à chaque expiration).
+    
+    Expiration par roue temporelle : un créneau par context_wheel_tick_s
+    sur context_ttl_seconds, chaque contexte inscrit au créneau de son
+    échéance. Un tour ne déplace rien ; quand la roue atteint un créneau
+    (à chaque accès, selon l'horloge), ses contextes échus sont retirés et
+    les autres réinscrits à leur nouvelle échéance : coût amorti O(1) par
+    contexte, sans parcours de l'ensemble. Au-delà de context_max_frames,
+    les contextes les plus proches de l'échéance sont évincés.
+    """
+    
+    def __init__(self, ttl: Optional[float] = None, tick: Optional[float] = None,
+                 capacity: Optional[int] = None, now: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else CONFIG["context_ttl_seconds"]
+        self.tick = tick if tick is not None else CONFIG["context_wheel_tick_s"]
+        self.capacity = capacity if capacity is not None else CONFIG["context_max_frames"]
+        self.frames: Dict[Tuple[str, str], ContextFrame] = {}
+        self.slots: List[Set[Tuple[str, str]]] = [set() for _ in range(int(math.ceil(self.ttl / self.tick)) + 2)]
+        self._cursor = int((now if now is not None else time.time()) // self.tick)
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "expired": 0, "evicted": 0}
+    
+    def __len__(self) -> int:
+        return len(self.frames)
+    
+    def _slot(self, deadline: float) -> Set[Tuple[str, str]]:
+        return self.slots[int(deadline // self.tick) % len(self.slots)]
+    
+    def _advance(self, now: float):
+        """Traite les créneaux écoulés depuis le dernier accès (au plus un tour de roue)."""
+        target = int(now // self.tick)
+        first = max(self._cursor + 1, target - len(self.slots) + 1)
+        for position in range(first, target + 1):
+            i = position % len(self.slots)
+            keys, self.slots[i] = self.slots[i], set()
+            for key in keys:
+                frame = self.frames.get(key)
+                if frame is None:
+                    continue
+                deadline = frame.last_update + self.ttl
+                if deadline <= now:
+                    del self.frames[key]
+                    self.stats["expired"] += 1
+                else:
+                    # Échéance dans le créneau courant : déjà vidé, prendre le suivant
+                    position = max(int(deadline // self.tick), target + 1)
+                    self.slots[position % len(self.slots)].add(key)
+        self._cursor = max(self._cursor, target)
+    
+    def get(self, conversation_id: Optional[str], speaker: str,
+            now: Optional[float] = None) -> Optional[ContextFrame]:
+        """Contexte vivant du couple, sans le créer ni le rafraîchir."""
+        now = time.time() if now is None else now
+        key = (conversation_id or "", speaker)
+        with self._lock:
+            self._advance(now)
+            frame = self.frames.get(key)
+            if frame is not None and now - frame.last_update > self.ttl:
+                del self.frames[key]
+                self.stats["expired"] += 1
+                return None
+            return frame
+    
+    def open(self, conversation_id: Optional[str], speaker: str,
+             now: Optional[float] = None) -> ContextFrame:
+        """Contexte du couple, créé s'il n'existe pas ou a expiré."""
+        now = time.time() if now is None else now
+        key = (conversation_id or "", speaker)
+        with self._lock:
+            self._advance(now)
+            frame = self.frames.get(key)
+            if frame is not None and now - frame.last_update <= self.ttl:
+                return frame
+            if frame is not None:
+                self.stats["expired"] += 1
+            frame = self.frames[key] = ContextFrame(conversation_id=conversation_id or _short_id("conv"),
+                                                    last_update=now)
+            self._slot(now + self.ttl).add(key)
+            self.stats["created"] += 1
+            if len(self.frames) > self.capacity:
+                self._evict(key)
+            return frame
+    
+    def _evict(self, keep: Tuple[str, str]):
+        """Retire les contextes inscrits aux créneaux les plus proches jusqu'à la capacité."""
+        for position in range(self._cursor + 1, self._cursor + 1 + len(self.slots)):
+            slot = self.slots[position % len(self.slots)]
+            for key in list(slot):
+                frame = self.frames.get(key)
+                if frame is None or key == keep:
+                    if frame is None:
+                        slot.discard(key)
+                    continue
+                deadline_slot = self._slot(frame.last_update + self.ttl)
+                if deadline_slot is not slot:  # rafraîchi depuis : réinscrit à sa vraie échéance
+                    slot.discard(key)
+                    deadline_slot.add(key)
+                    continue
+                slot.discard(key)
+                del self.frames[key]
+                self.stats["evicted"] += 1
+                if len(self.frames) <= self.capacity:
+                    return
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"frames": len(self.frames), "slots": len(self.slots),
+                    "wheel_entries": sum(len(slot) for slot in self.slots), **self.stats}
+
 @dataclass
 class SystemContext:
     now: datetime = field(default_factory=datetime.now)
@@ -344,6 +839,107 @@ class SystemContext:
     def refresh(self):
         self.now = datetime.now()
 
+# ============================================================
+# INSTANTANÉS BINAIRES DE DÉMARRAGE
+# ============================================================
+
+SNAPSHOT_MAGIC = b"CGSNAP"
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_PREFIX = struct.Struct("<6sHI")  # magie, version, longueur de l'en-tête JSON
+
+def file_digest(path: Path) -> str:
+    """SHA-256 d'un fichier, lu par blocs."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def file_signature(path: Path, digest: bool = False) -> Optional[List[Any]]:
+    """[taille, mtime_ns] d'un fichier (plus son SHA-256 si `digest`) ; None s'il n'existe pas."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    signature: List[Any] = [st.st_size, st.st_mtime_ns]
+    if digest:
+        signature.append(file_digest(path))
+    return signature
+
+def same_source(recorded: Optional[List[Any]], path: Path) -> bool:
+    """
+    Vrai si `path` correspond à la signature enregistrée : même taille et
+    même mtime, ou à défaut même SHA-256 (fichier touché mais inchangé).
+    """
+    current = file_signature(path)
+    if not recorded or current is None or current[0] != recorded[0]:
+        return False
+    if current[1] == recorded[1]:
+        return True
+    return len(recorded) > 2 and file_digest(path) == recorded[2]
+
+def _unpickle(data) -> Any:
+    """pickle.loads sans ramasse-miettes cyclique : des millions de petits conteneurs
+    déclencheraient sinon des collectes répétées pendant le chargement."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(data)
+    finally:
+        if enabled:
+            gc.enable()
+
+def write_binary_snapshot(path: Path, kind: str, sources: Dict[str, Any], payload: Any,
+                          blobs: Optional[Dict[str, bytes]] = None):
+    """
+    Écrit un instantané versionné, de façon atomique : préfixe (magie,
+    version), en-tête JSON (type, signatures des sources, positions), charge
+    pickle, puis blocs binaires bruts relus sans désérialisation.
+    """
+    blobs = blobs or {}
+    body = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    offsets, position = {}, len(body)
+    for name, blob in blobs.items():
+        offsets[name] = [position, len(blob)]
+        position += len(blob)
+    header = json.dumps({"kind": kind, "sources": sources, "payload": len(body),
+                         "blobs": offsets}).encode()
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(_SNAPSHOT_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header)))
+        f.write(header)
+        f.write(body)
+        for blob in blobs.values():
+            f.write(blob)
+    os.replace(tmp_path, path)
+
+def read_binary_snapshot(path: Path, kind: str,
+                         sources: Dict[str, Any]) -> Optional[Tuple[Any, Dict[str, bytes]]]:
+    """
+    Relit un instantané par projection mémoire. None s'il est absent, d'une
+    autre version ou d'un autre type, illisible, ou si une source a changé.
+    """
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            magic, version, header_len = _SNAPSHOT_PREFIX.unpack_from(mm, 0)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                return None
+            start = _SNAPSHOT_PREFIX.size
+            header = json.loads(mm[start:start + header_len])
+            if header["kind"] != kind or header["sources"] != sources:
+                return None
+            start += header_len
+            with memoryview(mm) as view:
+                payload = _unpickle(view[start:start + header["payload"]])
+                blobs = {name: bytes(view[start + offset:start + offset + size])
+                         for name, (offset, size) in header["blobs"].items()}
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, struct.error, pickle.UnpicklingError, EOFError) as e:
+        logger.warning(f"Instantané {path.name} illisible, ignoré: {e}")
+        return None
+    return payload, blobs
+
 # ============================================================
 # GEM
 # ============================================================
@@ -382,7 +978,23 @@ class Gem:
     intensite_humeur: float = 0.5
     
     @classmethod
-    def from_file(cls, path: Path) -> 'Gem':
+    def from_file(cls, path: Path, cache_path: Optional[Path] = None) -> 'Gem':
+        """
+        Lit le Gem ; avec `cache_path`, réutilise l'instantané binaire tant que
+        le contenu du fichier (SHA-256) n'a pas changé.
+        """
+        if cache_path is None:
+            return cls._parse(path)
+        sources = {"gem": file_digest(path)}
+        cached = read_binary_snapshot(cache_path, "gem", sources)
+        if cached is not None:
+            return cached[0]
+        gem = cls._parse(path)
+        write_binary_snapshot(cache_path, "gem", sources, gem)
+        return gem
+    
+    @classmethod
+    def _parse(cls, path: Path) -> 'Gem':
         with open(path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         g = data.get("gem", data)
@@ -453,183 +1065,2509 @@ class CompressedStorage:
             return pickle.load(f)
 
 # ============================================================
-# GRAPHE DE CONNAISSANCES (mémoire unique)
+# BACKENDS DU NIVEAU DISQUE
 # ============================================================
 
-class KnowledgeGraph:
-    """
-    Graphe unique de connaissances avec hiérarchie de stockage.
-    """
+class DiskBackend(ABC):
+    """Stockage du niveau disque (concepts tièdes), indexé par identifiant."""
     
-    def __init__(self, data_path: Path):
-        self.data_path = Path(data_path)
-        self.data_path.mkdir(parents=True, exist_ok=True)
-        
-        self.disk_path = self.data_path / "disk"
-        self.disk_path.mkdir(exist_ok=True)
-        
-        self.archive_path = CONFIG["archive_dir"]
-        self.archive_path.mkdir(parents=True, exist_ok=True)
+    concurrent_snapshot = False  # frozen() tolère des écritures pendant la copie
+    
+    @abstractmethod
+    def load(self, concept_id: str) -> Optional[Concept]: ...
+    
+    @abstractmethod
+    def load_many(self, concept_ids: List[str]) -> Dict[str, Concept]: ...
+    
+    @abstractmethod
+    def save(self, concept: Concept): ...
+    
+    @abstractmethod
+    def save_many(self, concepts: List[Concept]): ...
+    
+    @abstractmethod
+    def save_records(self, records: List[Dict[str, Any]]):
+        """Écrit des enregistrements déjà sérialisés (Concept.to_record)."""
+    
+    @abstractmethod
+    def delete(self, concept_id: str): ...
+    
+    @abstractmethod
+    def contains(self, concept_id: str) -> bool: ...
+    
+    @abstractmethod
+    def ids(self) -> List[str]: ...
+    
+    def count(self) -> int:
+        return len(self.ids())
+    
+    def files(self) -> List[Path]:
+        """Fichiers (ou répertoire) dont la signature change à chaque écriture."""
+        return []
+    
+    def flush(self):
+        """Force l'écriture des modifications en attente."""
+    
+    def close(self):
+        self.flush()
+    
+    @contextmanager
+    def frozen(self) -> Iterator[Callable[[Optional[Iterable[str]]], Iterator[Tuple[str, bytes]]]]:
+        """
+        Image des concepts au moment de l'appel, pour un instantané : rend
+        rows(ids=None), itérateur de (id, enregistrement encodé comme dans
+        SQLiteDiskBackend) sur tous les concepts ou sur `ids` (les absents
+        sont omis). Sans concurrent_snapshot, l'appelant empêche toute
+        écriture jusqu'à la sortie du bloc.
+        """
+        frozen_ids = self.ids()
         
-        # RAM cache (LRU)
-        self.ram_cache: OrderedDict[str, Concept] = OrderedDict()
-        self.max_ram = CONFIG["max_ram_concepts"]
+        def rows(ids: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, bytes]]:
+            wanted = frozen_ids if ids is None else list(ids)
+            for i in range(0, len(wanted), 500):
+                for cid, concept in self.load_many(wanted[i:i + 500]).items():
+                    yield cid, SQLiteDiskBackend.encode(concept)
         
-        # Index
-        self.index_nom: Dict[str, str] = {}  # nom → concept_id
-        self.index_alias: Dict[str, str] = {}  # alias → concept_id
-        self.index_signature_vocale: Dict[str, str] = {}  # signature → concept_id
-        self.index_signature_visage: Dict[str, str] = {}  # signature → concept_id
+        yield rows
+
+class FileDiskBackend(DiskBackend):
+    """Ancien format : un fichier disk/{id}.json.gz par concept."""
+    
+    def __init__(self, disk_path: Path):
+        self.disk_path = Path(disk_path)
+        self.disk_path.mkdir(parents=True, exist_ok=True)
+        self._held: Optional[Set[str]] = None  # suppressions différées pendant frozen()
+    
+    def _path(self, concept_id: str) -> Path:
+        return self.disk_path / f"{concept_id}.json.gz"
+    
+    @contextmanager
+    def frozen(self):
+        # Les oublis (hors verrou d'écriture différée) sont différés jusqu'à la fin de la copie
+        frozen_ids = self.ids()
+        self._held = set()
         
-        self._lock = threading.RLock()
-        self.last_cooling = time.time()
+        def rows(ids: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, bytes]]:
+            for cid in (frozen_ids if ids is None else ids):
+                concept = self._read(cid)
+                if concept is not None:
+                    yield cid, SQLiteDiskBackend.encode(concept)
         
-        # Charger les index
-        self._load_index()
+        try:
+            yield rows
+        finally:
+            held, self._held = self._held, None
+            for cid in held:
+                self._path(cid).unlink(missing_ok=True)
     
-    def _load_index(self):
-        """Charge les index depuis le disque."""
-        index_file = self.data_path / "index.json.gz"
-        if index_file.exists():
-            with gzip.open(index_file, 'rt') as f:
-                data = json.load(f)
-                self.index_nom = data.get("nom", {})
-                self.index_alias = data.get("alias", {})
-                self.index_signature_vocale = data.get("signature_vocale", {})
-                self.index_signature_visage = data.get("signature_visage", {})
+    def files(self) -> List[Path]:
+        return [self.disk_path]
     
-    def _save_index(self):
-        """Sauvegarde les index."""
-        data = {
-            "nom": self.index_nom,
-            "alias": self.index_alias,
-            "signature_vocale": self.index_signature_vocale,
-            "signature_visage": self.index_signature_visage
-        }
-        with gzip.open(self.data_path / "index.json.gz", 'wt') as f:
-            json.dump(data, f)
+    def _read(self, concept_id: str) -> Optional[Concept]:
+        filepath = self._path(concept_id)
+        if not filepath.exists():
+            return None
+        with gzip.open(filepath, 'rt') as f:
+            concept = Concept.from_record(json.load(f))
+        concept.storage_level = StorageLevel.DISK
+        return concept
     
-    def _ram_get(self, concept_id: str) -> Optional[Concept]:
-        """Récupère un concept du cache RAM."""
-        if concept_id in self.ram_cache:
-            concept = self.ram_cache[concept_id]
-            self.ram_cache.move_to_end(concept_id)
-            concept.last_accessed = time.time()
-            concept.access_count += 1
-            return concept
-        return None
+    def load(self, concept_id: str) -> Optional[Concept]:
+        held = self._held
+        if held is not None and concept_id in held:
+            return None
+        return self._read(concept_id)
     
-    def _ram_put(self, concept: Concept):
-        """Ajoute un concept au cache RAM (LRU)."""
-        if len(self.ram_cache) >= self.max_ram:
-            # Éviction LRU
-            oldest_id, oldest = next(iter(self.ram_cache.items()))
-            if oldest.storage_level == StorageLevel.RAM:
-                self._disk_save(oldest)
-            del self.ram_cache[oldest_id]
-        
-        concept.storage_level = StorageLevel.RAM
-        self.ram_cache[concept.id] = concept
+    def load_many(self, concept_ids: List[str]) -> Dict[str, Concept]:
+        found = {}
+        for cid in concept_ids:
+            concept = self.load(cid)
+            if concept:
+                found[cid] = concept
+        return found
+    
+    def save(self, concept: Concept):
+        self.save_records([concept.to_record()])
+    
+    def save_many(self, concepts: List[Concept]):
+        self.save_records([c.to_record() for c in concepts])
+    
+    def save_records(self, records: List[Dict[str, Any]]):
+        for record in records:
+            with gzip.open(self._path(record["id"]), 'wt') as f:
+                json.dump(record, f)
+    
+    def delete(self, concept_id: str):
+        held = self._held
+        if held is not None:
+            held.add(concept_id)
+            return
+        self._path(concept_id).unlink(missing_ok=True)
+    
+    def contains(self, concept_id: str) -> bool:
+        held = self._held
+        if held is not None and concept_id in held:
+            return False
+        return self._path(concept_id).exists()
+    
+    def ids(self) -> List[str]:
+        held = self._held or ()
+        return [cid for cid in (p.name[:-len(".json.gz")] for p in self.disk_path.glob("*.json.gz"))
+                if cid not in held]
+
+class SQLiteDiskBackend(DiskBackend):
+    """
+    Niveau disque dans un seul fichier SQLite (mode WAL).
+    Une ligne par concept : identifiant + enregistrement encodé en binaire
+    (pickle). Les écritures sont accumulées puis validées par lots dans une
+    seule transaction ; les lectures consultent d'abord ce tampon.
+    """
+    
+    _DELETED = object()
+    concurrent_snapshot = True
+    
+    def __init__(self, db_path: Path, batch_size: int = 512):
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self._lock = threading.RLock()
+        self._pending: Dict[str, Any] = {}  # id → bytes encodés ou _DELETED
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False,
+                                     isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS concepts (id TEXT PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID"
+        )
+    
+    @staticmethod
+    def encode(concept: Concept) -> bytes:
+        return pickle.dumps(concept.to_record(), protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def files(self) -> List[Path]:
+        # Le WAL est reporté dans la base puis supprimé à la fermeture, recréé vide à l'ouverture
+        return [self.db_path]
     
-    def _disk_save(self, concept: Concept):
-        """Sauvegarde un concept sur disque."""
-        filepath = self.disk_path / f"{concept.id}.json.gz"
-        with gzip.open(filepath, 'wt') as f:
-            json.dump(asdict(concept), f)
+    @staticmethod
+    def decode(data: bytes) -> Concept:
+        concept = Concept.from_record(pickle.loads(data))
         concept.storage_level = StorageLevel.DISK
+        return concept
     
-    def _disk_load(self, concept_id: str) -> Optional[Concept]:
-        """Charge un concept depuis le disque."""
-        filepath = self.disk_path / f"{concept_id}.json.gz"
-        if not filepath.exists():
+    def load(self, concept_id: str) -> Optional[Concept]:
+        with self._lock:
+            data = self._pending.get(concept_id)
+            if data is None:
+                row = self._conn.execute(
+                    "SELECT data FROM concepts WHERE id = ?", (concept_id,)
+                ).fetchone()
+                data = row[0] if row else None
+        if data is None or data is self._DELETED:
             return None
-        
-        with gzip.open(filepath, 'rt') as f:
-            data = json.load(f)
-            concept = Concept(**data)
-            concept.storage_level = StorageLevel.DISK
-            return concept
+        return self.decode(data)
     
-    def _archive_save(self, concept: Concept):
-        """Archive un concept (oubli)."""
-        filepath = self.archive_path / f"{concept.id}_{int(time.time())}.json.gz"
-        with gzip.open(filepath, 'wt') as f:
-            json.dump(asdict(concept), f)
+    def load_many(self, concept_ids: List[str]) -> Dict[str, Concept]:
+        rows: Dict[str, bytes] = {}
+        with self._lock:
+            missing = []
+            for cid in concept_ids:
+                data = self._pending.get(cid)
+                if data is None:
+                    missing.append(cid)
+                elif data is not self._DELETED:
+                    rows[cid] = data
+            for i in range(0, len(missing), 500):
+                chunk = missing[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows.update(self._conn.execute(
+                    f"SELECT id, data FROM concepts WHERE id IN ({marks})", chunk
+                ).fetchall())
+        return {cid: self.decode(data) for cid, data in rows.items()}
     
-    def get(self, identifiant: Union[str, Concept]) -> Optional[Concept]:
-        """Récupère un concept par ID, nom, alias ou signature."""
+    def save(self, concept: Concept):
+        data = self.encode(concept)
         with self._lock:
-            # Si déjà un concept
-            if isinstance(identifiant, Concept):
-                return identifiant
-            
-            # Chercher par ID
-            concept = self._ram_get(identifiant)
-            if concept:
-                return concept
-            
-            concept = self._disk_load(identifiant)
-            if concept:
-                self._ram_put(concept)
-                return concept
-            
-            # Chercher par nom
-            if identifiant.lower() in self.index_nom:
-                cid = self.index_nom[identifiant.lower()]
-                return self.get(cid)
-            
-            # Chercher par alias
-            if identifiant.lower() in self.index_alias:
-                cid = self.index_alias[identifiant.lower()]
-                return self.get(cid)
-            
-            # Chercher par signature vocale
-            if identifiant in self.index_signature_vocale:
-                cid = self.index_signature_vocale[identifiant]
-                return self.get(cid)
-            
-            # Chercher par signature visage
-            if identifiant in self.index_signature_visage:
-                cid = self.index_signature_visage[identifiant]
-                return self.get(cid)
-        
-        return None
+            self._pending[concept.id] = data
+            if len(self._pending) >= self.batch_size:
+                self.flush()
     
-    def get_or_create(self, nom: str, nature: ConceptNature,
-                     memoire_type: MemoryType = MemoryType.PERMANENT,
-                     source: Optional[SourceInfo] = None) -> Concept:
-        """Récupère ou crée un concept."""
-        existing = self.get(nom)
-        if existing:
-            return existing
-        
-        source = source or SourceInfo(type=SourceWeight.EDUCATIVE)
-        concept_id = f"concept_{uuid.uuid4().hex[:8]}"
-        
+    def save_many(self, concepts: List[Concept]):
+        encoded = [(c.id, self.encode(c)) for c in concepts]
         with self._lock:
-            concept = Concept(
-                id=concept_id,
-                nom=nom,
-                nature=nature,
-                memoire_type=memoire_type
-            )
-            self._ram_put(concept)
-            self.index_nom[nom.lower()] = concept_id
-            return concept
+            self._pending.update(encoded)
+            self.flush()
     
-    def add_concept(self, concept: Concept):
-        """Ajoute un concept existant."""
+    def save_records(self, records: List[Dict[str, Any]]):
+        encoded = [(r["id"], pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL)) for r in records]
         with self._lock:
-            self._ram_put(concept)
-            self.index_nom[concept.nom.lower()] = concept.id
-            for alias in concept.aliases:
-                self.index_alias[alias.lower()] = concept.id
+            self._pending.update(encoded)
+            self.flush()
     
-    def add_relation(self, source: Union[str, Concept],
-                    type: RelationType, cible: Union[str, Concept],
-                    source_info: SourceInfo):
-        """Ajoute une relation entre deux concepts."""
-        src = self.get(source) if isinstance(source, str) else source
+    def delete(self, concept_id: str):
+        with self._lock:
+            self._pending[concept_id] = self._DELETED
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+    
+    def contains(self, concept_id: str) -> bool:
+        with self._lock:
+            data = self._pending.get(concept_id)
+            if data is not None:
+                return data is not self._DELETED
+            return self._conn.execute(
+                "SELECT 1 FROM concepts WHERE id = ?", (concept_id,)
+            ).fetchone() is not None
+    
+    def ids(self) -> List[str]:
+        with self._lock:
+            ids = {row[0] for row in self._conn.execute("SELECT id FROM concepts")}
+            for cid, data in self._pending.items():
+                if data is self._DELETED:
+                    ids.discard(cid)
+                else:
+                    ids.add(cid)
+        return list(ids)
+    
+    def count(self) -> int:
+        with self._lock:
+            if self._pending:
+                return len(self.ids())
+            return self._conn.execute("SELECT COUNT(*) FROM concepts").fetchone()[0]
+    
+    def flush(self):
+        with self._lock:
+            if not self._pending:
+                return
+            upserts = [(cid, data) for cid, data in self._pending.items() if data is not self._DELETED]
+            deletes = [(cid,) for cid, data in self._pending.items() if data is self._DELETED]
+            self._conn.execute("BEGIN")
+            try:
+                if upserts:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO concepts (id, data) VALUES (?, ?)", upserts)
+                if deletes:
+                    self._conn.executemany("DELETE FROM concepts WHERE id = ?", deletes)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._pending.clear()
+    
+    @contextmanager
+    def frozen(self):
+        """
+        Transaction de lecture sur une connexion dédiée, ouverte après
+        l'écriture du tampon : en WAL, les écritures suivantes continuent
+        sans être vues de l'image.
+        """
+        with self._lock:
+            self.flush()
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+            conn.execute("BEGIN")
+            conn.execute("SELECT 1 FROM concepts LIMIT 1").fetchone()  # ouvre la lecture
+        
+        def rows(ids: Optional[Iterable[str]] = None) -> Iterator[Tuple[str, bytes]]:
+            if ids is None:
+                cursor = conn.execute("SELECT id, data FROM concepts")
+                while True:
+                    batch = cursor.fetchmany(1000)
+                    if not batch:
+                        return
+                    yield from batch
+            ids = list(ids)
+            for i in range(0, len(ids), 500):
+                chunk = ids[i:i + 500]
+                yield from conn.execute(
+                    f"SELECT id, data FROM concepts WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+        
+        try:
+            yield rows
+        finally:
+            conn.execute("ROLLBACK")
+            conn.close()
+    
+    def close(self):
+        with self._lock:
+            self.flush()
+            self._conn.close()
+
+def open_disk_backend(kind: str, data_path: Path) -> DiskBackend:
+    """Ouvre le backend disque d'un graphe ("sqlite" ou "files")."""
+    data_path = Path(data_path)
+    if kind == "sqlite":
+        return SQLiteDiskBackend(data_path / "disk.sqlite", CONFIG["disk_batch_size"])
+    if kind == "files":
+        return FileDiskBackend(data_path / "disk")
+    raise ValueError(f"Backend disque inconnu: {kind}")
+
+def migrate_disk_backend(source: DiskBackend, target: DiskBackend,
+                         batch_size: int = 1000, delete_source: bool = False) -> int:
+    """Copie tous les concepts d'un backend vers un autre, par lots. Retourne le nombre migré."""
+    ids = source.ids()
+    migrated = 0
+    for i in range(0, len(ids), batch_size):
+        batch = source.load_many(ids[i:i + batch_size])
+        target.save_many(list(batch.values()))
+        if delete_source:
+            for cid in batch:
+                source.delete(cid)
+        migrated += len(batch)
+    target.flush()
+    source.flush()
+    logger.info(f"Migration disque: {migrated} concepts copiés")
+    return migrated
+
+# ============================================================
+# JOURNAL DES INDEX
+# ============================================================
+
+class IndexJournal:
+    """
+    Persistance des index du graphe : un instantané compressé (index.json.gz)
+    plus un journal append-only des mutations, une ligne JSON par opération.
+    Une mutation coûte une écriture de ligne, quelle que soit la taille du
+    graphe. La compaction se fait en deux temps : rotation du journal
+    (index.journal → index.journal.1, instantanée) puis écriture de
+    l'instantané dans un fichier temporaire substitué atomiquement
+    (os.replace), après quoi le journal tourné est supprimé. Les opérations
+    étant idempotentes, rejouer un journal déjà compacté est sûr.
+    """
+    
+    def __init__(self, snapshot_path: Path, journal_path: Path, fsync: bool = False,
+                 set_indexes: Tuple[str, ...] = ()):
+        self.snapshot_path = Path(snapshot_path)
+        self.journal_path = Path(journal_path)
+        self.rotated_path = self.journal_path.with_name(self.journal_path.name + ".1")
+        self.fsync = fsync
+        self.set_indexes = set(set_indexes)  # index clé → ensemble de membres
+        self.entries = 0
+        self._lock = threading.Lock()
+        self._file = None
+    
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Charge l'instantané puis rejoue le journal (une ligne tronquée est ignorée)."""
+        maps: Dict[str, Dict[str, Any]] = {}
+        if self.snapshot_path.exists():
+            with gzip.open(self.snapshot_path, 'rt') as f:
+                maps = json.load(f)
+        for index in self.set_indexes & set(maps):
+            maps[index] = {k: {self._member(m) for m in members}
+                           for k, members in maps[index].items()}
+        self.entries = 0
+        if self.rotated_path.exists():
+            # Compaction interrompue : le journal tourné précède le journal courant
+            with open(self.rotated_path, 'rb') as f:
+                for line in f:
+                    try:
+                        op, index, key, value = json.loads(line)
+                    except (ValueError, TypeError):
+                        break
+                    self._apply(maps, op, index, key, value)
+                    self.entries += 1
+        if self.journal_path.exists():
+            valid_bytes = 0
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        op, index, key, value = json.loads(line)
+                    except (ValueError, TypeError):
+                        logger.warning("Journal d'index : entrée incomplète ignorée")
+                        break
+                    self._apply(maps, op, index, key, value)
+                    self.entries += 1
+                    valid_bytes += len(line)
+            # Couper la fin tronquée pour que les ajouts suivants restent lisibles
+            if valid_bytes < self.journal_path.stat().st_size:
+                os.truncate(self.journal_path, valid_bytes)
+        return maps
+    
+    @staticmethod
+    def _member(value: Any) -> Any:
+        """Les membres composés (listes JSON) redeviennent des tuples hachables."""
+        return tuple(value) if isinstance(value, list) else value
+    
+    def _apply(self, maps: Dict[str, Dict[str, Any]], op: str, index: str, key: str, value: Any):
+        if op == "set":
+            maps.setdefault(index, {})[key] = value
+        elif op == "del":
+            maps.get(index, {}).pop(key, None)
+        elif op == "add":
+            maps.setdefault(index, {}).setdefault(key, set()).add(self._member(value))
+        elif op == "rem":
+            members = maps.get(index, {}).get(key)
+            if members is not None:
+                members.discard(self._member(value))
+                if not members:
+                    del maps[index][key]
+    
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.journal_path, 'a', encoding='utf-8')
+        return self._file
+    
+    def record(self, op: str, index: str, key: str, value: Any = None):
+        """Ajoute une mutation au journal ("set"/"del", ou "add"/"rem" pour un index ensembliste)."""
+        line = json.dumps([op, index, key, value], ensure_ascii=False) + "\n"
+        with self._lock:
+            f = self._open()
+            f.write(line)
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            self.entries += 1
+    
+    def rotate(self):
+        """
+        Met de côté le journal courant (index.journal.1) ; les mutations
+        suivantes repartent dans un journal vide. À appeler au moment où
+        l'on copie les index qui seront écrits par write_snapshot().
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            if self.journal_path.exists():
+                if self.rotated_path.exists():
+                    # Compaction précédente inachevée : concaténer
+                    with open(self.rotated_path, 'ab') as dst, open(self.journal_path, 'rb') as src:
+                        dst.write(src.read())
+                    self.journal_path.unlink()
+                else:
+                    os.replace(self.journal_path, self.rotated_path)
+            self.entries = 0
+    
+    def write_snapshot(self, maps: Dict[str, Dict[str, Any]]):
+        """Écrit l'instantané de façon atomique puis supprime le journal tourné."""
+        tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        with gzip.open(tmp_path, 'wt') as f:
+            json.dump(maps, f, default=list)
+        with open(tmp_path, 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        self.rotated_path.unlink(missing_ok=True)
+    
+    def compact(self, maps: Dict[str, Dict[str, Any]]):
+        """Réécrit l'instantané de façon atomique et vide le journal."""
+        self.rotate()
+        self.write_snapshot(maps)
+    
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+# ============================================================
+# ARCHIVES (NIVEAU FROID)
+# ============================================================
+
+class ArchiveStore:
+    """
+    Niveau froid des concepts oubliés : segments append-only
+    (segment_000001.log, …) d'enregistrements préfixés par leur longueur
+    (zlib du JSON de to_record), index en mémoire identifiant → position et
+    nom/alias → identifiant. L'index est écrit dans archive_index.json par
+    maintain() et close() ; au démarrage, la fin des segments écrite depuis
+    est relue (une fin tronquée est coupée). Un concept rappelé ou archivé de
+    nouveau laisse un enregistrement mort : maintain() réécrit les segments
+    scellés dont la part morte dépasse archive_compact_ratio, puis supprime
+    les plus anciens au-delà de archive_max_bytes. Les anciennes archives
+    ({id}_{horodatage}.json.gz) sont importées à l'ouverture.
+    """
+    
+    _FRAME = struct.Struct("<I")
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.path / "archive_index.json"
+        self._lock = threading.RLock()
+        self.entries: Dict[str, List[Any]] = {}  # id → [segment, position, longueur, archivé le, clés]
+        self.names: Dict[str, str] = {}  # nom ou alias en minuscules → id
+        self.segments: Dict[int, int] = {}  # numéro → octets écrits
+        self.live_bytes: Dict[int, int] = defaultdict(int)
+        self._fds: Dict[int, int] = {}
+        self.stats = {"archived": 0, "recalled": 0, "compactions": 0, "dropped": 0, "migrated": 0}
+        self._load()
+        self._migrate_legacy()
+    
+    def _segment_path(self, segment: int) -> Path:
+        return self.path / f"segment_{segment:06d}.log"
+    
+    def _fd(self, segment: int) -> int:
+        fd = self._fds.get(segment)
+        if fd is None:
+            fd = self._fds[segment] = os.open(self._segment_path(segment), os.O_RDONLY)
+        return fd
+    
+    # ------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------
+    
+    def _load(self):
+        try:
+            with open(self.index_path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        indexed = {int(n): size for n, size in data.get("segments", {}).items()}
+        on_disk = {int(p.stem.split("_")[1]): p.stat().st_size
+                   for p in self.path.glob("segment_*.log")}
+        for cid, entry in data.get("entries", {}).items():
+            if on_disk.get(entry[0], 0) >= entry[1] + entry[2]:
+                self._index(cid, *entry)
+        for segment, size in sorted(on_disk.items()):
+            self.segments[segment] = min(indexed.get(segment, 0), size)
+            if size > self.segments[segment]:
+                self._scan(segment, self.segments[segment], size)
+    
+    def _scan(self, segment: int, start: int, size: int):
+        """Indexe les enregistrements d'un segment écrits après `start`."""
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(start)
+            data = f.read(size - start)
+        position = 0
+        while position + self._FRAME.size <= len(data):
+            (length,) = self._FRAME.unpack_from(data, position)
+            payload = data[position + self._FRAME.size:position + self._FRAME.size + length]
+            try:
+                record = json.loads(zlib.decompress(payload))
+            except (zlib.error, ValueError):
+                break
+            self._index(record["id"], segment, start + position + self._FRAME.size, length,
+                        record.get("archived_at", 0.0), self._keys(record))
+            position += self._FRAME.size + length
+        if start + position < size:
+            logger.warning(f"Archives : fin tronquée de {self._segment_path(segment).name} coupée")
+            os.truncate(self._segment_path(segment), start + position)
+        self.segments[segment] = start + position
+    
+    @staticmethod
+    def _keys(record: Dict[str, Any]) -> List[str]:
+        return [record["nom"].lower(), *(alias.lower() for alias in record.get("aliases", ()))]
+    
+    def _index(self, cid: str, segment: int, position: int, length: int,
+               archived_at: float, keys: List[str]):
+        if cid in self.entries:
+            self._unindex(cid)
+        self.entries[cid] = [segment, position, length, archived_at, keys]
+        self.live_bytes[segment] += self._FRAME.size + length
+        for key in keys:
+            self.names[key] = cid
+    
+    def _unindex(self, cid: str) -> Optional[List[Any]]:
+        entry = self.entries.pop(cid, None)
+        if entry is not None:
+            self.live_bytes[entry[0]] -= self._FRAME.size + entry[2]
+            for key in entry[4]:
+                if self.names.get(key) == cid:
+                    del self.names[key]
+        return entry
+    
+    def save_index(self):
+        with self._lock:
+            data = {"segments": self.segments, "entries": self.entries}
+            tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+    
+    # ------------------------------------------------------------
+    # Écriture et lecture
+    # ------------------------------------------------------------
+    
+    def _append(self, frames: List[bytes]) -> List[Tuple[int, int]]:
+        """Ajoute des enregistrements encadrés ; retourne (segment, position) de chacun."""
+        positions = []
+        limit = CONFIG["archive_segment_bytes"]
+        segment = max(self.segments, default=0)
+        chunk: List[bytes] = []
+        
+        def write():
+            with open(self._segment_path(segment), 'ab') as f:
+                f.write(b"".join(chunk))
+            chunk.clear()
+        
+        if not self.segments:
+            segment = 1
+            self.segments[segment] = 0
+        for frame in frames:
+            if chunk or self.segments[segment]:
+                if self.segments[segment] + len(frame) > limit:
+                    if chunk:
+                        write()
+                    segment += 1
+                    self.segments[segment] = 0
+            positions.append((segment, self.segments[segment] + self._FRAME.size))
+            self.segments[segment] += len(frame)
+            chunk.append(frame)
+        if chunk:
+            write()
+        return positions
+    
+    def put_many(self, concepts: List[Concept], archived_at: Optional[float] = None):
+        """Archive des concepts (hors de la RAM et du disque) en un seul ajout."""
+        if not concepts:
+            return
+        archived_at = time.time() if archived_at is None else archived_at
+        frames, metas = [], []
+        for concept in concepts:
+            record = concept.to_record()
+            record["archived_at"] = archived_at
+            payload = zlib.compress(json.dumps(record, ensure_ascii=False).encode())
+            frames.append(self._FRAME.pack(len(payload)) + payload)
+            metas.append((concept.id, len(payload), self._keys(record)))
+        with self._lock:
+            for (segment, position), (cid, length, keys) in zip(self._append(frames), metas):
+                self._index(cid, segment, position, length, archived_at, keys)
+            self.stats["archived"] += len(concepts)
+    
+    def lookup(self, identifiant: str) -> Optional[str]:
+        """Identifiant archivé correspondant à un ID, nom ou alias (sans verrou ni E/S)."""
+        if identifiant in self.entries:
+            return identifiant
+        return self.names.get(identifiant.lower())
+    
+    def read(self, cid: str) -> Optional[Concept]:
+        """Relit un concept archivé (une lecture positionnelle), sans le retirer."""
+        with self._lock:
+            entry = self.entries.get(cid)
+            if entry is None:
+                return None
+            payload = os.pread(self._fd(entry[0]), entry[2], entry[1])
+        record = json.loads(zlib.decompress(payload))
+        record.pop("archived_at", None)
+        return Concept.from_record(record)
+    
+    def claim(self, cid: str) -> bool:
+        """Retire un concept des archives (rappelé) ; False s'il n'y est plus."""
+        with self._lock:
+            if self._unindex(cid) is None:
+                return False
+            self.stats["recalled"] += 1
+            return True
+    
+    # ------------------------------------------------------------
+    # Compaction et rétention
+    # ------------------------------------------------------------
+    
+    def _drop_segment(self, segment: int):
+        fd = self._fds.pop(segment, None)
+        if fd is not None:
+            os.close(fd)
+        self._segment_path(segment).unlink(missing_ok=True)
+        del self.segments[segment]
+        self.live_bytes.pop(segment, None)
+    
+    def maintain(self) -> Dict[str, int]:
+        """Réécrit les segments scellés majoritairement morts, applique la rétention, écrit l'index."""
+        compacted = dropped = 0
+        with self._lock:
+            active = max(self.segments, default=0)
+            for segment in sorted(self.segments):
+                size = self.segments[segment]
+                if segment == active or not size:
+                    continue
+                if self.live_bytes[segment] > size * (1 - CONFIG["archive_compact_ratio"]):
+                    continue
+                live = sorted((entry[1], cid) for cid, entry in self.entries.items()
+                              if entry[0] == segment)
+                frames = []
+                for position, cid in live:
+                    entry = self.entries[cid]
+                    frames.append(os.pread(self._fd(segment), self._FRAME.size + entry[2],
+                                           position - self._FRAME.size))
+                for (new_segment, new_position), (_, cid) in zip(self._append(frames), live):
+                    entry = self.entries[cid]
+                    self.live_bytes[segment] -= self._FRAME.size + entry[2]
+                    self.live_bytes[new_segment] += self._FRAME.size + entry[2]
+                    entry[0], entry[1] = new_segment, new_position
+                self._drop_segment(segment)
+                compacted += 1
+            
+            total = sum(self.segments.values())
+            while total > CONFIG["archive_max_bytes"] and len(self.segments) > 1:
+                oldest = min(self.segments)
+                for cid in [cid for cid, entry in self.entries.items() if entry[0] == oldest]:
+                    self._unindex(cid)
+                    dropped += 1
+                total -= self.segments[oldest]
+                self._drop_segment(oldest)
+            self.stats["compactions"] += compacted
+            self.stats["dropped"] += dropped
+            self.save_index()
+        return {"compacted_segments": compacted, "dropped": dropped}
+    
+    def _migrate_legacy(self):
+        """Importe les archives un-fichier-par-concept, de la plus ancienne à la plus récente."""
+        legacy = []
+        for filepath in self.path.glob("*.json.gz"):
+            try:
+                archived_at = float(filepath.name[:-len(".json.gz")].rsplit("_", 1)[1])
+            except (IndexError, ValueError):
+                archived_at = filepath.stat().st_mtime
+            legacy.append((archived_at, filepath))
+        if not legacy:
+            return
+        for archived_at, filepath in sorted(legacy):
+            with gzip.open(filepath, 'rt') as f:
+                self.put_many([Concept.from_record(json.load(f))], archived_at=archived_at)
+        self.save_index()
+        for _, filepath in legacy:
+            filepath.unlink()
+        self.stats["migrated"] += len(legacy)
+        logger.info(f"Archives : {len(legacy)} fichiers importés en segments")
+    
+    def freeze(self, stack: ExitStack) -> Tuple[Dict[int, int], Dict[int, Any], str]:
+        """
+        Image des archives pour un instantané : taille de chaque segment,
+        segments ouverts (une compaction ou une rétention ultérieure ne les
+        touche plus, les fichiers sont fermés avec `stack`) et index sérialisé.
+        """
+        with self._lock:
+            segments = dict(self.segments)
+            files = {segment: stack.enter_context(open(self._segment_path(segment), 'rb'))
+                     for segment, size in segments.items() if size}
+            index = json.dumps({"segments": segments, "entries": self.entries}, ensure_ascii=False)
+        return segments, files, index
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = sum(self.segments.values())
+            live = sum(self.live_bytes.values())
+            return {**self.stats, "entries": len(self.entries), "segments": len(self.segments),
+                    "bytes": total, "live_bytes": live,
+                    "dead_ratio": round(1 - live / total, 4) if total else 0.0}
+    
+    def close(self):
+        with self._lock:
+            self.save_index()
+            for fd in self._fds.values():
+                os.close(fd)
+            self._fds.clear()
+
+# ============================================================
+# INSTANTANÉS DU GRAPHE
+# ============================================================
+
+SNAPSHOT_FORMAT = 1
+SNAPSHOT_MANIFEST = "manifest.json"
+
+def _write_json_atomic(path: Path, data: Any):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def _copy_range(src, dst_path: Path, start: int, end: int, chunk_size: int = 1 << 20):
+    """Copie les octets [start, end) du fichier ouvert `src` dans `dst_path`."""
+    with open(dst_path, 'wb') as dst:
+        position = start
+        while position < end:
+            data = os.pread(src.fileno(), min(chunk_size, end - position), position)
+            if not data:
+                break
+            dst.write(data)
+            position += len(data)
+
+def read_snapshot_manifest(path: Path) -> Dict[str, Any]:
+    """Manifeste d'un instantané ou d'un export ; ValueError s'il manque (copie inachevée) ou n'est pas lisible."""
+    try:
+        with open(Path(path) / SNAPSHOT_MANIFEST) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError) as e:
+        raise ValueError(f"Instantané invalide ou incomplet : {path}") from e
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"Format d'instantané non pris en charge : {manifest.get('format')}")
+    return manifest
+
+# ============================================================
+# FILTRE DE RECHERCHE NÉGATIVE
+# ============================================================
+
+class BloomFilter:
+    """
+    Filtre de Bloom sur des clés texte : « absent » est certain, « présent »
+    est probable (faux positifs au taux visé tant que `count <= capacity`).
+    Les positions dérivent d'un BLAKE2b de 64 bits (double hachage sur ses
+    deux moitiés), stable d'un processus à l'autre : le filtre peut être
+    repris tel quel depuis l'instantané de démarrage.
+    """
+    
+    def __init__(self, capacity: int, fp_rate: float = 0.01):
+        self.capacity = max(1, capacity)
+        self.fp_rate = fp_rate
+        self.size = max(8, int(-self.capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    @staticmethod
+    def _digest(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'little')
+    
+    def _positions(self, key: str):
+        h = self._digest(key)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+    
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+    
+    def add_many(self, keys: Iterable[str]):
+        """Ajout groupé : positions calculées et bits posés en NumPy (mêmes positions que add)."""
+        digests = b"".join(hashlib.blake2b(key.encode(), digest_size=8).digest() for key in keys)
+        if not digests:
+            return
+        halves = np.frombuffer(digests, dtype='<u4').reshape(-1, 2).astype(np.uint64)
+        h1, h2 = halves[:, 0], halves[:, 1] | 1
+        marks = np.zeros(len(self.bits) * 8, dtype=bool)
+        for i in range(self.hashes):
+            marks[(h1 + np.uint64(i) * h2) % np.uint64(self.size)] = True
+        bits = np.frombuffer(self.bits, dtype=np.uint8)
+        np.bitwise_or(bits, np.packbits(marks, bitorder='little'), out=bits)
+        self.count += len(halves)
+    
+    def state(self) -> Dict[str, Any]:
+        """Paramètres du filtre, à conserver avec ses bits."""
+        return {"capacity": self.capacity, "fp_rate": self.fp_rate, "size": self.size,
+                "hashes": self.hashes, "count": self.count}
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], bits: bytes) -> 'BloomFilter':
+        bloom = cls.__new__(cls)
+        bloom.capacity, bloom.fp_rate = state["capacity"], state["fp_rate"]
+        bloom.size, bloom.hashes, bloom.count = state["size"], state["hashes"], state["count"]
+        bloom.bits = bytearray(bits)
+        return bloom
+    
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        for pos in self._positions(key):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+    
+    @property
+    def saturated(self) -> bool:
+        return self.count > self.capacity
+
+# ============================================================
+# INDEX DE SIMILARITÉ DES SIGNATURES
+# ============================================================
+
+def decode_signature(signature: Union[str, Sequence[float], np.ndarray]) -> Optional[np.ndarray]:
+    """
+    Vecteur float32 normé d'une signature : texte base64 de float32
+    petit-boutistes, ou vecteur déjà numérique. None si la signature n'est pas
+    un plongement (base64 invalide, trop court, nul ou non fini).
+    """
+    if isinstance(signature, str):
+        try:
+            raw = base64.b64decode(signature, validate=True)
+        except (binascii.Error, ValueError):
+            return None
+        if len(raw) % 4:
+            return None
+        vector = np.frombuffer(raw, dtype='<f4').astype(np.float32)
+    else:
+        vector = np.asarray(signature, dtype=np.float32).ravel()
+    if vector.size < CONFIG["signature_min_dim"] or not np.isfinite(vector).all():
+        return None
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else None
+
+def encode_signature(vector: Union[Sequence[float], np.ndarray]) -> str:
+    """Texte base64 d'un plongement (float32 petit-boutistes), tel que l'attend add_signature_*."""
+    return base64.b64encode(np.asarray(vector, dtype='<f4').tobytes()).decode('ascii')
+
+class SignatureIndex:
+    """
+    Recherche des plus proches voisins (similarité cosinus) parmi les
+    signatures d'une modalité (voix ou visage), vecteurs normés en float32.
+    
+    Sous signature_ivf_min_size vecteurs, la recherche est exacte (un produit
+    matrice-vecteur). Au-delà, index IVF : centroïdes appris par k-moyennes
+    sphériques sur un échantillon, une liste inversée de lignes par
+    centroïde ; seules les signature_ivf_nprobe listes les plus proches de la
+    requête sont parcourues. Une nouvelle ligne rejoint la liste de son
+    centroïde le plus proche ; l'apprentissage est refait (à la recherche
+    suivante) quand le nombre de lignes a doublé depuis le précédent.
+    
+    Chaque ligne garde l'empreinte BLAKE2b de sa signature texte : l'index
+    persisté est réconcilié avec l'index exact du graphe au chargement.
+    """
+    
+    def __init__(self, dim: int = 0):
+        self.dim = dim
+        self.n = 0
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self.digests = np.zeros(0, dtype=np.uint64)
+        self.owners: List[str] = []               # ligne → concept_id
+        self.rows: Dict[int, int] = {}            # empreinte → ligne
+        self.centroids: Optional[np.ndarray] = None
+        self.assign = np.zeros(0, dtype=np.int32)  # ligne → liste (-1 : pas encore apprise)
+        self.lists: List[array] = []
+        self.trained_on = 0
+        self.searches = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._train_lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return self.n
+    
+    def add(self, key: str, owner: str, vector: Optional[np.ndarray] = None) -> bool:
+        """
+        Indexe la signature `key` (vecteur décodé depuis `key` si absent) pour
+        `owner`. Une signature déjà indexée change seulement de propriétaire.
+        Faux si elle n'est pas un plongement ou n'a pas la dimension de l'index.
+        """
+        digest = BloomFilter._digest(key)
+        with self._lock:
+            row = self.rows.get(digest)
+            if row is not None:
+                self.owners[row] = owner
+                return True
+        if vector is None:
+            vector = decode_signature(key)
+        with self._lock:
+            if vector is None or (self.dim and vector.size != self.dim):
+                self.rejected += 1
+                return False
+            if digest in self.rows:
+                self.owners[self.rows[digest]] = owner
+                return True
+            self._append(vector[None, :], np.array([digest], dtype=np.uint64), [owner])
+        return True
+    
+    def _append(self, vectors: np.ndarray, digests: np.ndarray, owners: List[str]):
+        """Ajoute des lignes, rangées dans la liste de leur centroïde le plus proche (sous le verrou)."""
+        if not self.dim:
+            self.dim = vectors.shape[1]
+            self.vectors = np.zeros((0, self.dim), dtype=np.float32)
+        start, end = self.n, self.n + len(vectors)
+        if end > len(self.vectors):
+            capacity = max(end, 2 * len(self.vectors), 64)
+            grown = np.zeros((capacity, self.dim), dtype=np.float32)
+            grown[:start] = self.vectors[:start]
+            self.vectors = grown  # les recherches en cours gardent l'ancien tableau, inchangé
+            self.digests = np.resize(self.digests, capacity)
+            self.assign = np.resize(self.assign, capacity)
+        self.vectors[start:end] = vectors
+        self.digests[start:end] = digests
+        if self.centroids is not None:
+            lists = self._nearest_lists(vectors, self.centroids)
+            for row, lst in zip(range(start, end), lists.tolist()):
+                self.lists[lst].append(row)
+            self.assign[start:end] = lists
+        else:
+            self.assign[start:end] = -1
+        for row, digest in zip(range(start, end), digests.tolist()):
+            self.rows[digest] = row
+        self.owners.extend(owners)
+        self.n = end
+    
+    @staticmethod
+    def _nearest_lists(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        out = np.empty(len(vectors), dtype=np.int32)
+        for i in range(0, len(vectors), 16384):
+            out[i:i + 16384] = np.argmax(vectors[i:i + 16384] @ centroids.T, axis=1)
+        return out
+    
+    @staticmethod
+    def _build_lists(labels: np.ndarray, nlist: int) -> List[array]:
+        order = np.argsort(labels, kind='stable').astype(np.int32)
+        bounds = np.searchsorted(labels[order], np.arange(nlist + 1))
+        return [array('i', order[bounds[c]:bounds[c + 1]].tobytes()) for c in range(nlist)]
+    
+    @property
+    def needs_training(self) -> bool:
+        return self.n >= CONFIG["signature_ivf_min_size"] and self.n >= 2 * self.trained_on
+    
+    def train(self):
+        """
+        Apprend les centroïdes (k-moyennes sphériques, √n listes) sur un
+        échantillon, hors du verrou : les ajouts et recherches continuent sur
+        l'ancien découpage, les lignes ajoutées entre-temps sont rangées à
+        l'installation.
+        """
+        with self._train_lock:
+            with self._lock:
+                n, data = self.n, self.vectors
+            if n < CONFIG["signature_ivf_min_size"]:
+                return
+            nlist = max(1, int(math.sqrt(n)))
+            rng = np.random.default_rng(0)
+            sample = data[np.sort(rng.choice(n, min(n, 64 * nlist), replace=False))]
+            centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+            for _ in range(CONFIG["signature_ivf_train_iterations"]):
+                labels = np.argmax(sample @ centroids.T, axis=1)
+                order = np.argsort(labels, kind='stable')
+                members, starts = np.unique(labels[order], return_index=True)
+                centroids[members] = np.add.reduceat(sample[order], starts, axis=0)
+                centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+            labels = self._nearest_lists(data[:n], centroids)
+            lists = self._build_lists(labels, nlist)
+            with self._lock:
+                self.centroids, self.lists, self.trained_on = centroids, lists, n
+                self.assign[:n] = labels
+                late = range(n, self.n)
+                if late:
+                    placed = self._nearest_lists(self.vectors[n:self.n], centroids)
+                    for row, lst in zip(late, placed.tolist()):
+                        lists[lst].append(row)
+                    self.assign[n:self.n] = placed
+    
+    def search(self, query: Union[str, Sequence[float], np.ndarray], k: int = 1,
+               threshold: float = -1.0) -> List[Tuple[str, float]]:
+        """
+        Les `k` propriétaires les plus proches de `query` (une seule entrée par
+        propriétaire, sa meilleure signature), similarité décroissante, au
+        moins `threshold`.
+        """
+        vector = decode_signature(query)
+        if vector is None or vector.size != self.dim or not self.n:
+            return []
+        if self.needs_training:
+            self.train()
+        with self._lock:
+            self.searches += 1
+            n, vectors, owners = self.n, self.vectors, self.owners
+            candidates = None
+            if self.centroids is not None:
+                nprobe = min(CONFIG["signature_ivf_nprobe"], len(self.centroids))
+                probe = np.argpartition(-(self.centroids @ vector), nprobe - 1)[:nprobe]
+                candidates = np.concatenate([np.frombuffer(self.lists[c], dtype=np.int32)
+                                             for c in probe.tolist()])
+        if candidates is None:
+            scores = vectors[:n] @ vector
+        else:
+            scores = vectors[candidates] @ vector
+        depth = min(len(scores), 4 * k)
+        if not depth:
+            return []
+        best = np.argpartition(-scores, depth - 1)[:depth]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        rows = best if candidates is None else candidates[best]
+        found: Dict[str, float] = {}
+        for row, score in zip(rows.tolist(), scores[best].tolist()):
+            if score < threshold or len(found) >= k:
+                break
+            found.setdefault(owners[row], score)
+        return list(found.items())
+    
+    def reconcile(self, mapping: Dict[str, str]):
+        """
+        Aligne l'index sur `mapping` (signature → concept_id, index exact du
+        graphe) : lignes sans signature correspondante retirées, propriétaires
+        mis à jour, signatures manquantes décodées et ajoutées.
+        """
+        wanted = {BloomFilter._digest(key): (key, owner) for key, owner in mapping.items()}
+        with self._lock:
+            keep = np.fromiter((d in wanted for d in self.digests[:self.n].tolist()),
+                               dtype=bool, count=self.n)
+            if not keep.all():
+                self._compact(keep)
+            for digest, row in self.rows.items():
+                self.owners[row] = wanted[digest][1]
+            missing = [(digest, key, owner) for digest, (key, owner) in wanted.items()
+                       if digest not in self.rows]
+        decoded = [(digest, decode_signature(key), owner) for digest, key, owner in missing]
+        with self._lock:
+            dim = self.dim or next((v.size for _, v, _ in decoded if v is not None), 0)
+            added = [(digest, vector, owner) for digest, vector, owner in decoded
+                     if vector is not None and vector.size == dim and digest not in self.rows]
+            self.rejected += len(decoded) - len(added)
+            if added:
+                self._append(np.stack([vector for _, vector, _ in added]),
+                             np.array([digest for digest, _, _ in added], dtype=np.uint64),
+                             [owner for _, _, owner in added])
+    
+    def _compact(self, keep: np.ndarray):
+        rows = np.flatnonzero(keep)
+        self.vectors = self.vectors[rows]
+        self.digests = self.digests[rows]
+        self.owners = [self.owners[row] for row in rows.tolist()]
+        self.n = len(rows)
+        self.rows = {digest: row for row, digest in enumerate(self.digests.tolist())}
+        self.assign = self.assign[rows]
+        if self.centroids is not None:
+            self.lists = self._build_lists(self.assign[:self.n], len(self.centroids))
+    
+    def state(self) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+        """Paramètres et propriétaires, plus les colonnes en blocs binaires bruts."""
+        with self._lock:
+            n = self.n
+            state = {"dim": self.dim, "n": n, "trained_on": self.trained_on,
+                     "lists": len(self.centroids) if self.centroids is not None else 0,
+                     "owners": self.owners[:n]}
+            blobs = {"vectors": self.vectors[:n].tobytes(), "digests": self.digests[:n].tobytes(),
+                     "assign": self.assign[:n].tobytes()}
+            if self.centroids is not None:
+                blobs["centroids"] = self.centroids.tobytes()
+        return state, blobs
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any], blobs: Dict[str, bytes]) -> 'SignatureIndex':
+        index = cls(state["dim"])
+        n, dim = state["n"], state["dim"]
+        index.n, index.trained_on = n, state["trained_on"]
+        index.vectors = np.frombuffer(blobs["vectors"], dtype=np.float32).reshape(n, dim).copy()
+        index.digests = np.frombuffer(blobs["digests"], dtype=np.uint64).copy()
+        index.assign = np.frombuffer(blobs["assign"], dtype=np.int32).copy()
+        index.owners = list(state["owners"])
+        index.rows = {digest: row for row, digest in enumerate(index.digests.tolist())}
+        if state["lists"]:
+            index.centroids = np.frombuffer(blobs["centroids"], dtype=np.float32).reshape(-1, dim).copy()
+            index.lists = cls._build_lists(index.assign, len(index.centroids))
+        return index
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {"signatures": self.n, "dim": self.dim,
+                "lists": len(self.centroids) if self.centroids is not None else 0,
+                "trained_on": self.trained_on, "searches": self.searches, "rejected": self.rejected}
+
+# ============================================================
+# TEMPÉRATURES (TABLE VECTORISÉE)
+# ============================================================
+
+class RelationWeightTable:
+    """
+    Poids des relations des concepts en RAM, en colonnes NumPy : un bloc
+    contigu de lignes par concept suivi, dans l'ordre de ses relations et
+    repéré par l'emplacement du concept dans la TemperatureTable. L'oubli
+    (exponentiel, demi-vie par type de mémoire) et le renforcement par usage
+    sont chacun une opération vectorisée sur toutes les lignes. Comme pour
+    les températures, la table fait foi tant que le concept est en RAM ;
+    Concept._rel_poids est réécrit à sa sortie et avant chaque sérialisation.
+    """
+    PROTECTED_SOURCE = 0.7  # au-delà, relation ni oubliée ni retirée (règle de consolidate)
+    
+    def __init__(self, capacity: int = 4096):
+        self.poids = np.ones(capacity, dtype=np.float32)
+        self.rate = np.zeros(capacity, dtype=np.float32)    # oubli par heure (exponentiel)
+        self.uses = np.zeros(capacity, dtype=np.uint32)     # usages depuis le dernier renforcement
+        self.protected = np.zeros(capacity, dtype=bool)
+        self.owner = np.full(capacity, -1, dtype=np.int64)  # emplacement du concept ; -1 : ligne libre
+        self.blocks: Dict[int, Tuple[int, int]] = {}        # emplacement → (première ligne, nombre)
+        self._top = 0
+        self._live = 0
+    
+    _FILL = {"poids": 1.0, "rate": 0.0, "uses": 0, "protected": False, "owner": -1}
+    
+    @staticmethod
+    def decay_rate(memoire_type: MemoryType) -> float:
+        """Constante d'oubli horaire des relations d'un type de mémoire (ln 2 / demi-vie)."""
+        half_life = CONFIG["relation_half_life_h"].get(memoire_type.value)
+        return math.log(2) / half_life if half_life else 0.0
+    
+    def _reserve(self, n: int):
+        if self._top + n <= len(self.poids):
+            return
+        if self._live + n <= len(self.poids) // 2:
+            self._compact()
+            return
+        capacity = max(len(self.poids) * 2, self._live + n)
+        self._compact()
+        for name, fill in self._FILL.items():
+            old = getattr(self, name)
+            new = np.full(capacity, fill, dtype=old.dtype)
+            new[:self._top] = old[:self._top]
+            setattr(self, name, new)
+    
+    def _compact(self):
+        """Resserre les blocs vivants en tête des colonnes (ordre conservé)."""
+        n = self._top
+        keep = self.owner[:n] >= 0
+        if keep.all():
+            return
+        new_start = np.cumsum(keep) - 1
+        for name, fill in self._FILL.items():
+            column = getattr(self, name)
+            column[:self._live] = column[:n][keep]
+            column[self._live:n] = fill
+        self.blocks = {slot: (int(new_start[start]), count)
+                       for slot, (start, count) in self.blocks.items()}
+        self._top = self._live
+    
+    def place(self, slot: int, concept: Concept, rate: float):
+        """(Re)charge les relations de `concept` ; les usages en cours sont gardés si elles ont seulement été ajoutées."""
+        n = len(concept._rel_sources)
+        uses = None
+        previous = self.blocks.get(slot)
+        if previous is not None:
+            start, count = previous
+            if count <= n:
+                uses = self.uses[start:start + count].copy()
+            self.release(slot)
+        if not n:
+            return
+        self._reserve(n)
+        start, end = self._top, self._top + n
+        if concept._rel_poids is not None:
+            self.poids[start:end] = np.frombuffer(concept._rel_poids, dtype=np.float32)
+        else:
+            self.poids[start:end] = 1.0
+        protected = np.fromiter((s.type.value > self.PROTECTED_SOURCE for s in concept._rel_sources),
+                                dtype=bool, count=n)
+        self.protected[start:end] = protected
+        self.rate[start:end] = np.where(protected, 0.0, rate)
+        self.uses[start:end] = 0
+        if uses is not None:
+            self.uses[start:start + len(uses)] = uses
+        self.owner[start:end] = slot
+        self.blocks[slot] = (start, n)
+        self._top = end
+        self._live += n
+    
+    def set_rate(self, slot: int, rate: float):
+        block = self.blocks.get(slot)
+        if block is not None:
+            start, n = block
+            self.rate[start:start + n] = np.where(self.protected[start:start + n], 0.0, rate)
+    
+    def release(self, slot: int):
+        block = self.blocks.pop(slot, None)
+        if block is None:
+            return
+        start, n = block
+        for name, fill in self._FILL.items():
+            getattr(self, name)[start:start + n] = fill
+        self._live -= n
+    
+    def count(self, slot: int) -> int:
+        block = self.blocks.get(slot)
+        return 0 if block is None else block[1]
+    
+    def weights(self, slot: int) -> Optional[np.ndarray]:
+        block = self.blocks.get(slot)
+        return None if block is None else self.poids[block[0]:block[0] + block[1]]
+    
+    def write_back(self, slot: int, concept: Concept) -> bool:
+        """Recopie les poids du bloc dans concept._rel_poids ; True s'ils ont changé."""
+        weights = self.weights(slot)
+        if weights is None or len(weights) != len(concept._rel_sources):
+            return False
+        current = concept._rel_poids
+        if current is None:
+            if (weights == 1.0).all():
+                return False
+        elif np.array_equal(np.frombuffer(current, dtype=np.float32), weights):
+            return False
+        concept._rel_poids = array('f', weights.tobytes())
+        return True
+    
+    def use(self, slot: int, position: int, count: int = 1):
+        block = self.blocks.get(slot)
+        if block is not None and position < block[1]:
+            self.uses[block[0] + position] += count
+    
+    def decay(self, heures: float):
+        """Oubli exponentiel de toutes les relations en une opération."""
+        n = self._top
+        if n and heures > 0:
+            self.poids[:n] *= np.exp(-self.rate[:n] * np.float32(heures))
+    
+    def reinforce(self) -> int:
+        """
+        Renforcement par usage : chaque usage regagne relation_reinforcement
+        de l'écart à 1 ; remet les compteurs à zéro. Retourne le nombre de
+        relations renforcées.
+        """
+        rows = np.flatnonzero(self.uses[:self._top])
+        if len(rows):
+            keep = np.float32(1.0 - CONFIG["relation_reinforcement"])
+            self.poids[rows] = 1.0 - (1.0 - self.poids[rows]) * keep ** self.uses[rows].astype(np.float32)
+            self.uses[rows] = 0
+        return len(rows)
+    
+    def weak_owners(self, threshold: float) -> np.ndarray:
+        """Emplacements des concepts ayant au moins une relation non protégée de poids ≤ `threshold`."""
+        n = self._top
+        mask = (self.poids[:n] <= threshold) & ~self.protected[:n] & (self.owner[:n] >= 0)
+        return np.unique(self.owner[:n][mask])
+    
+    def keep_mask(self, slot: int, threshold: float) -> Optional[np.ndarray]:
+        """Relations du concept à garder : poids > `threshold` ou source protégée."""
+        block = self.blocks.get(slot)
+        if block is None:
+            return None
+        start, end = block[0], block[0] + block[1]
+        return (self.poids[start:end] > threshold) | self.protected[start:end]
+    
+    def get_stats(self) -> Dict[str, int]:
+        return {"relations": self._live, "rows": self._top, "capacity": len(self.poids)}
+
+class TemperatureTable:
+    """
+    Températures des concepts en RAM dans des tableaux NumPy contigus :
+    le refroidissement horaire est une seule opération vectorisée (courbe
+    linéaire ou exponentielle selon cooling_curves), de même que le
+    réchauffement par les accès comptés depuis le passage précédent. Les
+    poids des relations de ces concepts sont suivis dans `relations`.
+    La table fait foi tant que le concept est en RAM ; Concept.temperature
+    et les poids sont resynchronisés à sa sortie de RAM et avant chaque
+    sérialisation.
+    """
+    
+    def __init__(self, capacity: int = 1024):
+        self.temp = np.zeros(capacity, dtype=np.float64)
+        self.rate = np.zeros(capacity, dtype=np.float64)  # baisse par heure
+        self.used = np.zeros(capacity, dtype=bool)
+        self.expo = np.zeros(capacity, dtype=bool)        # courbe exponentielle
+        self.hits = np.zeros(capacity, dtype=np.uint32)   # accès depuis le dernier réchauffement
+        self.ids: List[Optional[str]] = [None] * capacity
+        self.slots: Dict[str, int] = {}
+        self.relations = RelationWeightTable()
+        self._free: List[int] = []
+        self._top = 0
+    
+    @staticmethod
+    def decay_rate(concept: Concept) -> float:
+        """Baisse horaire selon le type de mémoire (Concept.cool_down suit les mêmes règles)."""
+        if concept.memoire_type == MemoryType.LITTERAIRE_ROMAN:
+            return CONFIG["cooling_rate_litteraire"]
+        if concept.memoire_type == MemoryType.EPISODIQUE:
+            return CONFIG["cooling_rate_episodique"] * (1 - concept.importance)
+        if concept.memoire_type == MemoryType.SOCIAL:
+            return CONFIG["cooling_rate_social"] * (1 - min(1.0, concept.poids / 10))
+        if concept.memoire_type == MemoryType.NARRATIVE:
+            return CONFIG["cooling_rate_episodique"] * 0.5
+        return 0.0
+    
+    @staticmethod
+    def exponential(memoire_type: MemoryType) -> bool:
+        """Vrai si ce type de mémoire refroidit en exponentielle (pente = constante horaire)."""
+        return CONFIG["cooling_curves"].get(memoire_type.value, "linear") == "exponential"
+    
+    def _grow(self):
+        capacity = len(self.temp) * 2
+        for name in ("temp", "rate", "used", "expo", "hits"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+        self.ids.extend([None] * (capacity - len(self.ids)))
+    
+    def attach(self, concept: Concept):
+        """
+        Suit un concept entrant en RAM ; s'il est déjà suivi, met à jour ses
+        pentes et recharge ses relations si leur nombre a changé (appeler
+        sync() avant de les modifier pour ne pas perdre l'oubli en cours).
+        """
+        slot = self.slots.get(concept.id)
+        rel_rate = RelationWeightTable.decay_rate(concept.memoire_type)
+        if slot is None:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                if self._top == len(self.temp):
+                    self._grow()
+                slot = self._top
+                self._top += 1
+            self.slots[concept.id] = slot
+            self.ids[slot] = concept.id
+            self.used[slot] = True
+            self.temp[slot] = concept.temperature
+            self.hits[slot] = 0
+            self.relations.place(slot, concept, rel_rate)
+        elif self.relations.count(slot) != len(concept._rel_sources):
+            self.relations.place(slot, concept, rel_rate)
+        else:
+            self.relations.set_rate(slot, rel_rate)
+        self.rate[slot] = self.decay_rate(concept)
+        self.expo[slot] = self.exponential(concept.memoire_type)
+    
+    def detach(self, concept: Concept) -> bool:
+        """Cesse de suivre un concept ; retourne True si sa température ou ses poids ont changé."""
+        slot = self.slots.pop(concept.id, None)
+        if slot is None:
+            return False
+        value = float(self.temp[slot])
+        changed = value != concept.temperature
+        concept.temperature = value
+        changed |= self.relations.write_back(slot, concept)
+        self.relations.release(slot)
+        self.used[slot] = False
+        self.rate[slot] = 0.0
+        self.hits[slot] = 0
+        self.ids[slot] = None
+        self._free.append(slot)
+        return changed
+    
+    def sync(self, concept: Concept) -> bool:
+        """Recopie température et poids dans le concept ; True s'ils ont changé."""
+        slot = self.slots.get(concept.id)
+        if slot is None:
+            return False
+        value = float(self.temp[slot])
+        changed = value != concept.temperature
+        concept.temperature = value
+        return self.relations.write_back(slot, concept) or changed
+    
+    def get(self, concept_id: str) -> Optional[float]:
+        slot = self.slots.get(concept_id)
+        return None if slot is None else float(self.temp[slot])
+    
+    def set(self, concept: Concept, value: float):
+        slot = self.slots.get(concept.id)
+        if slot is not None:
+            self.temp[slot] = value
+        concept.temperature = value
+    
+    def touch(self, concept_id: str):
+        """Compte un accès (sans verrou : un incrément peut se perdre)."""
+        slot = self.slots.get(concept_id)
+        if slot is not None:
+            self.hits[slot] += 1
+    
+    def use_relation(self, concept: Concept, position: int, count: int = 1):
+        """Compte `count` usages de la relation de rang `position` du concept."""
+        slot = self.slots.get(concept.id)
+        if slot is not None:
+            self.relations.use(slot, position, count)
+    
+    def weights(self, concept: Concept) -> Optional[np.ndarray]:
+        """Poids courants des relations d'un concept suivi (vue sur la table), sinon None."""
+        slot = self.slots.get(concept.id)
+        if slot is None:
+            return None
+        weights = self.relations.weights(slot)
+        return weights if weights is not None and len(weights) == len(concept._rel_sources) else None
+    
+    def decay(self, heures: float):
+        """Refroidit tous les concepts suivis et fait oublier leurs relations, en une opération chacun."""
+        n = self._top
+        temp = self.temp[:n]
+        step = self.rate[:n] * heures
+        expo = self.expo[:n]
+        if expo.any():
+            temp[:] = np.where(expo, temp * np.exp(-step), temp - step)
+        else:
+            temp -= step
+        np.maximum(temp, 0.0, out=temp)
+        self.relations.decay(heures)
+    
+    def reinforce(self) -> Dict[str, int]:
+        """
+        Réchauffe les concepts selon leurs accès depuis le dernier passage
+        (chaque accès regagne temperature_reinforcement de l'écart à 1) et
+        renforce les relations utilisées ; retourne le nombre de chacun.
+        """
+        n = self._top
+        slots = np.flatnonzero(self.hits[:n])
+        if len(slots):
+            keep = 1.0 - CONFIG["temperature_reinforcement"]
+            self.temp[slots] = 1.0 - (1.0 - self.temp[slots]) * keep ** self.hits[slots]
+            self.hits[slots] = 0
+        return {"concepts": len(slots), "relations": self.relations.reinforce()}
+    
+    def weak_relations(self, threshold: float) -> List[str]:
+        """Identifiants des concepts ayant une relation non protégée de poids ≤ `threshold`."""
+        return [self.ids[slot] for slot in self.relations.weak_owners(threshold)]
+    
+    def keep_mask(self, concept: Concept, threshold: float) -> Optional[np.ndarray]:
+        slot = self.slots.get(concept.id)
+        if slot is None:
+            return None
+        mask = self.relations.keep_mask(slot, threshold)
+        return mask if mask is not None and len(mask) == len(concept._rel_sources) else None
+    
+    def below(self, threshold: float, floor: Optional[float] = None) -> List[str]:
+        """Identifiants dont la température est sous `threshold` (et au moins `floor`)."""
+        n = self._top
+        mask = self.used[:n] & (self.temp[:n] < threshold)
+        if floor is not None:
+            mask &= self.temp[:n] >= floor
+        return [self.ids[i] for i in np.flatnonzero(mask)]
+
+    def coldest(self, count: int) -> List[str]:
+        """Identifiants des `count` concepts les plus froids (sélection partielle, non triée)."""
+        n = self._top
+        slots = np.flatnonzero(self.used[:n])
+        if count <= 0 or not len(slots):
+            return []
+        if count < len(slots):
+            slots = slots[np.argpartition(self.temp[slots], count - 1)[:count]]
+        return [self.ids[i] for i in slots]
+
+# ============================================================
+# LECTURE EN FLUX DES BASES DE CONNAISSANCES
+# ============================================================
+
+_JSON_SKIP = re.compile(r'[\s,]*')
+
+def iter_knowledge_base(filepath: Path, chunk_size: int = 1 << 20) -> Iterator[Dict[str, Any]]:
+    """
+    Itère sur les entrées d'une base sans la charger entièrement : tableau
+    "concepts" d'un fichier JSON décodé objet par objet, ou une entrée par
+    ligne pour un fichier .jsonl.
+    """
+    filepath = Path(filepath)
+    with open(filepath, 'r', encoding='utf-8') as f:
+        if filepath.suffix == ".jsonl":
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+            return
+        
+        # Début du tableau "concepts"
+        buf = ""
+        while True:
+            m = re.search(r'"concepts"\s*:\s*\[', buf)
+            if m:
+                buf = buf[m.end():]
+                break
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            buf = buf[-64:] + chunk
+        
+        decoder = json.JSONDecoder()
+        pos = 0
+        while True:
+            pos = _JSON_SKIP.match(buf, pos).end()
+            if pos < len(buf) and buf[pos] == "]":
+                return
+            try:
+                if pos >= len(buf):
+                    raise json.JSONDecodeError("fin du tampon", buf, pos)
+                entry, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            yield entry
+
+# ============================================================
+# MÉTRIQUES
+# ============================================================
+
+def _latency_stats(samples_s: List[float]) -> Dict[str, float]:
+    """Moyenne, médiane, p99 et max (en ms) d'une série de durées en secondes."""
+    ordered = sorted(samples_s)
+    n = len(ordered)
+    return {
+        "avg_ms": round(sum(ordered) / n * 1000, 4),
+        "p50_ms": round(ordered[n // 2] * 1000, 4),
+        "p99_ms": round(ordered[min(n - 1, int(n * 0.99))] * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4),
+    }
+
+# ============================================================
+# PARCOURS DU GRAPHE
+# ============================================================
+
+TRAVERSAL_MODES = ("bfs", "dfs", "best")
+TRAVERSAL_DIRECTIONS = ("sortant", "entrant")
+
+@dataclass(slots=True)
+class TraversalHit:
+    """Concept atteint : profondeur, score (produit des poids du chemin), relation d'arrivée."""
+    concept_id: str
+    depth: int
+    score: float
+    via: Optional[str] = None
+
+@dataclass
+class TraversalResult:
+    """
+    Résultat d'un parcours. `truncated` vaut "max_nodes" ou "budget" si le
+    parcours a été interrompu avant d'épuiser la frontière, "max_depth" si des
+    voisins non visités restaient au-delà de la profondeur maximale, None sinon.
+    """
+    start: Optional[str]
+    hits: List[TraversalHit] = field(default_factory=list)
+    parents: Dict[str, Optional[str]] = field(default_factory=dict)
+    truncated: Optional[str] = None
+    expanded: int = 0
+    disk_loads: int = 0
+    elapsed_ms: float = 0.0
+    
+    def ids(self) -> List[str]:
+        return [hit.concept_id for hit in self.hits]
+    
+    def path_to(self, concept_id: str) -> List[str]:
+        """Chemin (IDs) du départ jusqu'à `concept_id`, vide si non atteint."""
+        if concept_id not in self.parents:
+            return []
+        path = [concept_id]
+        while self.parents[path[-1]] is not None:
+            path.append(self.parents[path[-1]])
+        return path[::-1]
+
+# ============================================================
+# GRAPHE DE CONNAISSANCES (mémoire unique)
+# ============================================================
+
+class KnowledgeGraph:
+    """
+    Graphe unique de connaissances avec hiérarchie de stockage.
+    """
+    
+    def __init__(self, data_path: Path):
+        self.data_path = Path(data_path)
+        self.data_path.mkdir(parents=True, exist_ok=True)
+        
+        self.disk_path = self.data_path / "disk"
+        self.disk = open_disk_backend(CONFIG["disk_backend"], self.data_path)
+        if (CONFIG["disk_backend"] != "files" and CONFIG["disk_auto_migrate"]
+                and self.disk_path.is_dir() and any(self.disk_path.glob("*.json.gz"))):
+            logger.info("Migration de l'ancien niveau disque (un fichier par concept)...")
+            migrate_disk_backend(FileDiskBackend(self.disk_path), self.disk, delete_source=True)
+        
+        # Archives (concepts oubliés), rappelées par get() sur un fil dédié
+        self.archive_path = CONFIG["archive_dir"]
+        self.archive = ArchiveStore(self.archive_path)
+        self._recall_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1,
+                                                                  thread_name_prefix="archive-recall")
+        self._recalls: Dict[str, concurrent.futures.Future] = {}  # id → rappel en cours
+        self._recall_lock = threading.Lock()
+        self.recall_stats = {"hits": 0, "late": 0, "absent": 0}
+        self._recall_latency = deque(maxlen=1000)
+        
+        # RAM cache (CLOCK : les lectures ne réordonnent pas, seconde chance à l'éviction)
+        self.ram_cache: OrderedDict[str, Concept] = OrderedDict()
+        self.max_ram = CONFIG["max_ram_concepts"]
+        self.temperatures = TemperatureTable(min(self.max_ram, 1 << 16))
+        self.maintenance_active = 0  # refroidissement/consolidation en cours
+        
+        # Index
+        self.index_nom: Dict[str, str] = {}  # nom → concept_id
+        self.index_alias: Dict[str, str] = {}  # alias → concept_id
+        self.index_signature_vocale: Dict[str, str] = {}  # signature → concept_id
+        self.index_signature_visage: Dict[str, str] = {}  # signature → concept_id
+        
+        # Index secondaires (RAM + disque)
+        self.index_nature: Dict[str, Set[str]] = {}  # nature → concept_ids
+        self.index_propriete: Dict[str, Set[str]] = {}  # nom de propriété → concept_ids
+        self.index_relation: Dict[str, Dict[str, Set[str]]] = {}  # type → source → cibles
+        self.index_reverse: Dict[str, Set[Tuple[str, str]]] = {}  # cible → (source, type)
+        
+        self._lock = threading.RLock()
+        self._relations_lock = threading.Lock()
+        # Dates des dernières maintenances, conservées d'un démarrage à l'autre :
+        # le refroidissement compte aussi le temps passé processus arrêté
+        self.maintenance_path = self.data_path / "maintenance.json"
+        self.last_cooling, self.last_consolidation = self._load_maintenance_state()
+        self.maintenance_cancel = threading.Event()  # interrompt une maintenance entre deux tranches
+        self.pressure_event: Optional[threading.Event] = None  # signalé quand la RAM dépasse cooling_ram_pressure
+        self._pressure_mark = max(1, int(self.max_ram * CONFIG["cooling_ram_pressure"]))
+        self._change_listeners: List[Callable[[Optional[Concept]], None]] = []
+        
+        # Fermetures transitives : (id, type, direction) → (génération du type, IDs)
+        self._closure_cache: Dict[Tuple[str, str, str], Tuple[int, frozenset]] = {}
+        self._relation_generations: Dict[str, int] = defaultdict(int)
+        self.closure_stats = {"hits": 0, "misses": 0}
+        
+        # Écriture différée : concepts modifiés, écrits par lots hors du verrou
+        self._dirty: OrderedDict[str, Concept] = OrderedDict()  # id → concept, du plus ancien au plus récent
+        self._dirty_since: Dict[str, float] = {}
+        self._flushing: Dict[str, Concept] = {}  # lot en cours d'écriture
+        self._tombstones: Set[str] = set()  # supprimés pendant l'écriture de leur lot
+        self._flush_lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._flush_lags = deque(maxlen=1000)
+        self._flush_writes = deque(maxlen=1000)
+        self._lock_holds: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self._flushed_total = 0
+        
+        # Charger les index et le filtre de Bloom (identifiants, noms, alias et
+        # signatures) : instantané de démarrage s'il est à jour, sinon
+        # instantané JSON + journal et reconstruction du filtre
+        self.lookup_filter: Optional[BloomFilter] = None
+        self.lookup_stats = {"hits": 0, "miss_filtered": 0, "miss_probed": 0}
+        self.startup_snapshot_path = self.data_path / "startup.snapshot"
+        self.startup_source = "snapshot"
+        if not self._load_startup_snapshot():
+            self.startup_source = "index"
+            self._load_index()
+            self._rebuild_lookup_filter()
+        
+        # Plongements des signatures (voix, visage) pour la recherche par similarité
+        self.signature_snapshot_path = self.data_path / "signatures.snapshot"
+        self.signature_indexes: Dict[str, SignatureIndex] = self._load_signature_indexes()
+        
+        # Bases de connaissances déjà chargées : nom → source et statistiques
+        self.knowledge_bases_path = self.data_path / "knowledge_bases.json"
+        try:
+            with open(self.knowledge_bases_path) as f:
+                self.knowledge_bases: Dict[str, Dict[str, Any]] = json.load(f)
+        except (OSError, ValueError):
+            self.knowledge_bases = {}
+        
+        # Instantanés : coupure exclue pendant un oubli ou un rappel ; depuis le
+        # premier instantané, les concepts écrits ou supprimés sur disque sont
+        # notés dans changes.log pour l'export incrémental
+        self._snapshot_lock = threading.Lock()
+        self.snapshot_state_path = self.data_path / "snapshot.json"
+        try:
+            with open(self.snapshot_state_path) as f:
+                self.snapshot_state: Optional[Dict[str, Any]] = json.load(f)
+        except (OSError, ValueError):
+            self.snapshot_state = None
+        self.changes_path = self.data_path / "changes.log"
+        self._changes_lock = threading.Lock()
+        self._changes_file = None
+        self._log_enabled = self.snapshot_state is not None
+        
+        self._writer_stop = threading.Event()
+        self._writer_wake = threading.Event()
+        self._writer_thread = threading.Thread(target=self._write_behind_loop,
+                                               name="graph-writer", daemon=True)
+        self._writer_thread.start()
+    
+    def _open_index_journal(self) -> IndexJournal:
+        return IndexJournal(self.data_path / "index.json.gz", self.data_path / "index.journal",
+                            fsync=CONFIG["index_journal_fsync"],
+                            set_indexes=("nature", "propriete", "relation"))
+    
+    def _load_index(self):
+        """Charge les index depuis le disque (instantané + journal)."""
+        self.index_journal = self._open_index_journal()
+        data = self.index_journal.load()
+        self.index_nom = data.get("nom", {})
+        self.index_alias = data.get("alias", {})
+        self.index_signature_vocale = data.get("signature_vocale", {})
+        self.index_signature_visage = data.get("signature_visage", {})
+        self.index_nature = data.get("nature", {})
+        self.index_propriete = data.get("propriete", {})
+        self.index_relation = {}
+        self.index_reverse = {}
+        for rel_type, pairs in data.get("relation", {}).items():
+            by_source = self.index_relation.setdefault(rel_type, {})
+            for src, tgt in pairs:
+                by_source.setdefault(src, set()).add(tgt)
+                self.index_reverse.setdefault(tgt, set()).add((src, rel_type))
+        self._bind_indexes()
+        
+        # Graphe antérieur aux index secondaires : reconstruction unique
+        if "nature" not in data and (self.index_nom or self.disk.count()):
+            self.rebuild_secondary_indexes()
+    
+    def _bind_indexes(self):
+        self._indexes = {
+            "nom": self.index_nom,
+            "alias": self.index_alias,
+            "signature_vocale": self.index_signature_vocale,
+            "signature_visage": self.index_signature_visage,
+            "nature": self.index_nature,
+            "propriete": self.index_propriete
+        }
+    
+    # ------------------------------------------------------------
+    # Instantané de démarrage
+    # ------------------------------------------------------------
+    
+    def _startup_sources(self) -> Dict[str, Any]:
+        """Signatures (taille, mtime) des fichiers dont l'instantané de démarrage est dérivé."""
+        journal = self.index_journal
+        paths = {"index": journal.snapshot_path, "journal": journal.journal_path,
+                 "journal_rotated": journal.rotated_path}
+        for i, path in enumerate(self.disk.files()):
+            paths[f"disk_{i}"] = path
+        sources: Dict[str, Any] = {name: file_signature(path) for name, path in paths.items()}
+        sources["disk_backend"] = CONFIG["disk_backend"]
+        sources["lookup_filter"] = [CONFIG["lookup_filter"], CONFIG["lookup_filter_fp_rate"]]
+        return sources
+    
+    def _load_startup_snapshot(self) -> bool:
+        """
+        Reprend index et filtre de Bloom depuis startup.snapshot, écrit à la
+        fermeture précédente, si aucun fichier du graphe n'a changé depuis.
+        """
+        if not CONFIG["startup_snapshot"]:
+            return False
+        self.index_journal = self._open_index_journal()
+        cached = read_binary_snapshot(self.startup_snapshot_path, "graph", self._startup_sources())
+        if cached is None:
+            return False
+        state, blobs = cached
+        self.index_journal.entries = state["journal_entries"]
+        (self.index_nom, self.index_alias, self.index_signature_vocale, self.index_signature_visage,
+         self.index_nature, self.index_propriete) = (state["indexes"][name] for name in (
+            "nom", "alias", "signature_vocale", "signature_visage", "nature", "propriete"))
+        # Index des relations : décodés au premier accès (voir __getattr__)
+        del self.index_relation, self.index_reverse
+        self._pending_relations = blobs["relations"]
+        self._bind_indexes()
+        if state["lookup_filter"] is not None:
+            self.lookup_filter = BloomFilter.from_state(state["lookup_filter"], blobs["lookup_filter"])
+        return True
+    
+    def __getattr__(self, name: str) -> Any:
+        # Appelé seulement si l'attribut manque : index des relations pas encore décodés
+        if name not in ("index_relation", "index_reverse") or "_pending_relations" not in self.__dict__:
+            raise AttributeError(name)
+        with self._relations_lock:
+            if name not in self.__dict__:
+                self.index_relation, self.index_reverse = _unpickle(self._pending_relations)
+                del self._pending_relations
+        return self.__dict__[name]
+    
+    def _save_startup_snapshot(self):
+        """Écrit index et filtre de Bloom ; à appeler une fois le graphe fermé."""
+        state = {
+            "journal_entries": self.index_journal.entries,
+            "indexes": self._indexes,
+            "lookup_filter": self.lookup_filter.state() if self.lookup_filter is not None else None,
+        }
+        # Index des relations jamais consultés depuis le démarrage : repris tels quels
+        relations = self.__dict__.get("_pending_relations")
+        if relations is None:
+            relations = pickle.dumps((self.index_relation, self.index_reverse),
+                                     protocol=pickle.HIGHEST_PROTOCOL)
+        blobs = {"relations": relations}
+        if self.lookup_filter is not None:
+            blobs["lookup_filter"] = bytes(self.lookup_filter.bits)
+        write_binary_snapshot(self.startup_snapshot_path, "graph", self._startup_sources(), state, blobs)
+    
+    def _load_signature_indexes(self) -> Dict[str, SignatureIndex]:
+        """
+        Reprend les index de similarité écrits à la fermeture ; ils ne sont
+        réconciliés avec les index exacts (signatures ajoutées ou réattribuées
+        depuis, instantané absent) que si les fichiers du graphe ont changé.
+        """
+        cached = read_binary_snapshot(self.signature_snapshot_path, "signatures", {})
+        indexes = {}
+        for kind in ("vocale", "visage"):
+            index = SignatureIndex()
+            if cached is not None and kind in cached[0]["indexes"]:
+                blobs = {name[len(kind) + 1:]: blob for name, blob in cached[1].items()
+                         if name.startswith(kind + ":")}
+                index = SignatureIndex.from_state(cached[0]["indexes"][kind], blobs)
+            if cached is None or cached[0]["sources"] != self._startup_sources():
+                index.reconcile(self._indexes[f"signature_{kind}"])
+            indexes[kind] = index
+        return indexes
+    
+    def _save_signature_indexes(self):
+        """Écrit les index de similarité ; à appeler une fois le graphe fermé."""
+        states, blobs = {}, {}
+        for kind, index in self.signature_indexes.items():
+            states[kind], columns = index.state()
+            blobs.update({f"{kind}:{name}": blob for name, blob in columns.items()})
+        write_binary_snapshot(self.signature_snapshot_path, "signatures", {},
+                              {"sources": self._startup_sources(), "indexes": states}, blobs)
+    
+    def _index_set(self, index: str, key: str, concept_id: str):
+        """Met à jour un index et journalise la mutation (O(1) en E/S)."""
+        if self._indexes[index].get(key) == concept_id:
+            return
+        self._filter_add(key)
+        self._indexes[index][key] = concept_id
+        self.index_journal.record("set", index, key, concept_id)
+    
+    def _index_del(self, index: str, key: str):
+        if self._indexes[index].pop(key, None) is not None:
+            self.index_journal.record("del", index, key)
+    
+    def _index_add(self, index: str, key: str, concept_id: str):
+        """Ajoute un membre à un index secondaire ensembliste (journalisé)."""
+        members = self._indexes[index].setdefault(key, set())
+        if concept_id not in members:
+            members.add(concept_id)
+            self.index_journal.record("add", index, key, concept_id)
+    
+    def _index_remove(self, index: str, key: str, concept_id: str):
+        members = self._indexes[index].get(key)
+        if members and concept_id in members:
+            members.discard(concept_id)
+            if not members:
+                del self._indexes[index][key]
+            self.index_journal.record("rem", index, key, concept_id)
+    
+    def _relation_index_add(self, source_id: str, rel_type: str, cible_id: str):
+        targets = self.index_relation.setdefault(rel_type, {}).setdefault(source_id, set())
+        if cible_id not in targets:
+            targets.add(cible_id)
+            self._relation_generations[rel_type] += 1
+            self.index_reverse.setdefault(cible_id, set()).add((source_id, rel_type))
+            self.index_journal.record("add", "relation", rel_type, [source_id, cible_id])
+    
+    def _relation_index_remove(self, source_id: str, rel_type: str, cible_id: str):
+        by_source = self.index_relation.get(rel_type, {})
+        targets = by_source.get(source_id)
+        if targets and cible_id in targets:
+            targets.discard(cible_id)
+            self._relation_generations[rel_type] += 1
+            if not targets:
+                del by_source[source_id]
+            reverse = self.index_reverse.get(cible_id)
+            if reverse:
+                reverse.discard((source_id, rel_type))
+                if not reverse:
+                    del self.index_reverse[cible_id]
+            self.index_journal.record("rem", "relation", rel_type, [source_id, cible_id])
+    
+    def _index_concept(self, concept: Concept):
+        """Indexe nature, propriétés et relations sortantes d'un concept."""
+        self._filter_add(concept.id)
+        self._index_add("nature", concept.nature.value, concept.id)
+        for nom in concept.proprietes:
+            self._index_add("propriete", nom, concept.id)
+        for rel_type, cible in concept.relation_keys():
+            self._relation_index_add(concept.id, rel_type, cible)
+    
+    def _unindex_concept(self, concept: Concept):
+        self._index_remove("nature", concept.nature.value, concept.id)
+        for nom in concept.proprietes:
+            self._index_remove("propriete", nom, concept.id)
+        for rel_type, cible in concept.relation_keys():
+            self._relation_index_remove(concept.id, rel_type, cible)
+    
+    def rebuild_secondary_indexes(self, batch_size: int = 1000):
+        """Reconstruit les index secondaires depuis la RAM et le niveau disque."""
+        logger.info("Reconstruction des index secondaires...")
+        with self._lock:
+            self.index_nature.clear()
+            self.index_propriete.clear()
+            self.index_relation.clear()
+            self.index_reverse.clear()
+            self._closure_cache.clear()
+            for concept in self.ram_cache.values():
+                self._index_concept(concept)
+            disk_ids = [cid for cid in self.disk.ids() if cid not in self.ram_cache]
+            for i in range(0, len(disk_ids), batch_size):
+                for concept in self.disk.load_many(disk_ids[i:i + batch_size]).values():
+                    self._index_concept(concept)
+        self._save_index()
+    
+    def _index_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Copie des index, indépendante des mutations ultérieures (à prendre sous verrou)."""
+        maps: Dict[str, Dict[str, Any]] = {}
+        for name, index in self._indexes.items():
+            if name in self.index_journal.set_indexes:
+                maps[name] = {key: list(members) for key, members in index.items()}
+            else:
+                maps[name] = dict(index)
+        maps["relation"] = {
+            rel_type: [(src, tgt) for src, targets in by_source.items() for tgt in targets]
+            for rel_type, by_source in self.index_relation.items()
+        }
+        return maps
+    
+    def _save_index(self):
+        """
+        Compacte les index : copie et rotation du journal sous verrou, puis
+        écriture de l'instantané hors verrou. Ne pas appeler en tenant le verrou.
+        """
+        with self._compact_lock:
+            with self._locked("index_snapshot"):
+                maps = self._index_snapshot()
+                self.index_journal.rotate()
+            self.index_journal.write_snapshot(maps)
+    
+    def _checkpoint_index(self):
+        """Compaction périodique, seulement si le journal a assez grandi."""
+        if self.index_journal.entries >= CONFIG["index_journal_max_entries"]:
+            self._save_index()
+    
+    def _ram_get(self, concept_id: str) -> Optional[Concept]:
+        """Récupère un concept du cache RAM, sans verrou ni réordonnancement."""
+        concept = self.ram_cache.get(concept_id)
+        if concept is not None:
+            self._touch(concept)
+        return concept
+    
+    def _ram_resolve(self, identifiant: str) -> Optional[Concept]:
+        """
+        Résolution sans verrou d'un concept déjà en RAM, par ID, nom, alias ou
+        signature (lectures de dict atomiques sous le GIL). None : passer par
+        le chemin verrouillé (_lookup).
+        """
+        concept = self.ram_cache.get(identifiant)
+        if concept is None:
+            key = identifiant.lower()
+            cid = (self.index_nom.get(key) or self.index_alias.get(key)
+                   or self.index_signature_vocale.get(identifiant)
+                   or self.index_signature_visage.get(identifiant))
+            if cid is None:
+                return None
+            concept = self.ram_cache.get(cid)
+            if concept is None:
+                return None
+        self._touch(concept)
+        return concept
+    
+    def _touch(self, concept: Concept):
+        """
+        Suivi d'accès approximatif : bit de référence CLOCK et compteurs sur le
+        concept lui-même (incréments perdus possibles sous concurrence) ; seule
+        une lecture sur access_sample_rate prend le verrou pour marquer le
+        concept à réécrire.
+        """
+        concept.referenced = True
+        concept.last_accessed = time.time()
+        concept.access_count += 1
+        self.temperatures.touch(concept.id)
+        if random.random() * CONFIG["access_sample_rate"] < 1:
+            with self._lock:
+                self._mark_dirty(concept, notify=False)
+    
+    def _ram_put(self, concept: Concept):
+        """Ajoute un concept au cache RAM (CLOCK)."""
+        if len(self.ram_cache) >= self.max_ram:
+            # Seconde chance : un concept lu depuis le dernier passage repart en
+            # fin de file, bit effacé ; au plus un tour complet
+            for _ in range(len(self.ram_cache)):
+                oldest_id, oldest = next(iter(self.ram_cache.items()))
+                if not oldest.referenced:
+                    break
+                oldest.referenced = False
+                self.ram_cache.move_to_end(oldest_id)
+            # Éviction : un concept modifié reste dans le tampon d'écriture
+            # différée jusqu'à son écriture, rien n'est écrit sous le verrou
+            oldest_id, oldest = self.ram_cache.popitem(last=False)
+            oldest.storage_level = StorageLevel.DISK
+            if self.temperatures.detach(oldest):
+                self._mark_dirty(oldest, notify=False)
+        
+        concept.storage_level = StorageLevel.RAM
+        self.ram_cache[concept.id] = concept
+        self.temperatures.attach(concept)
+        
+        event = self.pressure_event
+        if event is not None and len(self.ram_cache) >= self._pressure_mark and not event.is_set():
+            event.set()
+    
+    def ram_occupancy(self) -> float:
+        """Part de max_ram_concepts occupée par le cache RAM."""
+        return len(self.ram_cache) / self.max_ram
+    
+    # ------------------------------------------------------------
+    # Écriture différée (write-behind)
+    # ------------------------------------------------------------
+    
+    @contextmanager
+    def _locked(self, section: str):
+        """Prend le verrou du graphe en mesurant la durée de détention."""
+        with self._lock:
+            t0 = time.perf_counter()
+            try:
+                yield
+            finally:
+                self._lock_holds[section].append(time.perf_counter() - t0)
+    
+    def _mark_dirty(self, concept: Concept, notify: bool = True):
+        """
+        Signale un concept modifié ; il sera écrit par l'écrivain différé.
+        `notify=False` pour les changements sans effet sur le contenu
+        (compteurs d'accès, niveau de stockage, température).
+        """
+        if notify:
+            self._notify_change(concept)
+        if concept.id in self._dirty:
+            return
+        self._dirty[concept.id] = concept
+        self._dirty_since[concept.id] = time.time()
+        if len(self._dirty) >= CONFIG["write_behind_max_dirty"]:
+            self._writer_wake.set()
+    
+    def add_change_listener(self, listener: Callable[[Optional[Concept]], None]):
+        """
+        Abonne `listener` aux modifications de contenu des concepts (appelé
+        sous le verrou du graphe, doit rester bref) ; None signale un
+        changement global (chargement en masse).
+        """
+        self._change_listeners.append(listener)
+    
+    def _notify_change(self, concept: Optional[Concept]):
+        for listener in self._change_listeners:
+            listener(concept)
+    
+    def _forget_dirty(self, concept_id: str):
+        """Retire un concept supprimé du tampon d'écriture différée."""
+        self._dirty.pop(concept_id, None)
+        self._dirty_since.pop(concept_id, None)
+        if concept_id in self._flushing:
+            self._tombstones.add(concept_id)
+    
+    def _pending_get(self, concept_id: str) -> Optional[Concept]:
+        """Concept modifié pas encore écrit (évincé de la RAM entre-temps)."""
+        return self._dirty.get(concept_id) or self._flushing.get(concept_id)
+    
+    def flush_dirty(self, max_items: Optional[int] = None) -> int:
+        """
+        Écrit les concepts modifiés, par lots de write_behind_batch. Le verrou
+        du graphe n'est tenu que pendant la sérialisation d'un lot ; l'écriture
+        disque se fait hors verrou. Retourne le nombre de concepts écrits.
+        """
+        written = 0
+        with self._flush_lock:
+            while self._dirty and (max_items is None or written < max_items):
+                batch = CONFIG["write_behind_batch"]
+                if max_items is not None:
+                    batch = min(batch, max_items - written)
+                records = []
+                with self._locked("flush"):
+                    now = time.time()
+                    for _ in range(min(batch, len(self._dirty))):
+                        cid, concept = self._dirty.popitem(last=False)
+                        self._flush_lags.append(now - self._dirty_since.pop(cid, now))
+                        self._flushing[cid] = concept
+                        self.temperatures.sync(concept)
+                        records.append(concept.to_record())
+                
+                t0 = time.perf_counter()
+                try:
+                    self._log_changes(record["id"] for record in records)
+                    self.disk.save_records(records)
+                except Exception:
+                    # Remise en file : rien n'est perdu, nouvel essai au prochain cycle
+                    with self._lock:
+                        for record in records:
+                            cid = record["id"]
+                            concept = self._flushing.pop(cid)
+                            if cid not in self._tombstones and cid not in self._dirty:
+                                self._dirty[cid] = concept
+                                self._dirty_since[cid] = time.time()
+                    raise
+                self._flush_writes.append(time.perf_counter() - t0)
+                
+                with self._lock:
+                    for record in records:
+                        self._flushing.pop(record["id"], None)
+                    deleted = [r["id"] for r in records if r["id"] in self._tombstones]
+                    self._tombstones.difference_update(deleted)
+                    for cid in deleted:
+                        self.disk.delete(cid)
+                written += len(records)
+                self._flushed_total += len(records)
+        return written
+    
+    def _write_behind_loop(self):
+        """Écrivain différé : latence bornée par write_behind_interval_s."""
+        while not self._writer_stop.is_set():
+            self._writer_wake.wait(CONFIG["write_behind_interval_s"])
+            self._writer_wake.clear()
+            try:
+                self.flush_dirty()
+            except Exception as e:
+                logger.error(f"Écriture différée échouée: {e}")
+    
+    def flush(self):
+        """
+        Écrit tous les concepts modifiés et compacte les index (arrêt propre) ;
+        sans mutation journalisée depuis la dernière compaction, l'instantané
+        est déjà à jour et n'est pas réécrit.
+        """
+        self.flush_dirty()
+        self.disk.flush()
+        if self.index_journal.entries or self.index_journal.rotated_path.exists():
+            self._save_index()
+    
+    def get_persistence_stats(self) -> Dict[str, Any]:
+        """Métriques de l'écriture différée et des durées de détention du verrou."""
+        with self._lock:
+            oldest = next(iter(self._dirty_since.values()), None)
+            stats = {
+                "dirty": len(self._dirty),
+                "oldest_dirty_age_s": round(time.time() - oldest, 3) if oldest else 0.0,
+                "flushed_total": self._flushed_total,
+                "flush_lag": _latency_stats(list(self._flush_lags)) if self._flush_lags else None,
+                "flush_write": _latency_stats(list(self._flush_writes)) if self._flush_writes else None,
+                "lock_hold": {section: _latency_stats(list(samples))
+                              for section, samples in self._lock_holds.items() if samples},
+            }
+        return stats
+    
+    def _disk_load(self, concept_id: str) -> Optional[Concept]:
+        """Charge un concept depuis le disque."""
+        return self.disk.load(concept_id)
+    
+    # ------------------------------------------------------------
+    # Rappel depuis les archives
+    # ------------------------------------------------------------
+    
+    def remember(self, identifiant: str, budget_ms: Optional[float] = None) -> Optional[Concept]:
+        """Rappelle un concept oublié (voir remember_many)."""
+        return self.remember_many([identifiant], budget_ms)[identifiant]
+    
+    def remember_many(self, identifiants: Iterable[str],
+                      budget_ms: Optional[float] = None) -> Dict[str, Optional[Concept]]:
+        """
+        Rappelle des concepts oubliés depuis les archives : lecture et
+        réinsertion dans le graphe sur le fil de rappel, attendues au plus
+        `budget_ms` (archive_recall_budget_ms par défaut) pour tout le lot.
+        Un rappel hors délai donne None mais s'achève en arrière-plan : le
+        concept sera trouvé par un get() suivant.
+        """
+        found: Dict[str, Optional[Concept]] = {}
+        futures: Dict[str, concurrent.futures.Future] = {}
+        for identifiant in identifiants:
+            cid = self.archive.lookup(identifiant)
+            if cid is None:
+                # Pas dans les archives : simple échec, pas une tentative de rappel
+                found[identifiant] = None
+            else:
+                futures[identifiant] = self.recall_async(cid)
+        if futures:
+            budget = CONFIG["archive_recall_budget_ms"] if budget_ms is None else budget_ms
+            concurrent.futures.wait(set(futures.values()), timeout=budget / 1000)
+            for identifiant, future in futures.items():
+                if future.done():
+                    concept = future.result()
+                    self.recall_stats["hits" if concept is not None else "absent"] += 1
+                else:
+                    concept = None
+                    self.recall_stats["late"] += 1
+                found[identifiant] = concept
+        return found
+    
+    def recall_async(self, concept_id: str) -> concurrent.futures.Future:
+        """Lance (ou rejoint) le rappel d'un concept archivé ; le futur donne le concept réinséré."""
+        with self._recall_lock:
+            future = self._recalls.get(concept_id)
+            if future is None:
+                future = self._recalls[concept_id] = self._recall_pool.submit(self._recall, concept_id)
+            return future
+    
+    def _recall(self, concept_id: str) -> Optional[Concept]:
+        t0 = time.perf_counter()
+        try:
+            concept = self.archive.read(concept_id)
+            if concept is None:
+                return None
+            with self._snapshot_lock, self._lock:
+                if not self.archive.claim(concept_id):
+                    return None
+                concept.temperature = CONFIG["archive_recall_temperature"]
+                concept.last_accessed = time.time()
+                self.add_concept(concept)
+            return concept
+        except Exception:
+            logger.exception(f"Rappel de {concept_id} depuis les archives impossible")
+            return None
+        finally:
+            with self._recall_lock:
+                self._recalls.pop(concept_id, None)
+            self._recall_latency.append(time.perf_counter() - t0)
+    
+    def get_archive_stats(self) -> Dict[str, Any]:
+        """Taille des archives, rappels (dans le délai, hors délai, absents) et leur latence."""
+        stats = self.archive.get_stats()
+        recall = dict(self.recall_stats)
+        lookups = sum(recall.values())
+        recall["hit_rate"] = round(recall["hits"] / lookups, 4) if lookups else 0.0
+        recall["latency"] = _latency_stats(list(self._recall_latency)) if self._recall_latency else None
+        stats["recall"] = recall
+        return stats
+    
+    # ------------------------------------------------------------
+    # Filtre de recherche négative
+    # ------------------------------------------------------------
+    
+    def _rebuild_lookup_filter(self):
+        """Reconstruit le filtre depuis les index, la RAM, le tampon d'écriture et le disque."""
+        if not CONFIG["lookup_filter"]:
+            self.lookup_filter = None
+            return
+        with self._lock:
+            keys = set(self.ram_cache)
+            keys.update(self._dirty)
+            keys.update(self.disk.ids())
+            for index in ("nom", "alias", "signature_vocale", "signature_visage"):
+                keys.update(self._indexes[index])
+            capacity = max(CONFIG["lookup_filter_min_capacity"], 2 * len(keys))
+            new_filter = BloomFilter(capacity, CONFIG["lookup_filter_fp_rate"])
+            new_filter.add_many(keys)
+            self.lookup_filter = new_filter
+    
+    def _filter_add(self, key: str):
+        if self.lookup_filter is None:
+            return
+        self.lookup_filter.add(key)
+        if self.lookup_filter.saturated:
+            self._rebuild_lookup_filter()
+    
+    def get_lookup_stats(self) -> Dict[str, Any]:
+        """Compteurs de get() : succès, échecs écartés par le filtre, échecs sondés."""
+        stats = dict(self.lookup_stats)
+        if self.lookup_filter is not None:
+            stats["filter_keys"] = self.lookup_filter.count
+            stats["filter_capacity"] = self.lookup_filter.capacity
+            stats["filter_bytes"] = len(self.lookup_filter.bits)
+        return stats
+    
+    def get(self, identifiant: Union[str, Concept]) -> Optional[Concept]:
+        """Récupère un concept par ID, nom, alias ou signature ; en dernier recours, depuis les archives."""
+        # Si déjà un concept
+        if isinstance(identifiant, Concept):
+            return identifiant
+        
+        # Concept en RAM : sans verrou (compteurs approximatifs sous concurrence)
+        concept = self._ram_resolve(identifiant)
+        if concept is not None:
+            self.lookup_stats["hits"] += 1
+            return concept
+        
+        # Échec certain : ni verrou, ni disque
+        lookup_filter = self.lookup_filter
+        if (lookup_filter is not None and identifiant not in lookup_filter
+                and identifiant.lower() not in lookup_filter):
+            self.lookup_stats["miss_filtered"] += 1
+            return self._remember(identifiant)
+        
+        concept = self._lookup(identifiant)
+        self.lookup_stats["hits" if concept else "miss_probed"] += 1
+        return concept or self._remember(identifiant)
+    
+    def _remember(self, identifiant: str) -> Optional[Concept]:
+        """Dernier recours d'un échec de get() : les archives, si le concept y est."""
+        if not CONFIG["archive_recall"] or not self.archive.entries:
+            return None
+        return self.remember(identifiant)
+    
+    def get_many(self, identifiants: Iterable[str]) -> Dict[str, Optional[Concept]]:
+        """
+        Résout un lot d'identifiants (ID, nom, alias ou signature) : concepts
+        en RAM sans verrou, puis une seule prise du verrou et un seul
+        chargement disque groupé pour le reste (concepts promus en RAM) ;
+        les échecs sont enfin cherchés dans les archives (un seul délai).
+        """
+        found: Dict[str, Optional[Concept]] = {}
+        candidates: Dict[str, List[str]] = {}
+        lookup_filter = self.lookup_filter
+        for identifiant in set(identifiants):
+            concept = self._ram_resolve(identifiant)
+            if concept is not None:
+                found[identifiant] = concept
+                self.lookup_stats["hits"] += 1
+                continue
+            key = identifiant.lower()
+            if (lookup_filter is not None and identifiant not in lookup_filter
+                    and key not in lookup_filter):
+                found[identifiant] = None
+                self.lookup_stats["miss_filtered"] += 1
+                continue
+            # Même ordre que _lookup : ID, nom, alias, signatures
+            candidates[identifiant] = [cid for cid in (
+                identifiant, self.index_nom.get(key), self.index_alias.get(key),
+                self.index_signature_vocale.get(identifiant),
+                self.index_signature_visage.get(identifiant)) if cid is not None]
+        if not candidates:
+            return self._with_archives(found)
+        
+        with self._locked("get_many"):
+            wanted = {cid for cids in candidates.values() for cid in cids
+                      if cid not in self.ram_cache and self._pending_get(cid) is None}
+            loaded = self.disk.load_many(list(wanted)) if wanted else {}
+            for identifiant, cids in candidates.items():
+                concept = None
+                for cid in cids:
+                    concept = self.ram_cache.get(cid) or self._pending_get(cid) or loaded.get(cid)
+                    if concept is not None:
+                        break
+                if concept is not None and concept.id not in self.ram_cache:
+                    self._ram_put(concept)
+                if concept is not None:
+                    self._touch(concept)
+                found[identifiant] = concept
+                self.lookup_stats["hits" if concept else "miss_probed"] += 1
+        return self._with_archives(found)
+    
+    def _with_archives(self, found: Dict[str, Optional[Concept]]) -> Dict[str, Optional[Concept]]:
+        missing = [identifiant for identifiant, concept in found.items() if concept is None]
+        if missing and CONFIG["archive_recall"] and self.archive.entries:
+            found.update(self.remember_many(missing))
+        return found
+    
+    def _lookup(self, identifiant: str) -> Optional[Concept]:
+        with self._lock:
+            # Chercher par ID
+            concept = self._ram_get(identifiant)
+            if concept:
+                return concept
+            
+            concept = self._pending_get(identifiant) or self._disk_load(identifiant)
+            if concept:
+                self._ram_put(concept)
+                return concept
+            
+            # Chercher par nom
+            if identifiant.lower() in self.index_nom:
+                cid = self.index_nom[identifiant.lower()]
+                return self._lookup(cid)
+            
+            # Chercher par alias
+            if identifiant.lower() in self.index_alias:
+                cid = self.index_alias[identifiant.lower()]
+                return self._lookup(cid)
+            
+            # Chercher par signature vocale
+            if identifiant in self.index_signature_vocale:
+                cid = self.index_signature_vocale[identifiant]
+                return self._lookup(cid)
+            
+            # Chercher par signature visage
+            if identifiant in self.index_signature_visage:
+                cid = self.index_signature_visage[identifiant]
+                return self._lookup(cid)
+        
+        return None
+    
+    def get_or_create(self, nom: str, nature: ConceptNature,
+                     memoire_type: MemoryType = MemoryType.PERMANENT,
+                     source: Optional[SourceInfo] = None) -> Concept:
+        """
+        Récupère ou crée un concept. Un concept archivé dont le rappel a
+        dépassé son délai dans get() est attendu plutôt que recréé : le rappel
+        réindexerait sinon le nom vers l'ancien concept.
+        """
+        existing = self.get(nom)
+        if existing:
+            return existing
+        archived = self.archive.lookup(nom) if CONFIG["archive_recall"] else None
+        if archived is not None:
+            existing = self.recall_async(archived).result()
+            if existing is not None:
+                return existing
+        
+        source = source or SourceInfo(type=SourceWeight.EDUCATIVE)
+        concept_id = f"concept_{uuid.uuid4().hex[:8]}"
+        
+        with self._lock:
+            # Rappel achevé entre-temps
+            if nom.lower() in self.index_nom:
+                existing = self.get(nom)
+                if existing:
+                    return existing
+            concept = Concept(
+                id=concept_id,
+                nom=nom,
+                nature=nature,
+                memoire_type=memoire_type
+            )
+            self._ram_put(concept)
+            self._mark_dirty(concept)
+            self._index_set("nom", nom.lower(), concept_id)
+            self._index_concept(concept)
+            return concept
+    
+    def add_concept(self, concept: Concept):
+        """Ajoute un concept existant."""
+        with self._lock:
+            self._ram_put(concept)
+            self._mark_dirty(concept)
+            self._index_set("nom", concept.nom.lower(), concept.id)
+            for alias in concept.aliases:
+                self._index_set("alias", alias.lower(), concept.id)
+            self._index_concept(concept)
+    
+    def add_relation(self, source: Union[str, Concept],
+                    type: RelationType, cible: Union[str, Concept],
+                    source_info: SourceInfo):
+        """Ajoute une relation entre deux concepts."""
+        src = self.get(source) if isinstance(source, str) else source
         if not src:
             src = self.get_or_create(str(source), ConceptNature.CATEGORIE, 
                                      MemoryType.PERMANENT, source_info)
@@ -639,21 +3577,58 @@ class KnowledgeGraph:
             cib = self.get_or_create(str(cible), ConceptNature.CATEGORIE,
                                      MemoryType.PERMANENT, source_info)
         
-        src.add_relation(type, cib.id, source_info)
-        if type.bidirectionnelle:
-            # Ajouter la relation inverse si nécessaire
-            inverse_map = {
-                RelationType.EST_UN: RelationType.A_POUR_INSTANCE,
-                RelationType.A_POUR_INSTANCE: RelationType.EST_UN,
-                RelationType.CONTIENT: RelationType.FAIT_PARTIE_DE,
-                RelationType.FAIT_PARTIE_DE: RelationType.CONTIENT,
-                RelationType.PRECEDE: RelationType.SUIT,
-                RelationType.SUIT: RelationType.PRECEDE,
-                RelationType.A_ECRIT: RelationType.EST_ECRIT_PAR,
-                RelationType.EST_ECRIT_PAR: RelationType.A_ECRIT
-            }
-            if type in inverse_map:
-                cib.add_relation(inverse_map[type], src.id, source_info)
+        with self._lock:
+            self._link(src, type, cib.id, source_info)
+        # Ajouter la relation inverse si nécessaire
+        inverse = INVERSE_RELATIONS.get(type)
+        if inverse:
+            with self._lock:
+                self._link(cib, inverse, src.id, source_info)
+    
+    def _link(self, concept: Concept, type: RelationType, cible: str, source_info: SourceInfo):
+        """
+        Ajoute la relation sous le verrou ; une relation déjà présente n'est
+        pas dupliquée mais compte comme un usage (renforcée au prochain
+        refroidissement).
+        """
+        position = concept.relation_position(type, cible)
+        if position is not None:
+            self.temperatures.use_relation(concept, position)
+            concept.last_accessed = time.time()
+            return
+        self.temperatures.sync(concept)
+        concept.add_relation(type, cible, source_info)
+        self.temperatures.attach(concept)
+        self._mark_dirty(concept)
+        self._relation_index_add(concept.id, type.value, cible)
+    
+    def reinforce_relation(self, source: Union[str, Concept], type: RelationType, cible: str,
+                           count: int = 1) -> bool:
+        """
+        Compte `count` usages de la relation (source, type, cible) ; le poids
+        remonte au prochain passage de renforcement. Sans effet (False) si la
+        source n'est pas en RAM ou n'a pas cette relation.
+        """
+        concept = source if isinstance(source, Concept) else self.ram_cache.get(source)
+        if concept is None:
+            return False
+        with self._lock:
+            position = concept.relation_position(type, cible)
+            if position is None or concept.id not in self.temperatures.slots:
+                return False
+            self.temperatures.use_relation(concept, position, count)
+        return True
+    
+    def add_propriete(self, concept: Union[str, Concept], nom: str, valeur: Any,
+                      type: str, source_info: SourceInfo):
+        """Ajoute une propriété à un concept en maintenant l'index des propriétés."""
+        c = self.get(concept) if isinstance(concept, str) else concept
+        if not c:
+            return
+        with self._lock:
+            c.add_propriete(nom, valeur, type, source_info)
+            self._mark_dirty(c)
+            self._index_add("propriete", nom, c.id)
     
     def add_signature_vocale(self, personne: Union[str, Concept],
                             signature: str, source_info: SourceInfo):
@@ -663,9 +3638,10 @@ class KnowledgeGraph:
             pers = self.get_or_create(str(personne), ConceptNature.PERSONNE,
                                      MemoryType.SOCIAL, source_info)
         
-        self.index_signature_vocale[signature] = pers.id
-        pers.add_propriete("signature_vocale", signature, "base64", source_info)
-        self._save_index()
+        with self._lock:
+            self._index_set("signature_vocale", signature, pers.id)
+            self.signature_indexes["vocale"].add(signature, pers.id)
+        self.add_propriete(pers, "signature_vocale", signature, "base64", source_info)
     
     def add_signature_visage(self, personne: Union[str, Concept],
                             signature: str, source_info: SourceInfo):
@@ -675,119 +3651,1382 @@ class KnowledgeGraph:
             pers = self.get_or_create(str(personne), ConceptNature.PERSONNE,
                                      MemoryType.SOCIAL, source_info)
         
-        self.index_signature_visage[signature] = pers.id
-        pers.add_propriete("signature_visage", signature, "base64", source_info)
-        self._save_index()
+        with self._lock:
+            self._index_set("signature_visage", signature, pers.id)
+            self.signature_indexes["visage"].add(signature, pers.id)
+        self.add_propriete(pers, "signature_visage", signature, "base64", source_info)
     
-    def find_by_signature_vocale(self, signature: str) -> Optional[Concept]:
-        """Trouve une personne par sa signature vocale."""
-        if signature in self.index_signature_vocale:
-            return self.get(self.index_signature_vocale[signature])
-        return None
+    def find_by_signature_vocale(self, signature: Union[str, Sequence[float], np.ndarray]) -> Optional[Concept]:
+        """Trouve une personne par sa signature vocale (identique, sinon la plus proche au-dessus du seuil)."""
+        return self._find_by_signature("vocale", signature)
     
-    def find_by_signature_visage(self, signature: str) -> Optional[Concept]:
-        """Trouve une personne par sa signature visage."""
-        if signature in self.index_signature_visage:
-            return self.get(self.index_signature_visage[signature])
-        return None
+    def find_by_signature_visage(self, signature: Union[str, Sequence[float], np.ndarray]) -> Optional[Concept]:
+        """Trouve une personne par sa signature visage (identique, sinon la plus proche au-dessus du seuil)."""
+        return self._find_by_signature("visage", signature)
+    
+    def _find_by_signature(self, kind: str, signature: Union[str, Sequence[float], np.ndarray]) -> Optional[Concept]:
+        if isinstance(signature, str):
+            concept_id = self._indexes[f"signature_{kind}"].get(signature)
+            if concept_id is not None:
+                return self.get(concept_id)
+        matches = self.search_signatures(kind, signature, k=1)
+        return matches[0][0] if matches else None
+    
+    def search_signatures(self, kind: str, signature: Union[str, Sequence[float], np.ndarray],
+                          k: Optional[int] = None,
+                          threshold: Optional[float] = None) -> List[Tuple[Concept, float]]:
+        """
+        Les `k` personnes (signature_top_k par défaut) dont une signature
+        `kind` ("vocale" ou "visage") est la plus proche du plongement
+        `signature` (base64 ou vecteur), avec leur similarité cosinus,
+        décroissante et au moins `threshold` (signature_thresholds[kind] par
+        défaut). Sans verrou du graphe, hors résolution des concepts.
+        """
+        index = self.signature_indexes[kind]
+        if threshold is None:
+            threshold = CONFIG["signature_thresholds"][kind]
+        matches = index.search(signature, k or CONFIG["signature_top_k"], threshold)
+        if not matches:
+            return []
+        concepts = self.get_many(owner for owner, _ in matches)
+        return [(concepts[owner], score) for owner, score in matches if concepts.get(owner) is not None]
+    
+    def get_signature_stats(self) -> Dict[str, Any]:
+        return {kind: index.get_stats() for kind, index in self.signature_indexes.items()}
     
     def query(self, type: Optional[RelationType] = None,
              nature: Optional[ConceptNature] = None,
-             propriete: Optional[str] = None) -> List[Concept]:
-        """Recherche avancée dans le graphe."""
-        results = []
+             propriete: Optional[str] = None,
+             limit: Optional[int] = None) -> List[Concept]:
+        """Recherche avancée dans le graphe (RAM et disque, via les index secondaires).
         
+        `type` retient les concepts source d'au moins une relation de ce type.
+        Les concepts sur disque sont chargés par lot, hors verrou, sans être
+        promus en RAM.
+        """
         with self._lock:
-            for concept in self.ram_cache.values():
-                if nature and concept.nature != nature:
+            candidates = []
+            if type is not None:
+                candidates.append(self.index_relation.get(type.value, {}).keys())
+            if nature is not None:
+                candidates.append(self.index_nature.get(nature.value, set()))
+            if propriete is not None:
+                candidates.append(self.index_propriete.get(propriete, set()))
+            
+            if candidates:
+                # Intersection en partant du plus petit ensemble
+                candidates.sort(key=len)
+                ids = set(candidates[0])
+                for other in candidates[1:]:
+                    ids.intersection_update(other)
+                    if not ids:
+                        break
+            else:
+                # Aucun filtre : tous les concepts indexés
+                ids = set().union(*self.index_nature.values())
+            
+            ids = sorted(ids)
+            if limit is not None:
+                ids = ids[:limit]
+            
+            found: Dict[str, Concept] = {}
+            missing = []
+            for cid in ids:
+                concept = self.ram_cache.get(cid) or self._pending_get(cid)
+                if concept is not None:
+                    found[cid] = concept
+                else:
+                    missing.append(cid)
+        
+        if missing:
+            found.update(self.disk.load_many(missing))
+        # Un seul ordre (par ID), que le concept soit en RAM ou sur disque
+        return [found[cid] for cid in ids if cid in found]
+    
+    def referrers(self, cible: Union[str, Concept],
+                  type: Optional[RelationType] = None) -> List[Tuple[str, RelationType]]:
+        """Concepts pointant vers `cible` : liste de (source_id, type de relation)."""
+        cible_id = cible.id if isinstance(cible, Concept) else cible
+        if cible_id not in self.index_reverse:
+            c = self.get(cible_id)
+            cible_id = c.id if c else cible_id
+        with self._lock:
+            refs = self.index_reverse.get(cible_id, set())
+            return sorted(
+                (src, RelationType(rel_type)) for src, rel_type in refs
+                if type is None or rel_type == type.value
+            )
+    
+    # ------------------------------------------------------------
+    # Parcours multi-sauts
+    # ------------------------------------------------------------
+    
+    def traverse(self, start: Union[str, Concept],
+                 types: Optional[Iterable[RelationType]] = None,
+                 direction: str = "sortant",
+                 mode: str = "bfs",
+                 max_depth: int = 3,
+                 max_nodes: int = 1000,
+                 budget_ms: Optional[float] = None,
+                 weighted: bool = False,
+                 min_score: float = 0.0) -> TraversalResult:
+        """
+        Parcours borné depuis `start` (largeur, profondeur ou meilleur score
+        d'abord), en suivant les relations de `types` (toutes si None), dans le
+        sens des relations ("sortant") ou à rebours ("entrant").
+        
+        Sans pondération, le parcours ne lit que les index de relations (RAM et
+        disque couverts, aucun chargement). Avec `weighted`, chaque arête vaut
+        poids × confiance de la source et le score d'un concept est le produit
+        le long du chemin ; les concepts nécessaires sont chargés par lots
+        (traversal_prefetch_batch) sans être promus en RAM. Le départ n'est pas
+        compté dans les résultats. Sans verrou : les index sont lus par copies
+        atomiques sous le GIL.
+        """
+        if mode not in TRAVERSAL_MODES:
+            raise ValueError(f"Mode de parcours inconnu : {mode}")
+        if direction not in TRAVERSAL_DIRECTIONS:
+            raise ValueError(f"Direction de parcours inconnue : {direction}")
+        t0 = time.perf_counter()
+        deadline = t0 + budget_ms / 1000 if budget_ms is not None else None
+        
+        start_concept = start if isinstance(start, Concept) else self.get(start)
+        if start_concept is None:
+            return TraversalResult(start=None)
+        start_id = start_concept.id
+        result = TraversalResult(start=start_id, parents={start_id: None})
+        type_values = {t.value for t in types} if types is not None else None
+        cache: Dict[str, Concept] = {start_id: start_concept} if weighted else {}
+        
+        # Frontière : (score, profondeur, id) ; tas de scores négatifs pour "best"
+        counter = 0
+        frontier: Any = deque([(1.0, 0, start_id)]) if mode == "bfs" else [(-1.0 if mode == "best" else 1.0,
+                                                                            0, counter, start_id)]
+        settled: Set[str] = set()
+        best_scores = {start_id: 1.0}
+        vias: Dict[str, str] = {}  # relation d'arrivée, mode "best"
+        
+        while frontier:
+            if deadline is not None and time.perf_counter() >= deadline:
+                result.truncated = "budget"
+                break
+            if mode == "bfs":
+                score, depth, cid = frontier.popleft()
+            elif mode == "dfs":
+                score, depth, _, cid = frontier.pop()
+            else:
+                neg_score, depth, _, cid = heapq.heappop(frontier)
+                score = -neg_score
+                if cid in settled:
+                    continue
+                settled.add(cid)
+                if cid != start_id:
+                    result.hits.append(TraversalHit(cid, depth, score, vias[cid]))
+                    if len(result.hits) >= max_nodes:
+                        if frontier:
+                            result.truncated = "max_nodes"
+                        break
+            if depth >= max_depth:
+                if result.truncated is None and any(
+                        neighbour not in result.parents
+                        for neighbour, _, _ in self._neighbours(cid, type_values, direction, None)):
+                    result.truncated = "max_depth"
+                continue
+            
+            if weighted:
+                # Concepts à lire pour pondérer les arêtes de cid : lui-même
+                # (sortant) ou ceux qui pointent vers lui (entrant)
+                needed = ((cid,) if direction == "sortant"
+                          else (src for src, _ in tuple(self.index_reverse.get(cid, ()))))
+                if any(n not in cache for n in needed):
+                    pending = frontier if mode == "bfs" else reversed(frontier)
+                    self._prefetch(itertools.chain((cid,), (entry[-1] for entry in pending)),
+                                   type_values, direction, cache, result)
+            
+            result.expanded += 1
+            full = False
+            for neighbour, rel_type, weight in self._neighbours(cid, type_values, direction,
+                                                                 cache if weighted else None):
+                new_score = score * weight
+                if new_score < min_score:
+                    continue
+                if mode == "best":
+                    if neighbour in settled or best_scores.get(neighbour, -1.0) >= new_score:
+                        continue
+                    best_scores[neighbour] = new_score
+                    result.parents[neighbour] = cid
+                    vias[neighbour] = rel_type
+                    counter += 1
+                    heapq.heappush(frontier, (-new_score, depth + 1, counter, neighbour))
                     continue
-                if propriete and propriete not in concept.proprietes:
+                if neighbour in result.parents:
                     continue
-                results.append(concept)
+                result.parents[neighbour] = cid
+                result.hits.append(TraversalHit(neighbour, depth + 1, new_score, rel_type))
+                if len(result.hits) >= max_nodes:
+                    full = True
+                    break
+                if mode == "bfs":
+                    frontier.append((new_score, depth + 1, neighbour))
+                else:
+                    counter += 1
+                    frontier.append((new_score, depth + 1, counter, neighbour))
+            if full:
+                result.truncated = "max_nodes"
+                break
         
-        return results
+        result.elapsed_ms = (time.perf_counter() - t0) * 1000
+        return result
     
-    def cool_down(self):
-        """Refroidissement horaire de tous les concepts."""
-        now = time.time()
-        heures = (now - self.last_cooling) / 3600
+    def _neighbours(self, concept_id: str, type_values: Optional[Set[str]], direction: str,
+                    cache: Optional[Dict[str, Concept]]) -> Iterator[Tuple[str, str, float]]:
+        """Voisins (id, type, poids de l'arête) ; poids 1.0 sans cache de concepts."""
+        if direction == "sortant":
+            concept = cache.get(concept_id) if cache is not None else None
+            if concept is not None:
+                for rel_type, cible, relation in concept.weighted_relations(self._current_weights(concept)):
+                    if type_values is None or rel_type in type_values:
+                        yield cible, rel_type, relation
+                return
+            rel_types = type_values if type_values is not None else tuple(self.index_relation)
+            for rel_type in rel_types:
+                targets = self.index_relation.get(rel_type, {}).get(concept_id)
+                if targets:
+                    for cible in tuple(targets):
+                        yield cible, rel_type, 1.0
+        else:
+            for src, rel_type in tuple(self.index_reverse.get(concept_id, ())):
+                if type_values is not None and rel_type not in type_values:
+                    continue
+                weight = 1.0
+                source = cache.get(src) if cache is not None else None
+                if source is not None:
+                    weight = max((w for t, cible, w in source.weighted_relations(self._current_weights(source))
+                                  if t == rel_type and cible == concept_id), default=1.0)
+                yield src, rel_type, weight
+    
+    def _current_weights(self, concept: Concept) -> Optional[List[float]]:
+        """Poids à jour d'un concept en RAM (la table fait foi), None sinon."""
+        weights = self.temperatures.weights(concept)
+        return None if weights is None else weights.tolist()
+    
+    def _prefetch(self, seeds: Iterable[str], type_values: Optional[Set[str]], direction: str,
+                  cache: Dict[str, Concept], result: TraversalResult):
+        """
+        Précharge les concepts que le parcours pondéré va lire : la frontière
+        puis, en suivant les index de relations (qui couvrent le disque), les
+        concepts des prochains niveaux ; un seul load_many d'au plus
+        traversal_prefetch_batch concepts au lieu d'un chargement par saut.
+        """
+        batch = CONFIG["traversal_prefetch_batch"]
+        missing = []
+        queue = deque(itertools.islice(seeds, batch))
+        seen: Set[str] = set()
+        while queue and len(missing) < batch and len(seen) < 4 * batch:
+            cid = queue.popleft()
+            if cid in seen:
+                continue
+            seen.add(cid)
+            if cid not in cache:
+                concept = self.ram_cache.get(cid) or self._pending_get(cid)
+                if concept is not None:
+                    cache[cid] = concept
+                else:
+                    missing.append(cid)
+            queue.extend(neighbour for neighbour, _, _ in self._neighbours(cid, type_values, direction, None))
+        if missing:
+            loaded = self.disk.load_many(missing)
+            cache.update(loaded)
+            result.disk_loads += len(loaded)
+    
+    def closure(self, start: Union[str, Concept],
+                type: RelationType = RelationType.EST_UN,
+                direction: str = "sortant") -> frozenset:
+        """
+        Fermeture transitive de `start` pour un type de relation (ex : tous les
+        ancêtres par EST_UN, tout ce que contient un concept par CONTIENT).
+        Mise en cache jusqu'à la prochaine modification d'une relation de ce
+        type ; une fermeture tronquée (closure_max_nodes, closure_max_depth)
+        n'est pas gardée.
+        """
+        concept = start if isinstance(start, Concept) else self.get(start)
+        if concept is None:
+            return frozenset()
+        key = (concept.id, type.value, direction)
+        generation = self._relation_generations[type.value]
+        cached = self._closure_cache.get(key)
+        if cached is not None and cached[0] == generation:
+            self.closure_stats["hits"] += 1
+            return cached[1]
+        self.closure_stats["misses"] += 1
         
+        result = self.traverse(concept, types=(type,), direction=direction,
+                               max_depth=CONFIG["closure_max_depth"],
+                               max_nodes=CONFIG["closure_max_nodes"])
+        ids = frozenset(result.ids())
+        if result.truncated is None:
+            if len(self._closure_cache) >= CONFIG["closure_cache_size"]:
+                self._closure_cache.pop(next(iter(self._closure_cache), None), None)
+            self._closure_cache[key] = (generation, ids)
+        return ids
+    
+    def is_a(self, concept: Union[str, Concept], categorie: Union[str, Concept]) -> bool:
+        """Vrai si `categorie` est atteinte depuis `concept` par une chaîne de EST_UN."""
+        c = concept if isinstance(concept, Concept) else self.get(concept)
+        cat = categorie if isinstance(categorie, Concept) else self.get(categorie)
+        if c is None or cat is None:
+            return False
+        return cat.id in self.closure(c, RelationType.EST_UN)
+    
+    def _run_sliced(self, items: List[Any], section: str, work: Callable[[Any], None]):
+        """
+        Applique `work` à chaque élément sous le verrou, par tranches d'au plus
+        maintenance_slice_ms ; le verrou est relâché entre deux tranches pour
+        laisser passer process() et les lectures. S'arrête entre deux tranches
+        si maintenance_cancel est levé (arrêt du processus) ; retourne le
+        nombre d'éléments traités.
+        """
+        budget = CONFIG["maintenance_slice_ms"] / 1000
+        i, n = 0, len(items)
+        while i < n and not self.maintenance_cancel.is_set():
+            with self._locked(section):
+                deadline = time.perf_counter() + budget
+                while i < n:
+                    work(items[i])
+                    i += 1
+                    if time.perf_counter() >= deadline:
+                        break
+            time.sleep(0)
+        return i
+    
+    def _load_maintenance_state(self) -> Tuple[float, float]:
+        """Dates du dernier refroidissement et de la dernière consolidation (maintenant si inconnues)."""
+        now = time.time()
+        try:
+            with open(self.maintenance_path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        return (min(float(state.get("last_cooling", now)), now),
+                min(float(state.get("last_consolidation", now)), now))
+    
+    def _save_maintenance_state(self):
+        """Écrit les dates de maintenance de façon atomique."""
+        tmp_path = self.maintenance_path.with_name(self.maintenance_path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump({"last_cooling": self.last_cooling,
+                       "last_consolidation": self.last_consolidation}, f)
+        os.replace(tmp_path, self.maintenance_path)
+    
+    @contextmanager
+    def _maintenance(self):
         with self._lock:
-            to_disk = []
-            to_archive = []
+            self.maintenance_active += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.maintenance_active -= 1
+    
+    def _attach_untracked(self):
+        """Suit les concepts insérés dans ram_cache sans passer par _ram_put."""
+        for cid in self.ram_cache.keys() - self.temperatures.slots.keys():
+            self.temperatures.attach(self.ram_cache[cid])
+    
+    def cool_down(self, target_occupancy: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Refroidissement horaire de tous les concepts en RAM : baisse vectorisée
+        des températures et des poids de relations, puis réchauffement par les
+        accès et renforcement des relations utilisées depuis le passage
+        précédent, en une tranche ; sorties de RAM et oublis ensuite traités
+        par tranches bornées ; les archives sont écrites hors verrou.
+        
+        Avec `target_occupancy` (refroidissement sous pression), les concepts
+        les plus froids encore au-dessus des seuils sortent aussi de RAM
+        jusqu'à ramener l'occupation à cette part de max_ram_concepts.
+        Retourne le nombre de concepts déplacés, oubliés, délestés et renforcés
+        et de relations renforcées.
+        """
+        now = time.time()
+        
+        with self._maintenance():
+            with self._locked("cool_down"):
+                heures = (now - self.last_cooling) / 3600
+                self._attach_untracked()
+                self.temperatures.decay(heures)
+                reinforced = self.temperatures.reinforce()
+                to_archive = self.temperatures.below(CONFIG["freezing_threshold"])
+                to_disk = self.temperatures.below(CONFIG["disk_threshold"],
+                                                  floor=CONFIG["freezing_threshold"])
+                self.last_cooling = now
             
-            for cid, concept in list(self.ram_cache.items()):
-                concept.cool_down(heures)
-                
-                if concept.temperature < CONFIG["freezing_threshold"]:
-                    to_archive.append(concept)
-                elif concept.temperature < CONFIG["disk_threshold"]:
-                    to_disk.append(concept)
+            moved = []
+            archived = []
             
-            # Déplacer vers disque
-            for concept in to_disk:
-                self._disk_save(concept)
-                del self.ram_cache[concept.id]
+            shed = []
+            target = self.max_ram if target_occupancy is None else int(self.max_ram * target_occupancy)
+            
+            # Déplacer vers disque : sortie de la RAM, écriture par l'écrivain différé
+            def move(cid: str, forced: bool = False):
+                concept = self.ram_cache.get(cid)
+                temperature = self.temperatures.get(cid)
+                if concept is None or temperature is None:
+                    return
+                if forced:
+                    if len(self.ram_cache) <= target:
+                        return
+                    shed.append(cid)
+                elif temperature >= CONFIG["disk_threshold"]:
+                    return
+                del self.ram_cache[cid]
+                self.temperatures.detach(concept)
+                concept.storage_level = StorageLevel.DISK
+                self._mark_dirty(concept, notify=False)
+                moved.append(cid)
             
             # Archiver (oublier)
-            for concept in to_archive:
-                self._archive_save(concept)
-                del self.ram_cache[concept.id]
+            def forget(cid: str):
+                concept = self.ram_cache.get(cid)
+                temperature = self.temperatures.get(cid)
+                if concept is None or temperature is None or temperature >= CONFIG["freezing_threshold"]:
+                    return
+                del self.ram_cache[cid]
+                self.temperatures.detach(concept)
+                self._forget_dirty(cid)
+                self._log_changes((cid,))
+                self.disk.delete(cid)
                 # Nettoyer les index
-                if concept.nom.lower() in self.index_nom:
-                    del self.index_nom[concept.nom.lower()]
+                self._index_del("nom", concept.nom.lower())
                 for alias in concept.aliases:
-                    if alias.lower() in self.index_alias:
-                        del self.index_alias[alias.lower()]
+                    self._index_del("alias", alias.lower())
+                self._unindex_concept(concept)
+                self._notify_change(concept)
+                archived.append(concept)
             
-            self.last_cooling = now
-            self._save_index()
+            self._run_sliced(to_disk, "cool_down", move)
+            # Oubli puis archivage d'un seul tenant pour un instantané
+            with self._snapshot_lock:
+                self._run_sliced(to_archive, "cool_down", forget)
+                self.archive.put_many(archived)
+                archive = self.archive.maintain()
             
-            logger.debug(f"Refroidissement: {len(to_disk)} déplacés, {len(to_archive)} oubliés")
+            # Délestage sous pression : les plus froids, quel que soit leur seuil
+            if target_occupancy is not None:
+                with self._locked("cool_down"):
+                    excess = self.temperatures.coldest(len(self.ram_cache) - target)
+                self._run_sliced(excess, "cool_down", functools.partial(move, forced=True))
+            
+            self._checkpoint_index()
+            self._save_maintenance_state()
+        
+        logger.debug(f"Refroidissement: {len(moved)} déplacés ({len(shed)} sous pression), "
+                     f"{len(archived)} oubliés")
+        self._writer_wake.set()
+        return {"moved": len(moved), "archived": len(archived), "shed": len(shed),
+                "hours": round(heures, 3), "ram": len(self.ram_cache),
+                "reinforced_concepts": reinforced["concepts"],
+                "reinforced_relations": reinforced["relations"], **archive}
     
-    def consolidate(self):
-        """Consolidation nocturne."""
+    def consolidate(self) -> Dict[str, Any]:
+        """
+        Consolidation nocturne, par tranches bornées. Les concepts à traiter
+        sont sélectionnés d'un bloc sous le verrou : fréquents (promotion) et
+        porteurs d'une relation faible repérés par un masque vectorisé sur la
+        table des poids ; seuls ceux-là passent par Python. Retourne le nombre
+        de concepts examinés et promus et de relations faibles supprimées.
+        """
         logger.info("🌙 Consolidation du graphe...")
+        threshold = CONFIG["relation_prune_threshold"]
         
-        with self._lock:
-            promoted = 0
-            for concept in self.ram_cache.values():
+        with self._maintenance():
+            with self._locked("consolidate"):
+                self._attach_untracked()
+                frequent = [cid for cid, concept in self.ram_cache.items()
+                            if concept.access_count > CONFIG["promotion_threshold"]]
+                weak = self.temperatures.weak_relations(threshold)
+                ids = list(dict.fromkeys(itertools.chain(frequent, weak)))
+            promoted = []
+            pruned = 0
+            
+            def consolidate_one(cid: str):
+                nonlocal pruned
+                concept = self.ram_cache.get(cid)
+                if concept is None:
+                    return
                 # Promotion des concepts fréquents
                 if concept.access_count > CONFIG["promotion_threshold"]:
-                    concept.temperature = min(1.0, concept.temperature + 0.2)
+                    temperature = self.temperatures.get(cid)
+                    if temperature is None:
+                        temperature = concept.temperature
+                    self.temperatures.set(concept, min(1.0, temperature + 0.2))
                     concept.memoire_type = MemoryType.PERMANENT
-                    promoted += 1
+                    self.temperatures.attach(concept)
+                    self._mark_dirty(concept)
+                    promoted.append(cid)
                 
-                # Nettoyage des relations faibles
-                concept.relations = [
-                    r for r in concept.relations
-                    if r.poids > 0.3 or r.source_info.type.value > 0.7
-                ]
+                # Nettoyage des relations faibles (poids ≤ seuil, source non protégée)
+                keep = self.temperatures.keep_mask(concept, threshold)
+                if keep is None or keep.all():
+                    return
+                self.temperatures.sync(concept)
+                relations = list(concept.relations)
+                kept = list(itertools.compress(relations, keep.tolist()))
+                pruned += len(relations) - len(kept)
+                remaining = {(r.type.value, r.cible) for r in kept}
+                for r in relations:
+                    if (r.type.value, r.cible) not in remaining:
+                        self._relation_index_remove(concept.id, r.type.value, r.cible)
+                concept.relations = kept
+                self.temperatures.attach(concept)
+                self._mark_dirty(concept)
             
-            logger.info(f"  {promoted} concepts promus en permanents")
-            self._save_index()
+            scanned = self._run_sliced(ids, "consolidate", consolidate_one)
+            self._checkpoint_index()
+            if scanned == len(ids):
+                self.last_consolidation = time.time()
+                self._save_maintenance_state()
+        
+        logger.info(f"  {len(promoted)} concepts promus en permanents")
+        return {"scanned": scanned, "promoted": len(promoted), "pruned_relations": pruned}
+    
+    # ------------------------------------------------------------
+    # Chargement en masse
+    # ------------------------------------------------------------
+    
+    def bulk_load(self, entries: Union[Iterable[Dict[str, Any]], Callable[[], Iterable[Dict[str, Any]]]],
+                  source_info: SourceInfo,
+                  progress: Optional[Callable[[Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Charge des entrées de base de connaissances directement dans le niveau
+        disque, sans passer par la RAM ni déclencher d'évictions.
+        
+        `entries` est un itérable ré-itérable ou une fonction retournant un
+        nouvel itérateur (lecture en flux, deux passes) :
+        1. noms, alias et identifiants → table de résolution, cibles des relations ;
+        2. résolution groupée des cibles (base, graphe existant, ou concept créé) ;
+        3. construction et écriture par transactions de bulk_load_batch concepts,
+           relations inverses comprises ; une entrée dont le nom existe déjà
+           dans le graphe est fusionnée dans ce concept (même ID) ;
+        4. index mis à jour en mémoire et compactés une seule fois à la fin.
+        """
+        open_entries = entries if callable(entries) else (lambda: entries)
+        batch_size = CONFIG["bulk_load_batch"]
+        t_start = time.perf_counter()
+        # Passe 1 : table de résolution
+        known: Dict[str, str] = {}  # id, nom ou alias (minuscules) → id
+        entry_ids: List[str] = []
+        merged: Set[str] = set()  # entrées fusionnées dans un concept déjà présent
+        cibles: Set[str] = set()
+        inverse_edges: List[Tuple[str, str, str]] = []  # (source, type inverse, cible brute)
+        for data in open_entries():
+            cid = data.get("id") or self.index_nom.get(data["nom"].lower())
+            if cid is None:
+                cid = f"kb_{uuid.uuid4().hex[:8]}"
+            elif cid in self.ram_cache or self._pending_get(cid) is not None or self.disk.contains(cid):
+                merged.add(cid)
+            entry_ids.append(cid)
+            known[cid] = cid
+            known[data["nom"].lower()] = cid
+            for alias in data.get("aliases", []):
+                known.setdefault(alias.lower(), cid)
+            for rel in data.get("relations", []):
+                cibles.add(rel["cible"])
+                inverse = INVERSE_RELATIONS.get(RelationType(rel["type"]))
+                if inverse:
+                    inverse_edges.append((cid, inverse.value, rel["cible"]))
+        
+        # Résolution groupée des cibles
+        resolved: Dict[str, str] = {}
+        existing: Set[str] = set()
+        placeholders: Dict[str, Concept] = {}
+        for cible in cibles:
+            cid = known.get(cible) or known.get(cible.lower())
+            if cid is None:
+                concept = self.get(cible)
+                if concept is not None:
+                    cid = concept.id
+                    existing.add(cid)
+                else:
+                    concept = Concept(id=f"concept_{uuid.uuid4().hex[:8]}", nom=str(cible),
+                                      nature=ConceptNature.CATEGORIE,
+                                      memoire_type=MemoryType.PERMANENT)
+                    placeholders[concept.id] = concept
+                    cid = concept.id
+            resolved[cible] = cid
+        
+        inverse_by_target: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+        for src, inv_type, cible in inverse_edges:
+            inverse_by_target[resolved[cible]].append((inv_type, src))
+        del inverse_edges
+        
+        stats = {"concepts": 0, "relations": 0, "placeholders": len(placeholders),
+                 "existing_targets": len(existing), "merged": len(merged)}
+        
+        def attach(concept: Concept, rel_type: RelationType, cible: str):
+            if concept.id in merged and concept.relation_position(rel_type, cible) is not None:
+                return
+            concept.relations.append(Relation(type=rel_type, cible=cible, source_info=source_info))
+        
+        def attach_inverses(concept: Concept):
+            for inv_type, src in inverse_by_target.pop(concept.id, ()):
+                attach(concept, RelationType(inv_type), src)
+        
+        def report(notify: bool = True):
+            elapsed = time.perf_counter() - t_start
+            info = dict(stats, elapsed_s=round(elapsed, 2),
+                        concepts_per_s=round(stats["concepts"] / elapsed) if elapsed else 0)
+            if progress and notify:
+                progress(info)
+            return info
+        
+        # Passe 2 : construction et écriture par lots
+        batch: List[Concept] = []
+        for cid, data in zip(entry_ids, open_entries()):
+            concept = self.get(cid) if cid in merged else None
+            if concept is not None:
+                concept.aliases = concept.aliases | frozenset(data.get("aliases", []))
+            else:
+                concept = Concept(
+                    id=cid,
+                    nom=data["nom"],
+                    nature=ConceptNature(data["nature"]),
+                    memoire_type=MemoryType(data.get("memoire_type", "permanent")),
+                    aliases=set(data.get("aliases", []))
+                )
+            for rel in data.get("relations", []):
+                attach(concept, RelationType(rel["type"]), resolved[rel["cible"]])
+            for prop, val in data.get("proprietes", {}).items():
+                concept.proprietes[prop] = Propriete(nom=prop, valeur=val["valeur"],
+                                                     type=val.get("type", "texte"),
+                                                     source_info=source_info)
+            attach_inverses(concept)
+            batch.append(concept)
+            if len(batch) >= batch_size:
+                self._bulk_write(batch, stats)
+                batch = []
+                report()
+        
+        for concept in placeholders.values():
+            attach_inverses(concept)
+            batch.append(concept)
+        self._bulk_write(batch, stats)
+        
+        # Relations inverses vers des concepts déjà présents dans le graphe
+        with self._lock:
+            for target_id in existing:
+                concept = self.get(target_id)
+                self.temperatures.sync(concept)
+                for inv_type, src in inverse_by_target.pop(target_id, ()):
+                    concept.add_relation(RelationType(inv_type), src, source_info)
+                    self._relation_index_add(target_id, inv_type, src)
+                    stats["relations"] += 1
+                self.temperatures.attach(concept)
+                self._mark_dirty(concept)
+            
+            self.disk.flush()
+            self._notify_change(None)
+        
+        # Index construits en mémoire : une seule compaction
+        self._save_index()
+        return report(notify=False)
+    
+    def knowledge_base_loaded(self, name: str, filepath: Path) -> Optional[Dict[str, Any]]:
+        """
+        Statistiques du dernier chargement de la base `name` si `filepath` n'a
+        pas changé depuis (même taille et mtime, ou même SHA-256) ; None sinon.
+        """
+        entry = self.knowledge_bases.get(name)
+        if entry is None or entry["path"] != str(filepath) or not same_source(entry["source"], filepath):
+            return None
+        if entry["source"][1] != os.stat(filepath).st_mtime_ns:
+            # Fichier touché mais inchangé : éviter de le rehacher au prochain démarrage
+            self.record_knowledge_base(name, filepath, file_signature(filepath, digest=True),
+                                       entry["stats"])
+        return entry["stats"]
+    
+    def record_knowledge_base(self, name: str, filepath: Path, source: List[Any],
+                              stats: Dict[str, Any]):
+        """Mémorise une base chargée ; `source` est la signature relevée avant sa lecture."""
+        self.knowledge_bases[name] = {"path": str(filepath), "source": source, "stats": stats}
+        tmp_path = self.knowledge_bases_path.with_name(self.knowledge_bases_path.name + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(self.knowledge_bases, f)
+        os.replace(tmp_path, self.knowledge_bases_path)
+    
+    def _bulk_write(self, batch: List[Concept], stats: Dict[str, Any]):
+        """Écrit un lot en une transaction puis met à jour les index sans journaliser."""
+        if not batch:
+            return
+        records = [concept.to_record() for concept in batch]
+        touched: Set[str] = set()
+        # Aucune écriture différée ne doit s'intercaler (version plus ancienne)
+        with self._flush_lock:
+            self._log_changes(concept.id for concept in batch)
+            self.disk.save_records(records)
+            with self._lock:
+                for concept in batch:
+                    concept.storage_level = StorageLevel.DISK
+                    previous = self.ram_cache.pop(concept.id, None)
+                    if previous is not None:
+                        self.temperatures.detach(previous)
+                    self._dirty.pop(concept.id, None)
+                    self._dirty_since.pop(concept.id, None)
+                    
+                    self.index_nom[concept.nom.lower()] = concept.id
+                    self._filter_add(concept.nom.lower())
+                    for alias in concept.aliases:
+                        self.index_alias[alias.lower()] = concept.id
+                        self._filter_add(alias.lower())
+                    self._filter_add(concept.id)
+                    self.index_nature.setdefault(concept.nature.value, set()).add(concept.id)
+                    for nom in concept.proprietes:
+                        self.index_propriete.setdefault(nom, set()).add(concept.id)
+                    for rel_type, cible in concept.relation_keys():
+                        self.index_relation.setdefault(rel_type, {}).setdefault(
+                            concept.id, set()).add(cible)
+                        self.index_reverse.setdefault(cible, set()).add((concept.id, rel_type))
+                        touched.add(rel_type)
+                    stats["relations"] += len(concept.relations)
+                # Fermetures transitives en cache périmées pour ces types
+                for rel_type in touched:
+                    self._relation_generations[rel_type] += 1
+        stats["concepts"] += len(batch)
+    
+    # ------------------------------------------------------------
+    # Instantanés, export incrémental et restauration
+    # ------------------------------------------------------------
+    
+    def _log_changes(self, ids: Iterable[str]):
+        """Note des concepts écrits ou supprimés sur disque (seulement depuis le premier instantané)."""
+        if not self._log_enabled:
+            return
+        data = "".join(f"{cid}\n" for cid in ids)
+        if not data:
+            return
+        with self._changes_lock:
+            if self._changes_file is None:
+                self._changes_file = open(self.changes_path, 'a', encoding='utf-8')
+            self._changes_file.write(data)
+            self._changes_file.flush()
+    
+    def _rotate_changes(self) -> Path:
+        """
+        Met de côté les changements notés depuis la coupure précédente
+        (changes.log.pending, complété si un export a échoué entre-temps) ;
+        les suivants repartent dans un journal vide.
+        """
+        pending = self.changes_path.with_name(self.changes_path.name + ".pending")
+        with self._changes_lock:
+            if self._changes_file is not None:
+                self._changes_file.close()
+                self._changes_file = None
+            if self.changes_path.exists():
+                if pending.exists():
+                    with open(pending, 'ab') as dst, open(self.changes_path, 'rb') as src:
+                        shutil.copyfileobj(src, dst)
+                    self.changes_path.unlink()
+                else:
+                    os.replace(self.changes_path, pending)
+        return pending
+    
+    def _sync_for_snapshot(self, cid: str):
+        concept = self.ram_cache.get(cid)
+        if concept is not None and self.temperatures.sync(concept):
+            self._mark_dirty(concept, notify=False)
+    
+    def snapshot(self, dest: Path) -> Dict[str, Any]:
+        """
+        Instantané complet du graphe dans le répertoire `dest`, pendant que le
+        graphe continue de servir (voir _snapshot). Devient la référence des
+        exports incrémentaux suivants.
+        """
+        return self._snapshot(Path(dest), incremental=False)
+    
+    def export_changes(self, dest: Path) -> Dict[str, Any]:
+        """
+        Export incrémental dans `dest` : concepts écrits ou supprimés depuis
+        l'instantané ou l'export précédent, fin des segments d'archives ajoutée
+        depuis, index et états complets. Il pointe vers son prédécesseur et en
+        devient la référence.
+        """
+        if self.snapshot_state is None:
+            raise ValueError("Aucun instantané de référence : appeler snapshot() d'abord")
+        return self._snapshot(Path(dest), incremental=True)
+    
+    def _snapshot(self, dest: Path, incremental: bool) -> Dict[str, Any]:
+        """
+        Image cohérente à un instant (la coupure), prise en trois temps :
+        1. températures et poids des concepts en RAM recopiés par tranches,
+           écriture différée vidée ;
+        2. coupure sous le verrou du graphe, brève : concepts encore modifiés
+           sérialisés, lecture figée du niveau disque (transaction SQLite),
+           fichiers d'index et segments d'archives ouverts avec leur taille,
+           journal des changements tourné. Aucun oubli ni rappel ne s'y
+           intercale, aucune compaction d'index n'est en cours ;
+        3. copie hors verrou vers `dest` (concepts.sqlite, index/, archives/,
+           états), manifest.json écrit en dernier.
+        Avec le backend "files", l'écriture différée reste suspendue pendant la
+        copie (les lectures continuent). Retourne les durées et volumes.
+        """
+        if dest.exists() and any(dest.iterdir()):
+            raise ValueError(f"Destination d'instantané non vide : {dest}")
+        (dest / "index").mkdir(parents=True, exist_ok=True)
+        (dest / "archives").mkdir(exist_ok=True)
+        base = self.snapshot_state if incremental else None
+        t_start = time.perf_counter()
+        timings: Dict[str, float] = {}
+        
+        try:
+            with ExitStack() as stack:
+                with self._lock:
+                    ram_ids = list(self.ram_cache)
+                self._run_sliced(ram_ids, "snapshot", self._sync_for_snapshot)
+                self.flush_dirty()
+                timings["prepare_s"] = time.perf_counter() - t_start
+                
+                with self._snapshot_lock:
+                    t0 = time.perf_counter()
+                    if not self.disk.concurrent_snapshot:
+                        stack.enter_context(self._flush_lock)
+                    cut_flush = self._flush_lock if self.disk.concurrent_snapshot else nullcontext()
+                    with cut_flush, self._compact_lock, self._locked("snapshot"):
+                        cut_at = time.time()
+                        overlay = {}
+                        for cid, concept in self._dirty.items():
+                            self.temperatures.sync(concept)
+                            overlay[cid] = SQLiteDiskBackend.encode(concept)
+                        rows = stack.enter_context(self.disk.frozen())
+                        journal = self.index_journal
+                        index_files = []
+                        for path in (journal.snapshot_path, journal.journal_path, journal.rotated_path,
+                                     self.signature_snapshot_path):
+                            try:
+                                f = stack.enter_context(open(path, 'rb'))
+                            except FileNotFoundError:
+                                continue
+                            index_files.append((path.name, f, os.fstat(f.fileno()).st_size))
+                        self._log_enabled = True
+                        changes_path = self._rotate_changes()
+                        states = {
+                            "maintenance.json": {"last_cooling": self.last_cooling,
+                                                 "last_consolidation": self.last_consolidation},
+                            "knowledge_bases.json": self.knowledge_bases,
+                        }
+                    segments, segment_files, archive_index = self.archive.freeze(stack)
+                    timings["cut_ms"] = (time.perf_counter() - t0) * 1000
+                
+                t0 = time.perf_counter()
+                db = sqlite3.connect(str(dest / "concepts.sqlite"), isolation_level=None)
+                db.execute("PRAGMA journal_mode=OFF")
+                db.execute("PRAGMA synchronous=OFF")
+                db.execute("CREATE TABLE concepts (id TEXT PRIMARY KEY, data BLOB NOT NULL) WITHOUT ROWID")
+                db.execute("CREATE TABLE deleted (id TEXT PRIMARY KEY) WITHOUT ROWID")
+                db.execute("BEGIN")
+                changed: Set[str] = set()
+                if incremental:
+                    with open(changes_path, encoding='utf-8') if changes_path.exists() else nullcontext(()) as f:
+                        changed = {line.rstrip("\n") for line in f}
+                    changed.discard("")
+                    source = rows(list(changed - overlay.keys()))
+                else:
+                    source = rows()
+                found: Set[str] = set()
+                for chunk in iter(lambda: list(itertools.islice(source, 1000)), []):
+                    db.executemany("INSERT OR REPLACE INTO concepts (id, data) VALUES (?, ?)", chunk)
+                    found.update(cid for cid, _ in chunk)
+                    time.sleep(0)  # cède le GIL aux lectures entre deux lots
+                db.executemany("INSERT OR REPLACE INTO concepts (id, data) VALUES (?, ?)", overlay.items())
+                deleted = []
+                if incremental:
+                    deleted = [(cid,) for cid in changed - found - overlay.keys()]
+                    db.executemany("INSERT INTO deleted (id) VALUES (?)", deleted)
+                db.execute("COMMIT")
+                concepts = db.execute("SELECT COUNT(*) FROM concepts").fetchone()[0]
+                db.close()
+                timings["concepts_s"] = time.perf_counter() - t0
+                
+                t0 = time.perf_counter()
+                for name, f, size in index_files:
+                    _copy_range(f, dest / "index" / name, 0, size)
+                base_segments = {int(n): size for n, size in base["archive_segments"].items()} if base else {}
+                copied_segments = {}
+                for segment, size in segments.items():
+                    start = base_segments.get(segment, 0)
+                    if start > size:
+                        start = 0
+                    if segment in segment_files and size > start:
+                        _copy_range(segment_files[segment], dest / "archives" / f"segment_{segment:06d}.log",
+                                    start, size)
+                    copied_segments[segment] = [start, size]
+                (dest / "archives" / "archive_index.json").write_text(archive_index, encoding="utf-8")
+                for name, state in states.items():
+                    (dest / name).write_text(json.dumps(state), encoding="utf-8")
+                timings["files_s"] = time.perf_counter() - t0
+        except BaseException:
+            if self.snapshot_state is None:
+                self._log_enabled = False
+            raise
+        
+        snapshot_id = uuid.uuid4().hex[:12]
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "id": snapshot_id,
+            "kind": "incremental" if incremental else "full",
+            "created": cut_at,
+            "base": base["path"] if base else None,
+            "base_id": base["id"] if base else None,
+            "disk_backend": CONFIG["disk_backend"],
+            "concepts": concepts,
+            "deleted": len(deleted),
+            "archive_segments": copied_segments,
+        }
+        _write_json_atomic(dest / SNAPSHOT_MANIFEST, manifest)
+        self.snapshot_state = {"id": snapshot_id, "path": str(dest.resolve()), "created": cut_at,
+                               "archive_segments": segments}
+        _write_json_atomic(self.snapshot_state_path, self.snapshot_state)
+        changes_path.unlink(missing_ok=True)
+        
+        elapsed = time.perf_counter() - t_start
+        stats = {"id": snapshot_id, "kind": manifest["kind"], "concepts": concepts,
+                 "deleted": len(deleted), "copied": len(found) + len(overlay),
+                 "bytes": sum(p.stat().st_size for p in dest.rglob("*") if p.is_file()),
+                 "elapsed_s": round(elapsed, 3)}
+        stats.update({name: round(value, 3) for name, value in timings.items()})
+        logger.info(f"Instantané {manifest['kind']} {snapshot_id} : {concepts} concepts en {elapsed:.2f}s "
+                     f"(coupure {timings['cut_ms']:.1f} ms)")
+        return stats
+    
+    @classmethod
+    def restore(cls, source: Path, data_path: Path, archive_dir: Optional[Path] = None) -> Dict[str, Any]:
+        """
+        Reconstitue un graphe (répertoire `data_path` et archives, tous deux
+        vides ou absents) tel qu'il était à la coupure de l'instantané ou de
+        l'export `source` : la chaîne des exports jusqu'à l'instantané complet
+        est rejouée. Avec SQLite, la base de l'instantané est copiée telle
+        quelle puis les exports y sont appliqués en SQL. Le graphe restauré
+        prend `source` comme référence de ses exports incrémentaux.
+        """
+        t_start = time.perf_counter()
+        chain = []
+        path = Path(source)
+        while True:
+            manifest = read_snapshot_manifest(path)
+            chain.append((path, manifest))
+            if manifest["kind"] == "full":
+                break
+            path = Path(manifest["base"])
+        chain.reverse()
+        
+        data_path = Path(data_path)
+        archive_dir = Path(archive_dir if archive_dir is not None else CONFIG["archive_dir"])
+        for target in (data_path, archive_dir):
+            if target.exists() and any(target.iterdir()):
+                raise ValueError(f"Destination de restauration non vide : {target}")
+            target.mkdir(parents=True, exist_ok=True)
+        
+        # Concepts
+        db_path = data_path / "disk.sqlite"
+        shutil.copyfile(chain[0][0] / "concepts.sqlite", db_path)
+        conn = sqlite3.connect(str(db_path), isolation_level=None)
+        for path, _ in chain[1:]:
+            conn.execute("ATTACH DATABASE ? AS delta", (str(path / "concepts.sqlite"),))
+            conn.execute("BEGIN")
+            conn.execute("INSERT OR REPLACE INTO concepts (id, data) SELECT id, data FROM delta.concepts")
+            conn.execute("DELETE FROM concepts WHERE id IN (SELECT id FROM delta.deleted)")
+            conn.execute("COMMIT")
+            conn.execute("DETACH DATABASE delta")
+        concepts = conn.execute("SELECT COUNT(*) FROM concepts").fetchone()[0]
+        conn.close()
+        if CONFIG["disk_backend"] == "files":
+            restored = SQLiteDiskBackend(db_path)
+            migrate_disk_backend(restored, FileDiskBackend(data_path / "disk"))
+            restored.close()
+            for leftover in data_path.glob("disk.sqlite*"):
+                leftover.unlink()
+        
+        # Index et états : ceux du dernier maillon, complets
+        last_path, last = chain[-1]
+        for name in ("index.json.gz", "index.journal", "index.journal.1", "signatures.snapshot"):
+            if (last_path / "index" / name).exists():
+                shutil.copyfile(last_path / "index" / name, data_path / name)
+        for name in ("maintenance.json", "knowledge_bases.json"):
+            if (last_path / name).exists():
+                shutil.copyfile(last_path / name, data_path / name)
+        
+        # Archives : segments complets puis fins ajoutées par chaque export
+        for path, manifest in chain:
+            for segment, (start, end) in manifest["archive_segments"].items():
+                part = path / "archives" / f"segment_{int(segment):06d}.log"
+                if end <= start or not part.exists():
+                    continue
+                target = archive_dir / part.name
+                with open(target, 'r+b' if start and target.exists() else 'wb') as out, open(part, 'rb') as src:
+                    out.truncate(start)
+                    out.seek(start)
+                    shutil.copyfileobj(src, out)
+        kept = {f"segment_{int(segment):06d}.log" for segment in last["archive_segments"]}
+        for segment_path in archive_dir.glob("segment_*.log"):
+            if segment_path.name not in kept:
+                segment_path.unlink()
+        shutil.copyfile(last_path / "archives" / "archive_index.json", archive_dir / "archive_index.json")
+        
+        _write_json_atomic(data_path / "snapshot.json", {
+            "id": last["id"], "path": str(last_path.resolve()), "created": last["created"],
+            "archive_segments": {segment: end for segment, (_, end) in last["archive_segments"].items()},
+        })
+        elapsed = time.perf_counter() - t_start
+        logger.info(f"Restauration de {last['id']} ({len(chain)} maillon(s)) : {concepts} concepts "
+                    f"en {elapsed:.2f}s")
+        return {"id": last["id"], "chain": len(chain), "concepts": concepts,
+                "elapsed_s": round(elapsed, 3)}
+    
+    def _stop_writer(self):
+        self._writer_stop.set()
+        self._writer_wake.set()
+        if self._writer_thread.is_alive():
+            self._writer_thread.join(timeout=5)
+    
+    def close(self):
+        """
+        Arrête l'écrivain différé, écrit les données en attente (dont les
+        températures et poids modifiés des concepts en RAM) et ferme le
+        backend disque.
+        """
+        self._recall_pool.shutdown(wait=True)
+        self._stop_writer()
+        with self._lock:
+            for concept in self.ram_cache.values():
+                if self.temperatures.sync(concept):
+                    self._mark_dirty(concept, notify=False)
+        self.flush()
+        with self._lock:
+            self.archive.close()
+            self.index_journal.close()
+            with self._changes_lock:
+                if self._changes_file is not None:
+                    self._changes_file.close()
+                    self._changes_file = None
+            self.disk.close()
+            if CONFIG["startup_snapshot"]:
+                self._save_startup_snapshot()
+            self._save_signature_indexes()
+
+# ============================================================
+# PLANIFICATEUR DE MAINTENANCE
+# ============================================================
+
+MAINTENANCE_JOBS = ("cool_down", "consolidate")
+
+class MaintenanceScheduler:
+    """
+    Fil unique de maintenance du graphe, piloté par événements : il dort
+    jusqu'à la prochaine échéance ou jusqu'à un réveil explicite (pression
+    RAM, phase de sommeil, demande manuelle, arrêt).
+    
+    - refroidissement : toutes les cooling_interval_hours depuis le dernier
+      (date conservée d'un démarrage à l'autre), ou dès que la RAM dépasse
+      cooling_ram_pressure, au plus une fois par cooling_pressure_min_interval_s ;
+    - consolidation : au créneau nightly_hour (rattrapé au démarrage s'il a
+      été manqué), ou à l'entrée dans une phase de consolidation_phases si la
+      dernière date d'au moins consolidation_min_interval_h.
+    
+    Chaque exécution est chronométrée et gardée dans `runs`.
+    """
+    
+    def __init__(self, graph: KnowledgeGraph):
+        self.graph = graph
+        self.phase: Optional[str] = None
+        self.runs: deque = deque(maxlen=CONFIG["maintenance_history"])
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._requested: deque = deque()  # (job, déclencheur) demandés hors échéance
+        self._pressure_ready = 0.0  # date de réarmement du déclencheur de pression
+    
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self.graph.maintenance_cancel.clear()
+        self._thread = threading.Thread(target=self._loop, name="maintenance", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Arrête le fil : une maintenance en cours s'interrompt à la fin de sa
+        tranche. Retourne False si le fil ne s'est pas terminé à temps.
+        """
+        self._stop.set()
+        self.graph.maintenance_cancel.set()
+        self.graph.pressure_event = None
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(CONFIG["maintenance_stop_timeout_s"] if timeout is None else timeout)
+            if self._thread.is_alive():
+                logger.warning("Maintenance toujours en cours à l'arrêt")
+                return False
+            self._thread = None
+        self.graph.maintenance_cancel.clear()
+        return True
+    
+    def request(self, job: str, trigger: str = "manual"):
+        """Demande une exécution immédiate de `job` ("cool_down" ou "consolidate")."""
+        if job not in MAINTENANCE_JOBS:
+            raise ValueError(f"Maintenance inconnue: {job}")
+        self._requested.append((job, trigger))
+        self._wake.set()
+    
+    def on_phase(self, phase: Union[str, bytes, Dict[str, Any]]):
+        """
+        Reçoit le signal circa/phase ("deep_sleep", "light_sleep", "dream",
+        "wake"), brut ou sous forme de charge JSON {"phase": ...}. Par exemple,
+        avec un abonné zenoh :
+        
+            session.declare_subscriber("circa/phase",
+                                       lambda s: core.on_phase(s.payload.to_bytes()))
+        """
+        if isinstance(phase, (bytes, bytearray)):
+            phase = phase.decode()
+        if isinstance(phase, str) and phase.lstrip().startswith("{"):
+            phase = json.loads(phase)
+        if isinstance(phase, dict):
+            phase = phase.get("phase")
+        if not phase or phase == self.phase:
+            return
+        self.phase = phase
+        if phase in CONFIG["consolidation_phases"]:
+            self._requested.append(("consolidate", "sleep_phase"))
+            self._wake.set()
+    
+    # ------------------------------------------------------------
+    # Échéances
+    # ------------------------------------------------------------
+    
+    def next_cooling(self) -> float:
+        return self.graph.last_cooling + CONFIG["cooling_interval_hours"] * 3600
+    
+    def next_consolidation(self, now: Optional[float] = None) -> float:
+        """Créneau nightly_hour le plus récent s'il n'a pas été couvert, sinon le suivant."""
+        now = time.time() if now is None else now
+        slot = datetime.fromtimestamp(now).replace(hour=CONFIG["nightly_hour"], minute=0,
+                                                   second=0, microsecond=0)
+        if slot.timestamp() > now:
+            slot -= timedelta(days=1)
+        if self.graph.last_consolidation < slot.timestamp():
+            return slot.timestamp()
+        return (slot + timedelta(days=1)).timestamp()
+    
+    def _due(self, now: float) -> List[Tuple[str, str]]:
+        jobs = []
+        while self._requested:
+            job, trigger = self._requested.popleft()
+            if (trigger == "sleep_phase" and now - self.graph.last_consolidation
+                    < CONFIG["consolidation_min_interval_h"] * 3600):
+                continue
+            if all(job != queued for queued, _ in jobs):
+                jobs.append((job, trigger))
+        queued = {job for job, _ in jobs}
+        if "cool_down" not in queued:
+            if now >= self.next_cooling():
+                jobs.append(("cool_down", "interval"))
+            elif (now >= self._pressure_ready
+                  and self.graph.ram_occupancy() >= CONFIG["cooling_ram_pressure"]):
+                jobs.append(("cool_down", "ram_pressure"))
+        if "consolidate" not in queued and now >= self.next_consolidation(now):
+            jobs.append(("consolidate", "nightly"))
+        return jobs
+    
+    def _loop(self):
+        while not self._stop.is_set():
+            self._wake.clear()
+            for job, trigger in self._due(time.time()):
+                if self._stop.is_set():
+                    return
+                self._run(job, trigger)
+            
+            # Le déclencheur de pression n'est armé qu'après l'écart minimal,
+            # sinon chaque insertion en RAM réveillerait le fil
+            now = time.time()
+            deadlines = [self.next_cooling(), self.next_consolidation(now)]
+            if now >= self._pressure_ready:
+                self.graph.pressure_event = self._wake
+            else:
+                self.graph.pressure_event = None
+                deadlines.append(self._pressure_ready)
+            if self._stop.is_set():
+                self.graph.pressure_event = None
+                return
+            # Échéances en heure murale : réévaluées au moins toutes les heures
+            self._wake.wait(min(max(0.0, min(deadlines) - now), 3600.0))
+    
+    def _run(self, job: str, trigger: str):
+        graph = self.graph
+        occupancy = graph.ram_occupancy()
+        started = time.time()
+        t0 = time.perf_counter()
+        try:
+            if job == "cool_down":
+                pressure = occupancy >= CONFIG["cooling_ram_pressure"]
+                result = graph.cool_down(CONFIG["cooling_ram_target"] if pressure else None)
+                if pressure:
+                    self._pressure_ready = time.time() + CONFIG["cooling_pressure_min_interval_s"]
+            else:
+                result = graph.consolidate()
+        except Exception as e:
+            logger.exception(f"Échec de la maintenance {job}")
+            result = {"error": str(e)}
+            self._stop.wait(CONFIG["cooling_pressure_min_interval_s"])  # pas de reprise en boucle serrée
+        duration_ms = round((time.perf_counter() - t0) * 1000, 3)
+        self.runs.append({"job": job, "trigger": trigger, "started": started,
+                          "duration_ms": duration_ms, "ram_occupancy": round(occupancy, 4),
+                          "cancelled": graph.maintenance_cancel.is_set(), **result})
+        logger.debug(f"Maintenance {job} ({trigger}) : {duration_ms} ms")
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Durées par tâche et par déclencheur, dernières exécutions et prochaines échéances."""
+        runs = list(self.runs)
+        jobs = {}
+        for job in MAINTENANCE_JOBS:
+            done = [r for r in runs if r["job"] == job]
+            if not done:
+                jobs[job] = None
+                continue
+            triggers = defaultdict(int)
+            for r in done:
+                triggers[r["trigger"]] += 1
+            jobs[job] = {"runs": len(done), "triggers": dict(triggers),
+                         **_latency_stats([r["duration_ms"] / 1000 for r in done])}
+        now = time.time()
+        return {
+            "jobs": jobs,
+            "recent": runs[-10:],
+            "phase": self.phase,
+            "ram_occupancy": round(self.graph.ram_occupancy(), 4),
+            "next_cool_down_in_s": round(self.next_cooling() - now, 1),
+            "next_consolidation_in_s": round(self.next_consolidation(now) - now, 1),
+        }
 
 # ============================================================
 # SENTENCE BUILDER
 # ============================================================
 
 class SentenceBuilder:
-    """Construit du texte à partir d'intents en utilisant le vocabulaire connu."""
+    """
+    Construit du texte à partir d'intents en utilisant le vocabulaire connu.
+    
+    Le cache est adressé par contenu : la clé ne retient que ce qui détermine
+    le texte (type, sous-intent, attributs lus par les constructeurs, humeur
+    du Gem pour le social), jamais l'identifiant de l'intent. Une entrée est
+    invalidée quand un concept dont elle cite le nom (ou un alias) change.
+    """
+    
+    # Attributs lus par les _build_* ; les autres n'entrent pas dans la clé
+    TEXT_ATTRIBUTES = ("time", "person", "events", "is_a", "word", "suggestion",
+                       "original", "possibilities")
+    # Champs d'attributs qui nomment des concepts du graphe
+    CONCEPT_FIELDS = ("name", "sujet", "categorie")
     
     def __init__(self, graph: KnowledgeGraph, gem: Gem):
         self.graph = graph
         self.gem = gem
-        self.cache: OrderedDict[str, str] = OrderedDict()
+        self.cache: OrderedDict[Tuple, Tuple[str, Tuple[str, ...]]] = OrderedDict()  # clé → (texte, noms)
         self.cache_size = CONFIG["sentence_cache_size"]
+        self._dependents: Dict[str, Set[Tuple]] = {}  # nom de concept → clés
+        self._cache_lock = threading.Lock()
+        self.cache_stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+        graph.add_change_listener(self._on_concept_changed)
+    
+    @staticmethod
+    def _canonical(name: str, value: Any) -> Any:
+        """Forme canonique et hachable d'une valeur d'attribut."""
+        if name == "time" and isinstance(value, str):
+            return value[11:16]  # seules l'heure et la minute sont dites
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            return value
+        if isinstance(value, dict):
+            items = tuple(sorted(value.items()))
+            try:
+                hash(items)
+                return items
+            except TypeError:
+                pass
+        return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    
+    def _cache_key(self, intent: StructuredIntent) -> Tuple:
+        intent_type = intent.semantic.get("type")
+        attributes = intent.attributes
+        if attributes:
+            attributes = tuple(
+                (name, self._canonical(name, attributes[name].value))
+                for name in self.TEXT_ATTRIBUTES if name in attributes
+            )
+        else:
+            attributes = ()
+        humeur = self.gem.humeur_actuelle if intent_type == IntentType.SOCIAL else None
+        return (intent_type, intent.semantic.get("sub_intent"), humeur, attributes)
+    
+    def _concept_names(self, intent: StructuredIntent) -> Tuple[str, ...]:
+        """Noms de concepts cités par les attributs (dépendances de l'entrée)."""
+        names = []
+        for name in ("person", "word", "is_a"):
+            attr = intent.attributes.get(name)
+            if attr is None:
+                continue
+            value = attr.value
+            if isinstance(value, str):
+                names.append(value.lower())
+            elif isinstance(value, dict):
+                names.extend(str(value[f]).lower() for f in self.CONCEPT_FIELDS if f in value)
+        return tuple(names)
+    
+    def _on_concept_changed(self, concept: Optional[Concept]):
+        """Écouteur du graphe : retire les entrées qui citent ce concept."""
+        with self._cache_lock:
+            if concept is None:
+                self.cache_stats["invalidations"] += len(self.cache)
+                self.cache.clear()
+                self._dependents.clear()
+                return
+            for name in (concept.nom.lower(), *(alias.lower() for alias in concept.aliases)):
+                for key in self._dependents.pop(name, ()):
+                    if self.cache.pop(key, None) is not None:
+                        self.cache_stats["invalidations"] += 1
+    
+    def _cache_put(self, key: Tuple, texte: str, names: Tuple[str, ...]):
+        with self._cache_lock:
+            self.cache[key] = (texte, names)
+            for name in names:
+                self._dependents.setdefault(name, set()).add(key)
+            while len(self.cache) > self.cache_size:
+                old_key, (_, old_names) = self.cache.popitem(last=False)
+                self.cache_stats["evictions"] += 1
+                for name in old_names:
+                    keys = self._dependents.get(name)
+                    if keys is not None:
+                        keys.discard(old_key)
+                        if not keys:
+                            del self._dependents[name]
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Succès, échecs, évictions et invalidations du cache de phrases."""
+        stats = dict(self.cache_stats)
+        stats["size"] = len(self.cache)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total, 3) if total else 0.0
+        return stats
     
     def build(self, intent: StructuredIntent) -> Optional[str]:
         """Construit une phrase à partir d'un intent."""
         
         # Vérifier le cache
-        cache_key = f"{intent.id}_{intent.semantic.get('sub_intent')}"
-        if cache_key in self.cache:
-            self.cache.move_to_end(cache_key)
-            return self.cache[cache_key]
+        cache_key = self._cache_key(intent)
+        with self._cache_lock:
+            entry = self.cache.get(cache_key)
+            if entry is not None:
+                self.cache.move_to_end(cache_key)
+                self.cache_stats["hits"] += 1
+                return entry[0]
+            self.cache_stats["misses"] += 1
         
         # Construire selon le type
         if intent.semantic.get("type") == IntentType.REPONSE:
@@ -802,10 +5041,7 @@ class SentenceBuilder:
             texte = self._build_generic(intent)
         
         if texte:
-            # Mettre en cache
-            self.cache[cache_key] = texte
-            if len(self.cache) > self.cache_size:
-                self.cache.popitem(last=False)
+            self._cache_put(cache_key, texte, self._concept_names(intent))
         
         return texte
     
@@ -823,6 +5059,14 @@ class SentenceBuilder:
             if person:
                 return f"{person.value['name']} est {person.value.get('relation', 'une personne')}."
         
+        elif sub == "is_a":
+            is_a = intent.attributes.get("is_a")
+            if is_a:
+                sujet, categorie = is_a.value["sujet"], is_a.value["categorie"]
+                if is_a.value["reponse"]:
+                    return f"Oui, {sujet} est bien dans la catégorie {categorie}."
+                return f"Pas à ma connaissance : je ne relie pas {sujet} à {categorie}."
+        
         elif sub == "facts":
             events = intent.attributes.get("events")
             if events and events.value:
@@ -891,10 +5135,112 @@ class SentenceBuilder:
     def _build_generic(self, intent: StructuredIntent) -> str:
         return "D'accord."
 
+# ============================================================
+# ROUTAGE DES INTENTS
+# ============================================================
+
+# "est-ce qu'un chat est un animal ?", "le chat est-il un animal ?"
+IS_A_PATTERN = re.compile(
+    r"^(?:est-ce qu(?:e |'))?(?:un |une |le |la |l'|les )?(.+?) est(?:-il|-elle)? "
+    r"(?:un |une |des )(.+?)\s*\?$"
+)
+PERSON_PATTERN = re.compile(r"qui est ([\w\s]+?)\s*\?*$", re.IGNORECASE)
+# "qui" en tant que mot : pas "requin", "coquillage", "équipe"
+PERSON_QUESTION_PATTERN = re.compile(r"\bqui\b")
+
+# (type, sous-intent, déclencheur) par ordre de priorité : tuple de mots-clés
+# (sous-chaînes) ou expression régulière compilée ; les questions finissent par "?"
+QUESTION_ROUTES = [
+    ("question", "time", ("heure",)),
+    ("question", "person", PERSON_QUESTION_PATTERN),
+    ("question", "saison", ("saison",)),
+    ("question", "is_a", IS_A_PATTERN),
+]
+STATEMENT_ROUTES = [
+    ("social", "greeting", ("bonjour", "salut", "coucou")),
+    ("social", "farewell", ("au revoir", "bye")),
+    ("social", "thanks", ("merci",)),
+]
+
+class IntentRouter:
+    """
+    Routage texte → (type, sous-intent) par tables de règles ordonnées,
+    préparées une fois : mots-clés testés par recherche de sous-chaîne (en C),
+    expressions régulières précompilées ; la première règle applicable
+    l'emporte. Les textes déjà routés sont mémorisés (intent_route_memo).
+    """
+    
+    def __init__(self, questions: List[Tuple[str, str, Any]] = QUESTION_ROUTES,
+                 statements: List[Tuple[str, str, Any]] = STATEMENT_ROUTES,
+                 question_default: Tuple[str, str] = ("question", "general"),
+                 statement_default: Tuple[str, str] = ("information", "statement")):
+        self._questions = (self._compile(questions), question_default)
+        self._statements = (self._compile(statements), statement_default)
+        self._memo: Dict[str, Tuple[str, str]] = {}
+        self.memo_size = CONFIG["intent_route_memo"]
+    
+    @staticmethod
+    def _compile(routes: List[Tuple[str, str, Any]]) -> List[Tuple[Optional[Tuple[str, ...]], Any, Tuple[str, str]]]:
+        rules = []
+        for intent_type, sub_intent, trigger in routes:
+            if isinstance(trigger, re.Pattern):
+                rules.append((None, trigger.search, (intent_type, sub_intent)))
+            else:
+                rules.append((tuple(trigger), None, (intent_type, sub_intent)))
+        return rules
+    
+    def route(self, text_lower: str) -> Tuple[str, str]:
+        """(type, sous-intent) d'un texte déjà en minuscules."""
+        target = self._memo.get(text_lower)
+        if target is not None:
+            return target
+        rules, target = self._questions if text_lower.endswith("?") else self._statements
+        for keywords, search, rule_target in rules:
+            if keywords is not None:
+                for keyword in keywords:
+                    if keyword in text_lower:
+                        break
+                else:
+                    continue
+            elif not search(text_lower):
+                continue
+            target = rule_target
+            break
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[text_lower] = target
+        return target
+
+# Sémantique des réponses, par gabarit ; copiée à chaque réponse
+RESPONSE_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "time": {"intent": "answer", "sub_intent": "time", "type": IntentType.REPONSE, "confidence": 1.0},
+    "saison": {"intent": "answer", "sub_intent": "saison", "type": IntentType.REPONSE, "confidence": 0.95},
+    "is_a": {"intent": "answer", "sub_intent": "is_a", "type": IntentType.REPONSE, "confidence": 0.9},
+    "person_info": {"intent": "answer", "sub_intent": "person_info", "type": IntentType.REPONSE,
+                    "confidence": 0.9},
+    "unknown_person": {"intent": "clarification", "sub_intent": "unknown_person",
+                       "type": IntentType.CLARIFICATION, "confidence": 0.8},
+    "general": {"intent": "clarification", "sub_intent": "general", "type": IntentType.CLARIFICATION,
+                "confidence": 0.5},
+    "information": {"intent": "acknowledge", "sub_intent": "information", "type": IntentType.REPONSE,
+                    "confidence": 0.9},
+    "greeting": {"intent": "social", "sub_intent": "greeting", "type": IntentType.SOCIAL, "confidence": 1.0},
+    "farewell": {"intent": "social", "sub_intent": "farewell", "type": IntentType.SOCIAL, "confidence": 1.0},
+    "thanks": {"intent": "social", "sub_intent": "thanks", "type": IntentType.SOCIAL, "confidence": 1.0},
+    "default": {"intent": "acknowledge", "sub_intent": "default", "type": IntentType.REPONSE, "confidence": 0.7},
+}
+
+BATCH_STAGES = ("normalize", "resolve", "cognize", "render")
+
+def _short_id(prefix: str) -> str:
+    """Identifiant court (8 hexadécimaux) au format de uuid4().hex[:8], sans uuid4."""
+    return f"{prefix}_{random.getrandbits(32):08x}"
+
 # ============================================================
 # COGNITION CORE PRINCIPAL
 # ============================================================
 
+
 class CognitionCore:
     """
     Cœur cognitif unique.
@@ -908,121 +5254,152 @@ class CognitionCore:
         
         # Charger le Gem
         logger.info(f"📖 Chargement du Gem depuis {gem_path}")
-        self.gem = Gem.from_file(gem_path)
+        self.gem = Gem.from_file(gem_path, self.data_path / "gem.snapshot"
+                                 if CONFIG["startup_snapshot"] else None)
         
         # Graphe de connaissances
         self.graph = KnowledgeGraph(self.data_path / "graph")
         
-        # Sentence builder
+        # Sentence builder et routeur d'intents
         self.builder = SentenceBuilder(self.graph, self.gem)
+        self.router = IntentRouter()
         
-        # Contexte
-        self.current_conversation: Optional[ContextFrame] = None
+        # Contextes de conversation, un par couple (conversation, interlocuteur)
+        self.contexts = ContextStore()
         self.system_context = SystemContext()
         
-        # Threads
+        # Maintenance du graphe (refroidissement, consolidation)
         self._running = False
-        self._cooling_thread = None
-        self._nightly_thread = None
+        self.scheduler = MaintenanceScheduler(self.graph)
+        
+        # Latences de process(), selon qu'une maintenance du graphe tourne ou non
+        self._process_latency = {"idle": deque(maxlen=2000), "maintenance": deque(maxlen=2000)}
+        # process_batch() : durée par énoncé de chaque étape, par lot
+        self._batch_stages = {stage: deque(maxlen=2000) for stage in BATCH_STAGES}
         
         logger.info(f"✅ CognitionCore initialisé - Gem: {self.gem.nom} v{self.gem.version}")
     
-    def load_knowledge_base(self, name: str, filepath: Path):
-        """Charge une base de connaissances depuis un fichier."""
+    def load_knowledge_base(self, name: str, filepath: Path, force: bool = False):
+        """
+        Charge une base de connaissances (JSON ou JSON Lines) en flux, directement
+        sur disque. Une base déjà chargée et inchangée depuis n'est ni relue ni
+        réinsérée, sauf avec `force`.
+        """
+        if not force:
+            loaded = self.graph.knowledge_base_loaded(name, filepath)
+            if loaded is not None:
+                logger.info(f"📚 Base '{name}' inchangée depuis son chargement, ignorée")
+                return loaded
         logger.info(f"📚 Chargement base '{name}' depuis {filepath}")
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+        signature = file_signature(filepath, digest=True)  # relevée avant lecture
         source = SourceInfo(type=SourceWeight.EDUCATIVE)
         
-        for concept_data in data.get("concepts", []):
-            concept = Concept(
-                id=concept_data.get("id", f"kb_{uuid.uuid4().hex[:8]}"),
-                nom=concept_data["nom"],
-                nature=ConceptNature(concept_data["nature"]),
-                memoire_type=MemoryType(concept_data.get("memoire_type", "permanent")),
-                aliases=set(concept_data.get("aliases", []))
-            )
-            self.graph.add_concept(concept)
-            
-            for rel in concept_data.get("relations", []):
-                self.graph.add_relation(
-                    concept.id,
-                    RelationType(rel["type"]),
-                    rel["cible"],
-                    source
-                )
-            
-            for prop, val in concept_data.get("proprietes", {}).items():
-                concept.add_propriete(prop, val["valeur"], val.get("type", "texte"), source)
+        def progress(info: Dict[str, Any]):
+            logger.info(f"  … {info['concepts']} concepts ({info['concepts_per_s']}/s)")
         
-        logger.info(f"  ✓ {len(data.get('concepts', []))} concepts chargés")
+        stats = self.graph.bulk_load(lambda: iter_knowledge_base(filepath), source, progress=progress)
+        
+        logger.info(f"  ✓ {stats['concepts']} concepts chargés "
+                    f"({stats['relations']} relations, {stats['elapsed_s']}s)")
+        self.graph.record_knowledge_base(name, filepath, signature, stats)
+        return stats
     
     def start(self):
-        """Démarre les threads de maintenance."""
+        """Démarre le planificateur de maintenance."""
         self._running = True
-        
-        self._cooling_thread = threading.Thread(
-            target=self._cooling_loop,
-            name="cooling",
-            daemon=True
-        )
-        self._cooling_thread.start()
-        
-        self._nightly_thread = threading.Thread(
-            target=self._nightly_loop,
-            name="nightly",
-            daemon=True
-        )
-        self._nightly_thread.start()
-        
+        self.scheduler.start()
         logger.info("✅ CognitionCore démarré")
     
     def stop(self):
         """Arrête le système."""
         self._running = False
-        if self._cooling_thread:
-            self._cooling_thread.join(timeout=5)
-        if self._nightly_thread:
-            self._nightly_thread.join(timeout=5)
+        self.scheduler.stop()
+        self.graph.flush()
+        stats = self.graph.get_persistence_stats()
+        logger.info(f"  Écriture différée: {stats['flushed_total']} concepts écrits")
+        latency = self.get_latency_stats()
+        if latency["maintenance"]:
+            logger.info(f"  process() p99 pendant maintenance: {latency['maintenance']['p99_ms']} ms")
+        contexts = self.contexts.get_stats()
+        logger.info(f"  Contextes: {contexts['frames']} actifs, {contexts['created']} créés, "
+                    f"{contexts['expired']} expirés, {contexts['evicted']} évincés")
+        cache = self.builder.get_cache_stats()
+        logger.info(f"  Cache de phrases: {cache['hits']} succès / {cache['misses']} échecs")
+        archive = self.graph.get_archive_stats()
+        logger.info(f"  Archives: {archive['entries']} concepts, {archive['bytes']} octets, "
+                    f"taux de rappel {archive['recall']['hit_rate']}")
+        for job, timing in self.scheduler.get_stats()["jobs"].items():
+            if timing:
+                logger.info(f"  Maintenance {job}: {timing['runs']} exécutions, p99 {timing['p99_ms']} ms")
+        self.graph.close()
         logger.info("✅ CognitionCore arrêté")
     
-    def _cooling_loop(self):
-        """Refroidissement horaire."""
-        while self._running:
-            time.sleep(CONFIG["cooling_interval_hours"] * 3600)
-            self.graph.cool_down()
+    def on_phase(self, phase: Union[str, bytes, Dict[str, Any]]):
+        """Signal circa/phase : l'entrée en sommeil profond déclenche la consolidation."""
+        self.scheduler.on_phase(phase)
     
-    def _nightly_loop(self):
-        """Cristallisation nocturne."""
-        while self._running:
-            now = datetime.now()
-            if now.hour == CONFIG["nightly_hour"] and now.minute < 5:
-                self.graph.consolidate()
-                time.sleep(3600)
-            time.sleep(60)
+    def get_maintenance_stats(self) -> Dict[str, Any]:
+        """Durées des refroidissements et consolidations, par déclencheur."""
+        return self.scheduler.get_stats()
     
     def process(self, input_data: Union[str, Dict, StructuredIntent],
                input_type: str = "text",
-               output_type: str = "intent") -> Union[StructuredIntent, str, None]:
+               output_type: str = "intent",
+               speaker: str = "unknown",
+               conversation_id: Optional[str] = None) -> Union[StructuredIntent, str, None]:
         """
         Point d'entrée unique.
         
         input_type: "text" ou "intent"
         output_type: "intent" ou "text"
+        speaker: interlocuteur d'une entrée texte
+        conversation_id: conversation d'une entrée texte ; avec `speaker`, choisit
+        son contexte (None : contexte courant de l'interlocuteur)
         """
-        
+        maintenance = self.graph.maintenance_active > 0
+        t0 = time.perf_counter()
+        try:
+            return self._process(input_data, input_type, output_type, speaker, conversation_id)
+        finally:
+            elapsed = time.perf_counter() - t0
+            self._process_latency["maintenance" if maintenance or self.graph.maintenance_active
+                                  else "idle"].append(elapsed)
+    
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """Latences de process() (moyenne, p50, p99), hors et pendant la maintenance du graphe."""
+        return {phase: _latency_stats(list(samples)) if samples else None
+                for phase, samples in self._process_latency.items()}
+    
+    def _process(self, input_data: Union[str, Dict, StructuredIntent],
+                 input_type: str, output_type: str, speaker: str = "unknown",
+                 conversation_id: Optional[str] = None) -> Union[StructuredIntent, str, None]:
         # 1. Normaliser l'entrée en intent
+        intent = self._normalize(input_data, input_type, speaker, conversation_id)
+        
+        # 2. Traitement cognitif
+        response_intent = self._cognize(intent)
+        
+        # 3. Sortie
+        return self._render(response_intent, output_type)
+    
+    def _normalize(self, input_data: Union[str, Dict, StructuredIntent],
+                   input_type: str, speaker: str = "unknown",
+                   conversation_id: Optional[str] = None) -> StructuredIntent:
+        """
+        Entrée texte, intent ou dict → StructuredIntent. Un intent d'une
+        conversation désignée compte comme un tour de son contexte, sauf
+        une réponse du système (in_response_to, ou speaker "system").
+        """
         if input_type == "text" and isinstance(input_data, str):
-            intent = self._text_to_intent(input_data)
+            return self._text_to_intent(input_data, speaker, conversation_id)
         elif input_type == "intent":
             if isinstance(input_data, StructuredIntent):
                 intent = input_data
             elif isinstance(input_data, dict):
                 # Reconstruire depuis dict
                 intent = StructuredIntent(
-                    id=input_data.get("id", f"intent_{uuid.uuid4().hex[:8]}"),
+                    id=input_data.get("id", _short_id("intent")),
                     timestamp=input_data.get("timestamp", time.time()),
                     conversation_id=input_data.get("conversation_id", ""),
                     speaker=input_data.get("speaker", "unknown"),
@@ -1034,17 +5411,21 @@ class CognitionCore:
                             source=SourceInfo(type=SourceWeight(v.get("source", 0.9)))
                         ) for k, v in input_data.get("attributes", {}).items()
                     },
-                    signatures=input_data.get("signatures", {})
+                    signatures=input_data.get("signatures", {}),
+                    in_response_to=input_data.get("in_response_to")
                 )
             else:
                 raise ValueError("input_type=intent mais input_data n'est pas un intent")
+            # Une réponse du système rendue en texte n'est pas un tour de parole
+            if intent.conversation_id and intent.in_response_to is None and intent.speaker != "system":
+                now = time.time()
+                self.contexts.open(intent.conversation_id, intent.speaker, now).record(intent.id, intent.speaker, now)
+            return intent
         else:
             raise ValueError(f"input_type={input_type} non supporté")
-        
-        # 2. Traitement cognitif
-        response_intent = self._cognize(intent)
-        
-        # 3. Sortie
+    
+    def _render(self, response_intent: StructuredIntent,
+                output_type: str) -> Union[StructuredIntent, str, None]:
         if output_type == "intent":
             return response_intent
         elif output_type == "text":
@@ -1052,52 +5433,157 @@ class CognitionCore:
         else:
             raise ValueError(f"output_type={output_type} non supporté")
     
-    def _text_to_intent(self, text: str) -> StructuredIntent:
+    # ------------------------------------------------------------
+    # Traitement par lots et en flux
+    # ------------------------------------------------------------
+    
+    def process_batch(self, inputs: Iterable[Union[str, Tuple[str, str], Tuple[str, str, str], Dict, StructuredIntent]],
+                      input_type: str = "text",
+                      output_type: str = "intent",
+                      speaker: str = "unknown") -> List[Union[StructuredIntent, str, None]]:
+        """
+        Traite un lot d'entrées, dans l'ordre. Une entrée texte peut être un
+        couple (interlocuteur, texte) ou un triplet (conversation,
+        interlocuteur, texte). Les concepts cités par le lot (noms,
+        signatures) sont résolus ensemble par KnowledgeGraph.get_many avant le
+        traitement : une seule prise du verrou et un seul chargement disque
+        par lot au lieu d'un par énoncé.
+        """
+        t0 = time.perf_counter()
+        intents = []
+        for item in inputs:
+            conversation_id, item_speaker = None, speaker
+            if input_type == "text" and isinstance(item, tuple):
+                if len(item) == 3:
+                    conversation_id, item_speaker, item = item
+                else:
+                    item_speaker, item = item
+            intents.append(self._normalize(item, input_type, item_speaker, conversation_id))
+        if not intents:
+            return []
+        t1 = time.perf_counter()
+        
+        keys = [key for intent in intents for key in self._lookup_keys(intent)]
+        if keys:
+            self.graph.get_many(keys)
+        t2 = time.perf_counter()
+        
+        responses = [self._cognize(intent) for intent in intents]
+        t3 = time.perf_counter()
+        
+        outputs = [self._render(response, output_type) for response in responses]
+        t4 = time.perf_counter()
+        
+        n = len(intents)
+        for stage, elapsed in zip(BATCH_STAGES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3)):
+            self._batch_stages[stage].append(elapsed / n)
+        return outputs
+    
+    def _lookup_keys(self, intent: StructuredIntent) -> List[str]:
+        """Identifiants que _cognize va chercher dans le graphe pour cet intent."""
+        keys = []
+        sub = intent.semantic.get("sub_intent")
+        text_attr = intent.attributes.get("text")
+        if text_attr is not None and isinstance(text_attr.value, str):
+            if sub == "person":
+                match = PERSON_PATTERN.search(text_attr.value)
+                if match:
+                    keys.append(match.group(1).strip())
+            elif sub == "is_a":
+                match = IS_A_PATTERN.search(text_attr.value.lower())
+                if match:
+                    keys.extend((match.group(1).strip(), match.group(2).strip()))
+        for kind, index in (("voice", self.graph.index_signature_vocale),
+                            ("face", self.graph.index_signature_visage)):
+            signature = intent.signatures.get(kind)
+            if signature is not None and signature in index:
+                keys.append(index[signature])
+        return keys
+    
+    def process_stream(self, inputs: Iterable[Union[str, Tuple[str, str], Dict, StructuredIntent]],
+                       batch_size: int = 64, **kwargs) -> Iterator[Union[StructuredIntent, str, None]]:
+        """Traite un flux (ex : relecture de transcriptions) par lots de batch_size, en restituant les sorties une à une."""
+        batch = []
+        for item in inputs:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield from self.process_batch(batch, **kwargs)
+                batch = []
+        if batch:
+            yield from self.process_batch(batch, **kwargs)
+    
+    async def process_async(self, input_data: Union[str, Dict, StructuredIntent], **kwargs
+                            ) -> Union[StructuredIntent, str, None]:
+        """process() hors de la boucle asyncio (exécuteur par défaut)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self.process, input_data, **kwargs))
+    
+    async def aprocess_stream(self, inputs: AsyncIterable[Union[str, Tuple[str, str], Dict, StructuredIntent]],
+                              batch_size: int = 64, max_wait_ms: float = 5.0,
+                              **kwargs) -> AsyncIterator[Union[StructuredIntent, str, None]]:
+        """
+        Flux asynchrone : regroupe les entrées arrivées en moins de max_wait_ms
+        (au plus batch_size) et traite chaque lot hors de la boucle asyncio ;
+        les sorties sont produites dans l'ordre des entrées.
+        """
+        loop = asyncio.get_running_loop()
+        iterator = inputs.__aiter__()
+        pending = None  # lecture en attente, reportée au lot suivant (jamais annulée)
+        exhausted = False
+        while not exhausted:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            try:
+                batch = [await pending]
+            except StopAsyncIteration:
+                break
+            pending = None
+            deadline = loop.time() + max_wait_ms / 1000
+            while len(batch) < batch_size:
+                pending = asyncio.ensure_future(iterator.__anext__())
+                done, _ = await asyncio.wait({pending}, timeout=max(0.0, deadline - loop.time()))
+                if not done:
+                    break
+                task, pending = pending, None
+                try:
+                    batch.append(task.result())
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+            outputs = await loop.run_in_executor(
+                None, functools.partial(self.process_batch, batch, **kwargs))
+            for output in outputs:
+                yield output
+    
+    def get_context_stats(self) -> Dict[str, Any]:
+        """Contextes de conversation vivants, créés, expirés et évincés."""
+        return self.contexts.get_stats()
+    
+    def get_batch_stats(self) -> Dict[str, Any]:
+        """Durée par énoncé de chaque étape de process_batch() (normalisation, résolution, cognition, rendu)."""
+        return {stage: _latency_stats(list(samples)) if samples else None
+                for stage, samples in self._batch_stages.items()}
+    
+    def _text_to_intent(self, text: str, speaker: str = "unknown",
+                        conversation_id: Optional[str] = None) -> StructuredIntent:
         """Convertit un texte en intent basique."""
         
-        # Créer ou récupérer le contexte
-        if not self.current_conversation or self.current_conversation.is_expired():
-            self.current_conversation = ContextFrame(
-                conversation_id=f"conv_{uuid.uuid4().hex[:8]}"
-            )
+        now = time.time()
         
-        intent_id = f"intent_{uuid.uuid4().hex[:8]}"
-        
-        # Détection basique
-        text_lower = text.lower()
-        
-        if text_lower.endswith("?"):
-            if "heure" in text_lower:
-                intent_type = "question"
-                sub_intent = "time"
-            elif "qui" in text_lower:
-                intent_type = "question"
-                sub_intent = "person"
-            elif "saison" in text_lower:
-                intent_type = "question"
-                sub_intent = "saison"
-            else:
-                intent_type = "question"
-                sub_intent = "general"
-        elif any(w in text_lower for w in ["bonjour", "salut", "coucou"]):
-            intent_type = "social"
-            sub_intent = "greeting"
-        elif any(w in text_lower for w in ["au revoir", "bye"]):
-            intent_type = "social"
-            sub_intent = "farewell"
-        elif any(w in text_lower for w in ["merci"]):
-            intent_type = "social"
-            sub_intent = "thanks"
-        else:
-            intent_type = "information"
-            sub_intent = "statement"
+        # Créer ou récupérer le contexte de cet interlocuteur dans cette conversation
+        frame = self.contexts.open(conversation_id, speaker, now)
+        
+        intent_id = _short_id("intent")
+        
+        # Routage compilé
+        intent_type, sub_intent = self.router.route(text.lower())
         
         # Créer l'intent
         intent = StructuredIntent(
             id=intent_id,
-            timestamp=time.time(),
-            conversation_id=self.current_conversation.conversation_id,
-            speaker="unknown",
+            timestamp=now,
+            conversation_id=frame.conversation_id,
+            speaker=speaker,
             semantic={
                 "intent": intent_type,
                 "sub_intent": sub_intent,
@@ -1108,16 +5594,13 @@ class CognitionCore:
                 "text": Attribute(
                     type="string",
                     value=text,
-                    source=SourceInfo(type=SourceWeight.OBSERVATION)
+                    source=SourceInfo(type=SourceWeight.OBSERVATION, timestamp=now)
                 )
             }
         )
         
         # Mettre à jour le contexte
-        self.current_conversation.update(
-            who="unknown",
-            history=[intent_id]
-        )
+        frame.record(intent_id, speaker, now)
         
         return intent
     
@@ -1151,33 +5634,36 @@ class CognitionCore:
         else:
             return self._default_response(intent)
     
+    def _respond(self, intent: StructuredIntent, template: str,
+                 attributes: Optional[Dict[str, Attribute]] = None,
+                 confidence: Optional[float] = None) -> StructuredIntent:
+        """Intent de réponse à partir d'un gabarit précalculé (RESPONSE_TEMPLATES)."""
+        semantic = dict(RESPONSE_TEMPLATES[template])
+        if confidence is not None:
+            semantic["confidence"] = confidence
+        return StructuredIntent(
+            id=_short_id("resp"),
+            timestamp=time.time(),
+            conversation_id=intent.conversation_id,
+            speaker="system",
+            semantic=semantic,
+            attributes=attributes if attributes is not None else {},
+            in_response_to=intent.id
+        )
+    
     def _answer_question(self, intent: StructuredIntent) -> StructuredIntent:
         """Répond à une question en interrogeant le graphe."""
         
         sub = intent.semantic.get("sub_intent")
         
         if sub == "time":
-            now = datetime.now()
-            return StructuredIntent(
-                id=f"resp_{uuid.uuid4().hex[:8]}",
-                timestamp=time.time(),
-                conversation_id=intent.conversation_id,
-                speaker="system",
-                semantic={
-                    "intent": "answer",
-                    "sub_intent": "time",
-                    "type": IntentType.REPONSE,
-                    "confidence": 1.0
-                },
-                attributes={
-                    "time": Attribute(
-                        type="datetime",
-                        value=now.isoformat(),
-                        source=SourceInfo(type=SourceWeight.OBSERVATION)
-                    )
-                },
-                in_response_to=intent.id
-            )
+            return self._respond(intent, "time", {
+                "time": Attribute(
+                    type="datetime",
+                    value=datetime.now().isoformat(),
+                    source=SourceInfo(type=SourceWeight.OBSERVATION)
+                )
+            })
         
         elif sub == "saison":
             now = datetime.now()
@@ -1194,189 +5680,1391 @@ class CognitionCore:
             else:
                 saison = "hiver"
             
-            return StructuredIntent(
-                id=f"resp_{uuid.uuid4().hex[:8]}",
-                timestamp=time.time(),
-                conversation_id=intent.conversation_id,
-                speaker="system",
-                semantic={
-                    "intent": "answer",
-                    "sub_intent": "saison",
-                    "type": IntentType.REPONSE,
-                    "confidence": 0.95
-                },
-                attributes={
-                    "saison": Attribute(
-                        type="string",
-                        value=saison,
-                        source=SourceInfo(type=SourceWeight.OBSERVATION)
-                    )
-                },
-                in_response_to=intent.id
-            )
+            return self._respond(intent, "saison", {
+                "saison": Attribute(
+                    type="string",
+                    value=saison,
+                    source=SourceInfo(type=SourceWeight.OBSERVATION)
+                )
+            })
+        
+        elif sub == "is_a":
+            # Chaîne de EST_UN, via la fermeture transitive (mise en cache)
+            text_attr = intent.attributes.get("text")
+            match = IS_A_PATTERN.search(text_attr.value.lower()) if text_attr else None
+            if match:
+                sujet = self.graph.get(match.group(1).strip())
+                categorie = self.graph.get(match.group(2).strip())
+                if sujet and categorie:
+                    known = self.graph.is_a(sujet, categorie)
+                    return self._respond(intent, "is_a", {
+                        "is_a": Attribute(
+                            type="object",
+                            value={"sujet": sujet.nom, "categorie": categorie.nom, "reponse": known},
+                            source=SourceInfo(type=SourceWeight.OBSERVATION)
+                        )
+                    }, confidence=0.9 if known else 0.6)
         
         elif sub == "person":
             # Chercher dans le graphe
-            person_name = intent.attributes.get("text", Attribute(type="string", value="")).value
-            # Extraire le nom de la question
-            import re
-            match = re.search(r"qui est ([\w\s]+?)\??", person_name, re.IGNORECASE)
-            if match:
-                name = match.group(1).strip()
-                person = self.graph.get(name)
-                if person:
-                    return StructuredIntent(
-                        id=f"resp_{uuid.uuid4().hex[:8]}",
-                        timestamp=time.time(),
-                        conversation_id=intent.conversation_id,
-                        speaker="system",
-                        semantic={
-                            "intent": "answer",
-                            "sub_intent": "person_info",
-                            "type": IntentType.REPONSE,
-                            "confidence": 0.9
-                        },
-                        attributes={
-                            "person": Attribute(
-                                type="object",
-                                value={
-                                    "name": person.nom,
-                                    "relations": [r.type.value for r in person.get_relations()]
-                                },
-                                source=SourceInfo(type=SourceWeight.OBSERVATION)
-                            )
+            text_attr = intent.attributes.get("text")
+            match = PERSON_PATTERN.search(text_attr.value) if text_attr else None
+            name = match.group(1).strip() if match else "cette personne"
+            person = self.graph.get(name) if match else None
+            if person:
+                return self._respond(intent, "person_info", {
+                    "person": Attribute(
+                        type="object",
+                        value={
+                            "name": person.nom,
+                            "relations": [r.type.value for r in person.get_relations()]
                         },
-                        in_response_to=intent.id
+                        source=SourceInfo(type=SourceWeight.OBSERVATION)
                     )
+                })
             
             # Personne inconnue
-            return StructuredIntent(
-                id=f"resp_{uuid.uuid4().hex[:8]}",
-                timestamp=time.time(),
-                conversation_id=intent.conversation_id,
-                speaker="system",
-                semantic={
-                    "intent": "clarification",
-                    "sub_intent": "unknown_person",
-                    "type": IntentType.CLARIFICATION,
-                    "confidence": 0.8
-                },
-                attributes={
-                    "person": Attribute(
-                        type="string",
-                        value=name if 'name' in locals() else "cette personne",
-                        source=SourceInfo(type=SourceWeight.OBSERVATION)
-                    )
-                },
-                in_response_to=intent.id
-            )
+            return self._respond(intent, "unknown_person", {
+                "person": Attribute(
+                    type="string",
+                    value=name,
+                    source=SourceInfo(type=SourceWeight.OBSERVATION)
+                )
+            })
         
         # Question non comprise
-        return StructuredIntent(
-            id=f"resp_{uuid.uuid4().hex[:8]}",
-            timestamp=time.time(),
-            conversation_id=intent.conversation_id,
-            speaker="system",
-            semantic={
-                "intent": "clarification",
-                "sub_intent": "general",
-                "type": IntentType.CLARIFICATION,
-                "confidence": 0.5
-            },
-            attributes={},
-            in_response_to=intent.id
-        )
+        return self._respond(intent, "general")
     
     def _store_information(self, intent: StructuredIntent) -> StructuredIntent:
         """Stocke une information dans le graphe."""
         
         # Logique de stockage à implémenter selon les besoins
-        return StructuredIntent(
-            id=f"resp_{uuid.uuid4().hex[:8]}",
-            timestamp=time.time(),
-            conversation_id=intent.conversation_id,
-            speaker="system",
-            semantic={
-                "intent": "acknowledge",
-                "sub_intent": "information",
-                "type": IntentType.REPONSE,
-                "confidence": 0.9
-            },
-            attributes={},
-            in_response_to=intent.id
-        )
+        return self._respond(intent, "information")
     
     def _social_response(self, intent: StructuredIntent) -> StructuredIntent:
         """Réponse sociale."""
         
         sub = intent.semantic.get("sub_intent")
-        
-        if sub == "greeting":
-            return StructuredIntent(
-                id=f"resp_{uuid.uuid4().hex[:8]}",
-                timestamp=time.time(),
-                conversation_id=intent.conversation_id,
-                speaker="system",
-                semantic={
-                    "intent": "social",
-                    "sub_intent": "greeting",
-                    "type": IntentType.SOCIAL,
-                    "confidence": 1.0
-                },
-                attributes={},
-                in_response_to=intent.id
-            )
-        
-        elif sub == "farewell":
-            return StructuredIntent(
-                id=f"resp_{uuid.uuid4().hex[:8]}",
-                timestamp=time.time(),
-                conversation_id=intent.conversation_id,
-                speaker="system",
-                semantic={
-                    "intent": "social",
-                    "sub_intent": "farewell",
-                    "type": IntentType.SOCIAL,
-                    "confidence": 1.0
-                },
-                attributes={},
-                in_response_to=intent.id
-            )
-        
-        elif sub == "thanks":
-            return StructuredIntent(
-                id=f"resp_{uuid.uuid4().hex[:8]}",
-                timestamp=time.time(),
-                conversation_id=intent.conversation_id,
-                speaker="system",
-                semantic={
-                    "intent": "social",
-                    "sub_intent": "thanks",
-                    "type": IntentType.SOCIAL,
-                    "confidence": 1.0
-                },
-                attributes={},
-                in_response_to=intent.id
-            )
+        if sub in ("greeting", "farewell", "thanks"):
+            return self._respond(intent, sub)
         
         return self._default_response(intent)
     
     def _default_response(self, intent: StructuredIntent) -> StructuredIntent:
         """Réponse par défaut."""
-        return StructuredIntent(
-            id=f"resp_{uuid.uuid4().hex[:8]}",
-            timestamp=time.time(),
-            conversation_id=intent.conversation_id,
-            speaker="system",
-            semantic={
-                "intent": "acknowledge",
-                "sub_intent": "default",
-                "type": IntentType.REPONSE,
-                "confidence": 0.7
-            },
-            attributes={},
-            in_response_to=intent.id
-        )
+        return self._respond(intent, "default")
+
+# ============================================================
+# BENCHMARKS
+# ============================================================
+
+@contextmanager
+def _bench_environment(**overrides):
+    """Répertoire temporaire + surcharge de CONFIG le temps d'un benchmark."""
+    saved = dict(CONFIG)
+    with tempfile.TemporaryDirectory(prefix="cognition_bench_") as tmp:
+        CONFIG["archive_dir"] = Path(tmp) / "archives"
+        CONFIG.update(overrides)
+        try:
+            yield Path(tmp)
+        finally:
+            CONFIG.clear()
+            CONFIG.update(saved)
+
+def _synthetic_concept(i: int, n_relations: int = 3) -> Concept:
+    source = SourceInfo(type=SourceWeight.EDUCATIVE, timestamp=0.0)
+    concept = Concept(id=f"concept_{i:08d}", nom=f"concept {i}",
+                      nature=ConceptNature.INSTANCE, memoire_type=MemoryType.EPISODIQUE)
+    for k in range(n_relations):
+        concept.relations.append(Relation(type=RelationType.EST_UN,
+                                          cible=f"concept_{(i + k + 1):08d}", source_info=source))
+    concept.proprietes["definition"] = Propriete(nom="definition", valeur=f"définition {i}",
+                                                 type="texte", source_info=source)
+    return concept
+
+def benchmark_disk_backends(sizes=(10_000, 100_000), backends=("files", "sqlite"),
+                            chunk: int = 10_000, samples: int = 1000) -> Dict[str, Any]:
+    """
+    Compare les backends du niveau disque : débit du refroidissement
+    (RAM → disque, par blocs de `chunk` concepts) et latence d'un get()
+    à froid (concept absent de la RAM), ainsi que d'un get() manqué.
+    """
+    results: Dict[str, Any] = {}
+    for backend in backends:
+        for size in sizes:
+            with _bench_environment(disk_backend=backend, max_ram_concepts=chunk + 1) as tmp:
+                graph = KnowledgeGraph(tmp / "graph")
+                cool_time = 0.0
+                for start in range(0, size, chunk):
+                    for i in range(start, min(size, start + chunk)):
+                        concept = _synthetic_concept(i)
+                        concept.temperature = 0.2
+                        graph.ram_cache[concept.id] = concept
+                    t0 = time.perf_counter()
+                    graph.cool_down()
+                    graph.flush_dirty()
+                    cool_time += time.perf_counter() - t0
+                
+                ids = [f"concept_{i:08d}" for i in random.sample(range(size), min(samples, size))]
+                hits = []
+                for cid in ids:
+                    graph.ram_cache.clear()
+                    t0 = time.perf_counter()
+                    graph.get(cid)
+                    hits.append(time.perf_counter() - t0)
+                misses = []
+                for k in range(min(samples, 200)):
+                    t0 = time.perf_counter()
+                    graph.get(f"absent_{k}")
+                    misses.append(time.perf_counter() - t0)
+                graph.close()
+                
+                results[f"{backend}/{size}"] = {
+                    "cool_down_concepts_per_s": round(size / cool_time),
+                    "cold_get": _latency_stats(hits),
+                    "miss_get": _latency_stats(misses),
+                }
+    return results
+
+def benchmark_index_journal(sizes=(10_000, 100_000, 1_000_000), samples: int = 1000) -> Dict[str, Any]:
+    """
+    Coût d'enregistrement d'une signature visage (mutation d'index journalisée)
+    comparé à une réécriture complète de l'instantané, et temps de démarrage
+    (instantané + rejeu du journal), selon la taille des index.
+    """
+    results: Dict[str, Any] = {}
+    source = SourceInfo(type=SourceWeight.OBSERVATION)
+    for size in sizes:
+        with _bench_environment() as tmp:
+            graph = KnowledgeGraph(tmp / "graph")
+            for i in range(size):
+                graph.index_nom[f"concept {i}"] = f"concept_{i:08d}"
+            t0 = time.perf_counter()
+            graph._save_index()
+            snapshot_time = time.perf_counter() - t0
+            
+            person = graph.get_or_create("paul", ConceptNature.PERSONNE, MemoryType.SOCIAL)
+            latencies = []
+            for k in range(samples):
+                t0 = time.perf_counter()
+                graph.add_signature_visage(person, f"sig_{k:06d}", source)
+                latencies.append(time.perf_counter() - t0)
+            graph._stop_writer()
+            graph.index_journal.close()
+            
+            t0 = time.perf_counter()
+            reopened = KnowledgeGraph(tmp / "graph")
+            startup_time = time.perf_counter() - t0
+            assert len(reopened.index_signature_visage) == samples
+            reopened.close()
+            graph.disk.close()
+            
+            results[str(size)] = {
+                "add_signature_visage": _latency_stats(latencies),
+                "full_snapshot_ms": round(snapshot_time * 1000, 2),
+                "startup_with_journal_ms": round(startup_time * 1000, 2),
+            }
+    return results
+
+def benchmark_query(sizes=(10_000, 100_000), samples: int = 200,
+                    max_ram: int = 1000) -> Dict[str, Any]:
+    """
+    Latence de query() sur une propriété et un type de relation rares
+    (1 concept sur 1000), la majorité du graphe étant sur disque.
+    """
+    results: Dict[str, Any] = {}
+    source = SourceInfo(type=SourceWeight.EDUCATIVE, timestamp=0.0)
+    for size in sizes:
+        with _bench_environment(max_ram_concepts=max_ram) as tmp:
+            graph = KnowledgeGraph(tmp / "graph")
+            batch = []
+            for i in range(size):
+                concept = _synthetic_concept(i)
+                if i % 1000 == 0:
+                    concept.proprietes["rare"] = Propriete(nom="rare", valeur=i,
+                                                           type="nombre", source_info=source)
+                    concept.relations.append(Relation(type=RelationType.A_ECRIT,
+                                                      cible="concept_00000000", source_info=source))
+                graph._index_concept(concept)
+                batch.append(concept)
+                if len(batch) == 10_000:
+                    graph.disk.save_many(batch)
+                    batch = []
+            graph.disk.save_many(batch)
+            graph.disk.flush()
+            
+            by_prop, by_rel, by_both = [], [], []
+            for _ in range(samples):
+                t0 = time.perf_counter()
+                found = graph.query(propriete="rare")
+                by_prop.append(time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                graph.query(type=RelationType.A_ECRIT)
+                by_rel.append(time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                graph.query(type=RelationType.A_ECRIT, nature=ConceptNature.INSTANCE,
+                            propriete="rare")
+                by_both.append(time.perf_counter() - t0)
+            assert len(found) == (size + 999) // 1000
+            graph.close()
+            
+            results[str(size)] = {
+                "matches": len(found),
+                "query_propriete": _latency_stats(by_prop),
+                "query_relation": _latency_stats(by_rel),
+                "query_combinee": _latency_stats(by_both),
+            }
+    return results
+
+def benchmark_write_behind(sizes=(10_000, 100_000), max_ram: int = 1000) -> Dict[str, Any]:
+    """
+    Charge d'écriture avec évictions LRU permanentes (max_ram petit) :
+    latence par opération, retard d'écriture, durée de détention du verrou,
+    et concepts perdus après un arrêt brutal (écrivain stoppé sans flush()).
+    """
+    results: Dict[str, Any] = {}
+    source = SourceInfo(type=SourceWeight.EDUCATIVE, timestamp=0.0)
+    for size in sizes:
+        with _bench_environment(max_ram_concepts=max_ram, write_behind_interval_s=0.2) as tmp:
+            graph = KnowledgeGraph(tmp / "graph")
+            latencies = []
+            for i in range(size):
+                t0 = time.perf_counter()
+                concept = graph.get_or_create(f"concept {i}", ConceptNature.INSTANCE,
+                                              MemoryType.EPISODIQUE, source)
+                graph.add_propriete(concept, "rang", i, "nombre", source)
+                latencies.append(time.perf_counter() - t0)
+            time.sleep(CONFIG["write_behind_interval_s"] * 3)
+            stats = graph.get_persistence_stats()
+            
+            # Arrêt brutal : ni flush() ni compaction des index
+            graph._stop_writer()
+            graph.index_journal.close()
+            graph.disk.close()
+            reopened = KnowledgeGraph(tmp / "graph")
+            lost = sum(1 for i in range(size) if reopened.get(f"concept {i}") is None)
+            reopened.close()
+            
+            results[str(size)] = {
+                "operation": _latency_stats(latencies),
+                "flush_lag": stats["flush_lag"],
+                "flush_write": stats["flush_write"],
+                "lock_hold_flush": stats["lock_hold"].get("flush"),
+                "lost_after_crash": lost,
+            }
+    return results
+
+def benchmark_lookup_filter(sizes=(10_000, 100_000), samples: int = 5000) -> Dict[str, Any]:
+    """
+    Latence d'un get() manqué (mot qui n'est pas un concept) avec et sans
+    filtre de Bloom, graphe entièrement sur disque, et latence d'un get() réussi.
+    """
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        for enabled in (False, True):
+            with _bench_environment(lookup_filter=enabled, max_ram_concepts=1000) as tmp:
+                graph = KnowledgeGraph(tmp / "graph")
+                for start in range(0, size, 10_000):
+                    batch = [_synthetic_concept(i) for i in range(start, min(size, start + 10_000))]
+                    graph.disk.save_many(batch)
+                    with graph._lock:
+                        for concept in batch:
+                            graph._index_set("nom", concept.nom.lower(), concept.id)
+                graph.disk.flush()
+                graph._rebuild_lookup_filter()
+                
+                misses = []
+                for k in range(samples):
+                    word = f"mot{k}"
+                    t0 = time.perf_counter()
+                    graph.get(word)
+                    misses.append(time.perf_counter() - t0)
+                hits = []
+                for i in random.sample(range(size), min(samples, size)):
+                    t0 = time.perf_counter()
+                    graph.get(f"concept {i}")
+                    hits.append(time.perf_counter() - t0)
+                stats = graph.get_lookup_stats()
+                graph.close()
+                
+                results[f"{'filtre' if enabled else 'sans_filtre'}/{size}"] = {
+                    "miss_get": _latency_stats(misses),
+                    "hit_get": _latency_stats(hits),
+                    "lookup_stats": stats,
+                }
+    return results
+
+def _write_synthetic_kb(filepath: Path, size: int):
+    """Base synthétique : catégories, instances reliées par nom, une propriété chacune."""
+    n_categories = max(1, size // 100)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write('{"concepts": [\n')
+        for i in range(size):
+            entry = {
+                "nom": f"entree {i}",
+                "nature": "instance",
+                "aliases": [f"alias {i}"],
+                "proprietes": {"definition": {"valeur": f"définition {i}", "type": "texte"}},
+                "relations": [
+                    {"type": "est_un", "cible": f"categorie {i % n_categories}"},
+                    {"type": "precede", "cible": f"entree {(i + 1) % size}"},
+                    {"type": "synonyme", "cible": f"alias {(i + 7) % size}"},
+                ],
+            }
+            f.write(("," if i else "") + json.dumps(entry, ensure_ascii=False) + "\n")
+        f.write("]}\n")
+
+def benchmark_bulk_load(sizes=(10_000, 100_000), max_ram: int = 1000,
+                        legacy_max: int = 20_000) -> Dict[str, Any]:
+    """
+    Chargement d'une base plus grande que max_ram_concepts : chemin entrée par
+    entrée (get_or_create/add_relation, ancien comportement) comparé au
+    chargement en masse. L'ancien chemin n'est mesuré que jusqu'à legacy_max.
+    """
+    results: Dict[str, Any] = {}
+    source = SourceInfo(type=SourceWeight.EDUCATIVE)
+    for size in sizes:
+        with _bench_environment(max_ram_concepts=max_ram) as tmp:
+            kb_path = tmp / "kb.json"
+            _write_synthetic_kb(kb_path, size)
+            entry = {}
+            
+            if size <= legacy_max:
+                graph = KnowledgeGraph(tmp / "legacy")
+                t0 = time.perf_counter()
+                for data in iter_knowledge_base(kb_path):
+                    concept = Concept(id=f"kb_{uuid.uuid4().hex[:8]}", nom=data["nom"],
+                                      nature=ConceptNature(data["nature"]),
+                                      aliases=set(data.get("aliases", [])))
+                    graph.add_concept(concept)
+                    for rel in data["relations"]:
+                        graph.add_relation(concept.id, RelationType(rel["type"]), rel["cible"], source)
+                    for prop, val in data["proprietes"].items():
+                        graph.add_propriete(concept, prop, val["valeur"], val["type"], source)
+                graph.flush()
+                legacy_time = time.perf_counter() - t0
+                graph.close()
+                entry["legacy_concepts_per_s"] = round(size / legacy_time)
+                entry["legacy_s"] = round(legacy_time, 2)
+            
+            graph = KnowledgeGraph(tmp / "bulk")
+            stats = graph.bulk_load(lambda: iter_knowledge_base(kb_path), source)
+            assert graph.get(f"entree {size - 1}") is not None
+            ram_after = len(graph.ram_cache)
+            graph.close()
+            entry.update(bulk_concepts_per_s=stats["concepts_per_s"], bulk_s=stats["elapsed_s"],
+                         relations=stats["relations"], ram_after_load=ram_after)
+            results[str(size)] = entry
+    return results
+
+def benchmark_maintenance(sizes=(10_000, 100_000), heures: float = 10.0) -> Dict[str, Any]:
+    """
+    Latence de process() (question touchant le graphe) pendant un
+    refroidissement puis une consolidation exécutés en parallèle : verrou
+    tenu d'un bloc (ancien comportement, tranche illimitée) contre tranches
+    bornées à maintenance_slice_ms.
+    """
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        for mode, slice_ms in (("monolithique", 1e9), ("tranches", CONFIG["maintenance_slice_ms"])):
+            with _bench_environment(max_ram_concepts=size + 1, maintenance_slice_ms=slice_ms,
+                                    write_behind_interval_s=3600) as tmp:
+                gem_path = tmp / "gem.json"
+                gem_path.write_text(json.dumps({"gem": {"nom": "Shirka"}}), encoding="utf-8")
+                core = CognitionCore(tmp / "data", gem_path)
+                graph = core.graph
+                rng = random.Random(0)
+                for i in range(size):
+                    concept = _synthetic_concept(i)
+                    concept.temperature = rng.uniform(0.3, 1.0)
+                    concept.access_count = rng.randint(0, 20)
+                    graph.add_concept(concept)
+                
+                for _ in range(200):
+                    core.process(f"qui est concept {rng.randrange(size)} ?")
+                
+                def maintenance():
+                    graph.last_cooling = time.time() - heures * 3600
+                    graph.cool_down()
+                    graph.consolidate()
+                
+                worker = threading.Thread(target=maintenance)
+                t0 = time.perf_counter()
+                worker.start()
+                while worker.is_alive():
+                    core.process(f"qui est concept {rng.randrange(size)} ?")
+                worker.join()
+                maintenance_s = time.perf_counter() - t0
+                
+                latency = core.get_latency_stats()
+                holds = graph.get_persistence_stats()["lock_hold"]
+                graph.close()
+                results[f"{mode}/{size}"] = {
+                    "maintenance_s": round(maintenance_s, 3),
+                    "ram_after": len(graph.ram_cache),
+                    "process_idle": latency["idle"],
+                    "process_during_maintenance": latency["maintenance"],
+                    "lock_hold_cool_down": holds.get("cool_down"),
+                    "lock_hold_consolidate": holds.get("consolidate"),
+                }
+    return results
+
+def benchmark_scheduler(sizes=(10_000, 100_000)) -> Dict[str, Any]:
+    """
+    Planificateur de maintenance : délai du premier refroidissement après un
+    redémarrage (dernier refroidissement datant de deux intervalles), durée
+    de stop() pendant un refroidissement en cours, et refroidissements sous
+    pression pendant l'insertion de 2 * size concepts dans une RAM de size.
+    L'ancien comportement (sommeil d'un intervalle avant le premier
+    refroidissement, join de 5 s par fil) est rejoué une fois.
+    """
+    results: Dict[str, Any] = {}
+    
+    # Anciennes boucles : time.sleep() non interruptible, join(timeout=5) par fil
+    running = [True]
+    
+    def legacy_loop():
+        while running[0]:
+            time.sleep(CONFIG["cooling_interval_hours"] * 3600)
+    
+    legacy = [threading.Thread(target=legacy_loop, daemon=True) for _ in range(2)]
+    for thread in legacy:
+        thread.start()
+    t0 = time.perf_counter()
+    running[0] = False
+    for thread in legacy:
+        thread.join(timeout=5)
+    results["ancien"] = {"first_cool_down_after_restart_s": CONFIG["cooling_interval_hours"] * 3600,
+                         "stop_s": round(time.perf_counter() - t0, 3)}
+    
+    def wait_for(scheduler: MaintenanceScheduler, job: str, timeout: float = 60.0) -> float:
+        t0 = time.perf_counter()
+        while not any(r["job"] == job for r in scheduler.runs):
+            if time.perf_counter() - t0 > timeout:
+                break
+            time.sleep(0.001)
+        return time.perf_counter() - t0
+    
+    for size in sizes:
+        entry: Dict[str, Any] = {}
+        with _bench_environment(max_ram_concepts=size + 1, write_behind_interval_s=3600) as tmp:
+            gem_path = tmp / "gem.json"
+            gem_path.write_text(json.dumps({"gem": {"nom": "Shirka"}}), encoding="utf-8")
+            
+            # Redémarrage : le dernier refroidissement date de deux intervalles
+            core = CognitionCore(tmp / "data", gem_path)
+            for i in range(size):
+                core.graph.add_concept(_synthetic_concept(i))
+            core.graph.last_cooling = time.time() - 2 * CONFIG["cooling_interval_hours"] * 3600
+            core.graph._save_maintenance_state()
+            core.graph.close()
+            
+            core = CognitionCore(tmp / "data", gem_path)
+            for i in range(size):
+                concept = _synthetic_concept(i)
+                concept.temperature = 0.5
+                core.graph.add_concept(concept)
+            core.start()
+            entry["first_cool_down_after_restart_s"] = round(wait_for(core.scheduler, "cool_down"), 4)
+            
+            # Arrêt pendant un refroidissement : tout le graphe passe sous le seuil disque
+            core.graph.last_cooling = time.time() - 1000 * 3600
+            core.scheduler.request("cool_down")
+            while core.graph.maintenance_active == 0 and len(core.scheduler.runs) < 2:
+                time.sleep(0)
+            t0 = time.perf_counter()
+            core.scheduler.stop()
+            entry["stop_during_cool_down_s"] = round(time.perf_counter() - t0, 4)
+            entry["cool_down_cancelled"] = core.scheduler.runs[-1].get("cancelled")
+            core.graph.close()
+        
+        # Pression RAM : insertions au-delà de la capacité
+        for mode in ("sans_planificateur", "planificateur"):
+            with _bench_environment(max_ram_concepts=size, write_behind_interval_s=3600,
+                                    cooling_pressure_min_interval_s=0.05) as tmp:
+                graph = KnowledgeGraph(tmp / "graph")
+                scheduler = MaintenanceScheduler(graph)
+                if mode == "planificateur":
+                    scheduler.start()
+                t0 = time.perf_counter()
+                for i in range(2 * size):
+                    graph.add_concept(_synthetic_concept(i))
+                insert_s = time.perf_counter() - t0
+                scheduler.stop()
+                stats = scheduler.get_stats()
+                entry[mode] = {
+                    "inserts_per_s": round(2 * size / insert_s),
+                    "ram_occupancy": stats["ram_occupancy"],
+                    "cool_down": stats["jobs"]["cool_down"],
+                    "shed": sum(r.get("shed", 0) for r in scheduler.runs),
+                }
+                graph.close()
+        results[str(size)] = entry
+    return results
+
+def benchmark_startup(sizes=(10_000, 100_000), runs: int = 3) -> Dict[str, Any]:
+    """
+    Démarrage de CognitionCore (Gem + graphe) suivi du chargement d'une base
+    de `size` concepts : ancien parcours (base relue et réinsérée à chaque
+    démarrage, index JSON + journal, filtre reconstruit), démarrage à froid
+    (sans instantané, base inchangée ignorée) et à chaud (instantanés à jour,
+    projetés en mémoire). Meilleur de `runs` démarrages, l'ancien parcours
+    repartant chaque fois d'une copie du graphe initial ; le premier accès
+    aux index des relations, décodés à la demande, est mesuré à part.
+    """
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        with _bench_environment(max_ram_concepts=1000, write_behind_interval_s=3600) as tmp:
+            gem_path = tmp / "gem.json"
+            gem_path.write_text(json.dumps({"gem": {"nom": "Shirka"}}), encoding="utf-8")
+            kb_path = tmp / "base.jsonl"
+            with open(kb_path, 'w', encoding='utf-8') as f:
+                for i in range(size):
+                    f.write(json.dumps({"nom": f"mot {i}", "nature": "objet", "aliases": [f"m{i}"],
+                                        "relations": [{"type": "est_un", "cible": f"mot {i // 10}"}]}) + "\n")
+            pristine = tmp / "initial"
+            core = CognitionCore(pristine, gem_path)
+            core.load_knowledge_base("base", kb_path)
+            core.stop()
+            data_path = tmp / "data"
+            
+            def boot(snapshot: bool, force: bool) -> Dict[str, float]:
+                if force or not data_path.exists():
+                    shutil.rmtree(data_path, ignore_errors=True)
+                    shutil.copytree(pristine, data_path)
+                CONFIG["startup_snapshot"] = snapshot
+                if not snapshot:
+                    (data_path / "gem.snapshot").unlink(missing_ok=True)
+                    (data_path / "graph" / "startup.snapshot").unlink(missing_ok=True)
+                t0 = time.perf_counter()
+                core = CognitionCore(data_path, gem_path)
+                core.load_knowledge_base("base", kb_path, force=force)
+                startup_s = time.perf_counter() - t0
+                t0 = time.perf_counter()
+                core.graph.index_reverse.get("concept_inconnu")
+                relations_s = time.perf_counter() - t0
+                source = core.graph.startup_source
+                CONFIG["startup_snapshot"] = True
+                t0 = time.perf_counter()
+                core.stop()
+                return {"startup_s": startup_s, "relations_first_access_s": relations_s,
+                        "stop_s": time.perf_counter() - t0, "source": source}
+            
+            entry: Dict[str, Any] = {}
+            for mode, snapshot, force in (("froid", False, False), ("chaud", True, False),
+                                          ("ancien", False, True)):
+                samples = [boot(snapshot, force) for _ in range(runs)]
+                best = min(samples, key=lambda r: r["startup_s"])
+                entry[mode] = {key: round(value, 4) if isinstance(value, float) else value
+                               for key, value in best.items()}
+            entry["snapshot_bytes"] = (data_path / "graph" / "startup.snapshot").stat().st_size
+            entry["speedup_chaud_vs_ancien"] = round(entry["ancien"]["startup_s"]
+                                                     / entry["chaud"]["startup_s"], 1)
+            results[str(size)] = entry
+    return results
+
+def benchmark_archive(sizes=(10_000, 100_000), samples: int = 2000) -> Dict[str, Any]:
+    """
+    Archives : oubli de `size` concepts (ancien format, un fichier gzip par
+    concept, contre ajout en segments), rappel par get() de `samples` noms
+    oubliés (l'ancien format ne relit jamais ses archives : échec, concept
+    recréé) et rétention ramenant les archives au quart de leur taille.
+    """
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        with _bench_environment(max_ram_concepts=size + 1, write_behind_interval_s=3600,
+                                archive_segment_bytes=1 << 20) as tmp:
+            graph = KnowledgeGraph(tmp / "graph")
+            for i in range(size):
+                graph.add_concept(_synthetic_concept(i))
+            graph.flush()
+            concepts = list(graph.ram_cache.values())
+            
+            legacy_path = tmp / "legacy"
+            legacy_path.mkdir()
+            t0 = time.perf_counter()
+            for concept in concepts:
+                with gzip.open(legacy_path / f"{concept.id}_{int(time.time())}.json.gz", 'wt') as f:
+                    json.dump(concept.to_record(), f)
+            legacy_s = time.perf_counter() - t0
+            legacy_bytes = sum(p.stat().st_size for p in legacy_path.iterdir())
+            
+            for concept in concepts:
+                graph.temperatures.set(concept, CONFIG["freezing_threshold"] / 2)
+            t0 = time.perf_counter()
+            cooled = graph.cool_down()
+            cool_down_s = time.perf_counter() - t0
+            archive = graph.archive.get_stats()
+            
+            rng = random.Random(0)
+            latencies = []
+            for i in rng.sample(range(size), min(samples, size)):
+                t0 = time.perf_counter()
+                concept = graph.get(f"concept {i}")
+                latencies.append(time.perf_counter() - t0)
+            recall = graph.get_archive_stats()["recall"]
+            
+            CONFIG["archive_max_bytes"] = archive["bytes"] // 4
+            t0 = time.perf_counter()
+            retention = graph.archive.maintain()
+            retention_s = time.perf_counter() - t0
+            after = graph.archive.get_stats()
+            graph.close()
+            
+            results[str(size)] = {
+                "ancien": {"write_s": round(legacy_s, 3), "files": size, "bytes": legacy_bytes,
+                           "recall_hit_rate": 0.0},
+                "segments": {"cool_down_s": round(cool_down_s, 3), "archived": cooled["archived"],
+                             "files": archive["segments"] + 1, "bytes": archive["bytes"],
+                             "recall_hit_rate": recall["hit_rate"], "recall_late": recall["late"],
+                             "get_recall": _latency_stats(latencies)},
+                "retention": {"seconds": round(retention_s, 3), "dropped": retention["dropped"],
+                              "bytes_after": after["bytes"], "limit": CONFIG["archive_max_bytes"]},
+            }
+    return results
+
+def benchmark_decay(sizes=(100_000, 1_000_000), relations_per_concept: int = 10,
+                    heures: float = 24.0) -> Dict[str, Any]:
+    """
+    Oubli et renforcement sur `size` relations (concepts de
+    relations_per_concept relations, types de mémoire mélangés, un quart des
+    sources protégées) : passe vectorisée complète de la table (baisse des
+    températures et des poids, réchauffement par les accès, renforcement par
+    usage, masque des relations faibles) contre l'ancienne boucle
+    (Concept.cool_down puis filtre des relations de consolidate, concept par
+    concept ; les poids n'y étaient pas oubliés, d'où moins de relations
+    faibles).
+    """
+    results: Dict[str, Any] = {}
+    types = [MemoryType.EPISODIQUE, MemoryType.SOCIAL, MemoryType.NARRATIVE,
+             MemoryType.LITTERAIRE_ROMAN, MemoryType.PERMANENT]
+    sources = [SourceInfo(type=SourceWeight.REPORTED, timestamp=0.0)] * 3 + \
+              [SourceInfo(type=SourceWeight.EDUCATIVE, timestamp=0.0)]
+    for size in sizes:
+        rng = random.Random(0)
+        n_concepts = size // relations_per_concept
+        concepts = []
+        for i in range(n_concepts):
+            concept = Concept(id=f"concept_{i:08d}", nom=f"concept {i}",
+                              nature=ConceptNature.INSTANCE, memoire_type=types[i % len(types)],
+                              temperature=rng.uniform(0.3, 1.0))
+            for k in range(relations_per_concept):
+                concept.relations.append(Relation(
+                    type=RelationType.EST_UN, cible=f"concept_{(i + k + 1) % n_concepts:08d}",
+                    source_info=sources[(i + k) % len(sources)], poids=rng.uniform(0.2, 1.0)))
+            concepts.append(concept)
+        
+        table = TemperatureTable()
+        t0 = time.perf_counter()
+        for concept in concepts:
+            table.attach(concept)
+        attach_s = time.perf_counter() - t0
+        
+        # Accès et usages répartis sur un dixième des concepts
+        for concept in rng.sample(concepts, n_concepts // 10):
+            table.touch(concept.id)
+            table.use_relation(concept, rng.randrange(relations_per_concept), rng.randint(1, 5))
+        
+        t0 = time.perf_counter()
+        table.decay(heures)
+        reinforced = table.reinforce()
+        weak = table.weak_relations(CONFIG["relation_prune_threshold"])
+        pass_s = time.perf_counter() - t0
+        
+        t0 = time.perf_counter()
+        legacy_weak = 0
+        for concept in concepts:
+            concept.cool_down(heures)
+            kept = [r for r in concept.relations
+                    if r.poids > 0.3 or r.source_info.type.value > 0.7]
+            legacy_weak += len(kept) != len(concept.relations)
+        legacy_s = time.perf_counter() - t0
+        
+        results[str(size)] = {
+            "concepts": n_concepts,
+            "attach_s": round(attach_s, 3),
+            "vectorized_pass_ms": round(pass_s * 1000, 2),
+            "legacy_loop_ms": round(legacy_s * 1000, 2),
+            "speedup": round(legacy_s / pass_s, 1) if pass_s else None,
+            "reinforced": reinforced,
+            "concepts_with_weak_relations": len(weak),
+            "legacy_concepts_with_weak_relations": legacy_weak,
+        }
+    return results
+
+def benchmark_snapshot(sizes=(10_000, 100_000), changed_share: float = 0.01) -> Dict[str, Any]:
+    """
+    Instantanés d'un graphe de `size` concepts (base chargée sur disque,
+    concepts récents en RAM, une part oubliée dans les archives) pendant
+    qu'un fil lit et qu'un autre modifie le graphe : durée de l'instantané
+    complet et de sa coupure, latence des lectures pendant la copie, export
+    incrémental après modification de `changed_share` des concepts,
+    restauration de la chaîne et vérification du nombre de concepts.
+    L'ancienne sauvegarde (copie brute des répertoires, incohérente si le
+    graphe écrit pendant la copie) est chronométrée pour comparaison.
+    """
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        with _bench_environment(max_ram_concepts=2000, write_behind_interval_s=0.5) as tmp:
+            kb_path = tmp / "base.jsonl"
+            with open(kb_path, 'w', encoding='utf-8') as f:
+                for i in range(size):
+                    f.write(json.dumps({"nom": f"mot {i}", "nature": "objet", "aliases": [f"m{i}"],
+                                        "relations": [{"type": "est_un", "cible": f"mot {i // 10}"}]}) + "\n")
+            graph = KnowledgeGraph(tmp / "graph")
+            graph.bulk_load(lambda: iter_knowledge_base(kb_path),
+                            SourceInfo(type=SourceWeight.EDUCATIVE, timestamp=0.0))
+            for i in range(2000):
+                concept = _synthetic_concept(size + i)
+                concept.temperature = 0.05 if i % 4 == 0 else 0.8
+                graph.add_concept(concept)
+            graph.cool_down()
+            source = SourceInfo(type=SourceWeight.REPORTED, timestamp=0.0)
+            
+            stop = threading.Event()
+            latencies: List[float] = []
+            
+            def reader():
+                rng = random.Random(1)
+                while not stop.is_set():
+                    t0 = time.perf_counter()
+                    graph.get(f"mot {rng.randrange(size)}")
+                    latencies.append(time.perf_counter() - t0)
+            
+            def writer():
+                rng = random.Random(2)
+                while not stop.is_set():
+                    graph.add_propriete(graph.index_nom[f"mot {rng.randrange(size)}"], "vu",
+                                        rng.random(), "nombre", source)
+                    time.sleep(0.0005)
+            
+            threads = [threading.Thread(target=reader), threading.Thread(target=writer)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.2)
+            idle = _latency_stats(latencies)
+            latencies.clear()
+            full = graph.snapshot(tmp / "snap_full")
+            during = _latency_stats(latencies)
+            
+            t0 = time.perf_counter()
+            shutil.copytree(tmp / "graph", tmp / "copie_brute" / "graph")
+            shutil.copytree(CONFIG["archive_dir"], tmp / "copie_brute" / "archives")
+            copy_s = time.perf_counter() - t0
+            stop.set()
+            for thread in threads:
+                thread.join()
+            
+            rng = random.Random(3)
+            for i in rng.sample(range(size), int(size * changed_share)):
+                graph.add_propriete(graph.index_nom[f"mot {i}"], "revu", True, "booleen", source)
+            incremental = graph.export_changes(tmp / "snap_inc")
+            expected = graph.disk.count() + sum(1 for cid in graph._dirty if not graph.disk.contains(cid))
+            graph.close()
+            
+            restore = KnowledgeGraph.restore(tmp / "snap_inc", tmp / "restored", tmp / "restored_archives")
+            holds = graph.get_persistence_stats()["lock_hold"]
+            results[str(size)] = {
+                "full_s": full["elapsed_s"],
+                "full_cut_ms": full["cut_ms"],
+                "full_bytes": full["bytes"],
+                "lock_hold_snapshot": holds.get("snapshot"),
+                "get_idle": idle,
+                "get_during_snapshot": during,
+                "incremental_s": incremental["elapsed_s"],
+                "incremental_concepts": incremental["concepts"],
+                "incremental_bytes": incremental["bytes"],
+                "restore_s": restore["elapsed_s"],
+                "restored_concepts": restore["concepts"],
+                "expected_concepts": expected,
+                "copie_brute_s": round(copy_s, 3),
+            }
+    return results
+
+def benchmark_signatures(sizes=(1000, 100_000), dim: int = 192, queries: int = 500,
+                         k: int = 10) -> Dict[str, Any]:
+    """
+    Recherche de signatures parmi `size` personnes enrôlées (plongements de
+    dimension `dim`, regroupés en familles proches comme de vraies voix) :
+    chaque requête est une signature bruitée (similarité ≈ 0.8 avec
+    l'originale). Rapporte le rappel@k de l'index par rapport au parcours
+    exact, la part des requêtes dont la personne d'origine sort en tête,
+    les latences (index, parcours exact NumPy, ancien parcours linéaire en
+    Python sur un échantillon) et les durées d'enrôlement, d'apprentissage
+    et de rechargement (instantané, ou réconciliation depuis l'index exact).
+    """
+    results: Dict[str, Any] = {}
+    rng = np.random.default_rng(0)
+    for size in sizes:
+        families = rng.standard_normal((max(1, size // 50), dim)).astype(np.float32)
+        people = families[rng.integers(len(families), size=size)]
+        people += 0.8 * rng.standard_normal((size, dim)).astype(np.float32) * np.linalg.norm(
+            people, axis=1, keepdims=True) / math.sqrt(dim)
+        people /= np.linalg.norm(people, axis=1, keepdims=True)
+        keys = [encode_signature(v) for v in people]
+        owners = [f"personne_{i:08d}" for i in range(size)]
+        
+        index = SignatureIndex()
+        t0 = time.perf_counter()
+        for key, owner in zip(keys, owners):
+            index.add(key, owner)
+        enroll_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        if index.needs_training:
+            index.train()
+        train_s = time.perf_counter() - t0
+        
+        targets = rng.integers(size, size=queries)
+        probes = people[targets] + 0.75 * rng.standard_normal((queries, dim)).astype(np.float32) / math.sqrt(dim)
+        probes /= np.linalg.norm(probes, axis=1, keepdims=True)
+        ann_lat, exact_lat, recall, top1 = [], [], 0.0, 0
+        for target, probe in zip(targets.tolist(), probes):
+            t0 = time.perf_counter()
+            found = index.search(probe, k)
+            ann_lat.append(time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            scores = people @ probe
+            exact = np.argpartition(-scores, k - 1)[:k]
+            exact_lat.append(time.perf_counter() - t0)
+            recall += len({owner for owner, _ in found} & {owners[i] for i in exact.tolist()}) / k
+            top1 += bool(found) and found[0][0] == owners[target]
+        
+        vectors = [v.tolist() for v in people]
+        legacy_lat = []
+        for probe in probes[:20].tolist():
+            t0 = time.perf_counter()
+            max(range(size), key=lambda i: sum(a * b for a, b in zip(vectors[i], probe)))
+            legacy_lat.append(time.perf_counter() - t0)
+        
+        t0 = time.perf_counter()
+        state, blobs = index.state()
+        reloaded = SignatureIndex.from_state(state, blobs)
+        reload_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        SignatureIndex().reconcile(dict(zip(keys, owners)))
+        rebuild_s = time.perf_counter() - t0
+        
+        ann_lat.sort()
+        exact_lat.sort()
+        results[str(size)] = {
+            "recall_at_k": round(recall / queries, 4),
+            "top1_identity": round(top1 / queries, 4),
+            "k": k,
+            "lists": index.get_stats()["lists"],
+            "search_p50_ms": round(1000 * ann_lat[len(ann_lat) // 2], 3),
+            "search_p99_ms": round(1000 * ann_lat[int(len(ann_lat) * 0.99)], 3),
+            "exact_numpy_p50_ms": round(1000 * exact_lat[len(exact_lat) // 2], 3),
+            "legacy_python_scan_ms": round(1000 * sorted(legacy_lat)[len(legacy_lat) // 2], 1),
+            "enroll_s": round(enroll_s, 3),
+            "train_s": round(train_s, 3),
+            "reload_snapshot_s": round(reload_s, 3),
+            "rebuild_from_index_s": round(rebuild_s, 3),
+            "reloaded_same": len(reloaded) == len(index),
+        }
+    return results
+
+def benchmark_contexts(sizes=(1_000, 10_000), turns: int = 100, threads: int = 8) -> Dict[str, Any]:
+    """
+    Contextes de `size` conversations simultanées (une par couple
+    conversation/interlocuteur), `turns` tours chacune, horloge simulée :
+    coût d'un tour (open + record), mémoire par contexte (tracemalloc)
+    contre l'ancien contexte par interlocuteur à l'historique sans borne,
+    expiration de toutes les conversations après context_ttl_seconds, et
+    charge réelle : process() depuis `threads` fils sur `size` conversations,
+    avec vérification qu'aucun tour n'atterrit dans le contexte d'un autre.
+    """
+    import tracemalloc
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        entry: Dict[str, Any] = {}
+        rng = random.Random(0)
+        keys = [(f"conv_{i:06d}", f"interlocuteur_{i % 97}") for i in range(size)]
+        order = [keys[rng.randrange(size)] for _ in range(size * turns)]
+        clock = 1_000_000.0
+        step = 0.5 * CONFIG["context_ttl_seconds"] / len(order)  # tous vivants jusqu'à la fin
+        
+        store = ContextStore(now=clock)
+        samples = []
+        t_all = time.perf_counter()
+        for n, (conversation_id, speaker) in enumerate(order):
+            clock += step
+            if n % 64 == 0:
+                t0 = time.perf_counter()
+                store.open(conversation_id, speaker, clock).record("intent", speaker, clock)
+                samples.append(time.perf_counter() - t0)
+            else:
+                store.open(conversation_id, speaker, clock).record("intent", speaker, clock)
+        entry["turn"] = _latency_stats(samples)
+        entry["turns_per_s"] = round(len(order) / (time.perf_counter() - t_all))
+        entry["frames"] = len(store)
+        
+        clock += CONFIG["context_ttl_seconds"] + 2 * CONFIG["context_wheel_tick_s"]
+        t0 = time.perf_counter()
+        store.get("absente", "personne", clock)
+        entry["expire_all_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+        entry["frames_after_ttl"] = len(store)
+        del store
+        
+        # Mémoire : anneau borné contre l'ancien historique (liste sans borne, par interlocuteur)
+        for name in ("avant", "apres"):
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            if name == "apres":
+                store = ContextStore(now=1_000_000.0)
+                for n, (conversation_id, speaker) in enumerate(order):
+                    store.open(conversation_id, speaker, 1_000_000.0).record(f"intent_{n}", speaker, 1_000_000.0)
+            else:
+                legacy: Dict[str, Dict[str, Any]] = {}
+                for n, (conversation_id, speaker) in enumerate(order):
+                    frame = legacy.setdefault(conversation_id, {"who": speaker, "history": []})
+                    frame["history"].append(f"intent_{n}")
+            used = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            entry[f"bytes_per_conversation_{name}"] = round(used / size)
+            store = legacy = None
+        
+        # Charge : process() concurrent, chaque fil sur ses conversations
+        with _bench_environment() as tmp:
+            gem_path = tmp / "gem.json"
+            gem_path.write_text(json.dumps({"gem": {"nom": "Shirka"}}), encoding="utf-8")
+            core = CognitionCore(tmp / "data", gem_path)
+            load_turns = min(turns, 10)
+            
+            def worker(w: int):
+                for _ in range(load_turns):
+                    for conversation_id, speaker in keys[w::threads]:
+                        intent = core.process("bonjour", speaker=speaker, conversation_id=conversation_id)
+                        if core.contexts.get(conversation_id, speaker).history[-1] != intent.in_response_to:
+                            crossed.append(conversation_id)
+            
+            crossed: List[str] = []
+            pool = [threading.Thread(target=worker, args=(w,)) for w in range(threads)]
+            t0 = time.perf_counter()
+            for t in pool:
+                t.start()
+            for t in pool:
+                t.join()
+            elapsed = time.perf_counter() - t0
+            frames = [core.contexts.get(conversation_id, speaker) for conversation_id, speaker in keys]
+            entry["load"] = {"threads": threads, "process_per_s": round(size * load_turns / elapsed),
+                             "frames": len(core.contexts), "crossed_turns": len(crossed),
+                             "turns_ok": all(f is not None and f.turn == load_turns for f in frames),
+                             "max_history": max(len(f.history) for f in frames if f is not None),
+                             "latency": core.get_latency_stats()["idle"]}
+            core.stop()
+        results[str(size)] = entry
+    return results
+
+def benchmark_concurrent_reads(sizes=(10_000, 100_000), threads=(1, 4, 16),
+                               duration_s: float = 1.0, hold_ms: float = 1.0) -> Dict[str, Any]:
+    """
+    Débit et latence de get() (par ID, nom et alias de concepts en RAM) à 1, 4
+    et 16 threads, pendant qu'un autre thread tient le verrou du graphe
+    hold_ms sur 2 * hold_ms (chargement disque d'un échec, tranche de
+    maintenance). "verrou" rejoue l'ancien chemin (verrou + move_to_end +
+    marquage à chaque lecture), "sans_verrou" le chemin actuel.
+    """
+    import threading as _threading
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        with _bench_environment(max_ram_concepts=size + 1000) as tmp:
+            graph = KnowledgeGraph(tmp / "graph")
+            with graph._lock:
+                for i in range(size):
+                    concept = _synthetic_concept(i)
+                    concept.aliases = frozenset({f"alias {i}"})
+                    graph._ram_put(concept)
+                    graph._index_set("nom", concept.nom.lower(), concept.id)
+                    graph._index_set("alias", f"alias {i}", concept.id)
+            graph.flush()
+            keys = [k for i in range(size) for k in (f"concept_{i:08d}", f"concept {i}", f"alias {i}")]
+            
+            def locked_get(identifiant: str) -> Optional[Concept]:
+                with graph._lock:
+                    key = identifiant.lower()
+                    cid = (identifiant if identifiant in graph.ram_cache
+                           else graph.index_nom.get(key) or graph.index_alias.get(key))
+                    concept = graph.ram_cache.get(cid) if cid else None
+                    if concept is not None:
+                        graph.ram_cache.move_to_end(cid)
+                        concept.last_accessed = time.time()
+                        concept.access_count += 1
+                        graph._mark_dirty(concept)
+                    return concept
+            
+            for mode, lookup in (("verrou", locked_get), ("sans_verrou", graph.get)):
+                for n_threads in threads:
+                    stop = _threading.Event()
+                    counts = [0] * n_threads
+                    latencies: List[float] = []
+                    
+                    def reader(slot: int):
+                        rng = random.Random(slot)
+                        n = 0
+                        samples = []
+                        while not stop.is_set():
+                            for _ in range(99):
+                                lookup(keys[rng.randrange(len(keys))])
+                            t0 = time.perf_counter()
+                            lookup(keys[rng.randrange(len(keys))])
+                            samples.append(time.perf_counter() - t0)
+                            n += 100
+                        counts[slot] = n
+                        latencies.extend(samples)
+                    
+                    def holder():
+                        while not stop.is_set():
+                            with graph._locked("benchmark"):
+                                time.sleep(hold_ms / 1000)
+                            time.sleep(hold_ms / 1000)
+                    
+                    workers = [_threading.Thread(target=reader, args=(t,)) for t in range(n_threads)]
+                    workers.append(_threading.Thread(target=holder))
+                    for w in workers:
+                        w.start()
+                    time.sleep(duration_s)
+                    stop.set()
+                    for w in workers:
+                        w.join()
+                    results[f"{mode}/{size}/{n_threads}_threads"] = {
+                        "lookups_per_s": round(sum(counts) / duration_s),
+                        "latency": _latency_stats(latencies),
+                    }
+                graph.flush()
+            graph.close()
+    return results
+
+def benchmark_traversal(sizes=(10_000, 100_000), branching: int = 2, samples: int = 200,
+                        max_ram: int = 1000) -> Dict[str, Any]:
+    """
+    Taxonomie synthétique profonde (arbre EST_UN de facteur `branching`,
+    profondeur ~log_b(size)), essentiellement sur disque. Remontée feuille →
+    racine : get() répétés (ancien chemin), parcours sur index, parcours pondéré
+    avec préchargement, fermeture transitive froide puis en cache ; et
+    descendants pondérés d'un nœud intermédiaire (jusqu'à 1000).
+    """
+    rng = random.Random(0)
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        with _bench_environment(max_ram_concepts=max_ram) as tmp:
+            graph = KnowledgeGraph(tmp / "graph")
+            for start in range(0, size, 10_000):
+                batch = []
+                for i in range(start, min(size, start + 10_000)):
+                    concept = Concept(id=f"taxon_{i:08d}", nom=f"taxon {i}", nature=ConceptNature.CATEGORIE)
+                    if i:
+                        concept.relations.append(Relation(
+                            type=RelationType.EST_UN, cible=f"taxon_{(i - 1) // branching:08d}",
+                            source_info=SourceInfo(type=SourceWeight.EDUCATIVE, timestamp=0.0,
+                                                   confidence=rng.choice((0.8, 0.9, 1.0))),
+                            poids=rng.choice((0.5, 1.0))))
+                    batch.append(concept)
+                graph.disk.save_many(batch)
+                with graph._lock:
+                    for concept in batch:
+                        graph._index_set("nom", concept.nom.lower(), concept.id)
+                        graph._index_concept(concept)
+            graph.disk.flush()
+            root = "taxon_00000000"
+            leaves = [f"taxon_{i:08d}" for i in rng.sample(range(size // 2, size), min(samples, size // 2))]
+            
+            def chained_get(leaf: str) -> int:
+                hops = 0
+                concept = graph.get(leaf)
+                while concept is not None:
+                    parents = concept.get_relations(RelationType.EST_UN)
+                    if not parents:
+                        break
+                    concept = graph.get(parents[0].cible)
+                    hops += 1
+                return hops
+            
+            timings: Dict[str, List[float]] = defaultdict(list)
+            depths = []
+            for leaf in leaves:
+                t0 = time.perf_counter()
+                depths.append(chained_get(leaf))
+                timings["get_en_chaine"].append(time.perf_counter() - t0)
+            # Réinitialise la RAM : chaque mesure part d'un graphe froid
+            graph.flush()
+            with graph._lock:
+                for concept in list(graph.ram_cache.values()):
+                    graph.temperatures.detach(concept)
+                graph.ram_cache.clear()
+            for leaf in leaves:
+                t0 = time.perf_counter()
+                result = graph.traverse(leaf, types=(RelationType.EST_UN,), max_depth=64)
+                timings["parcours_index"].append(time.perf_counter() - t0)
+                assert result.ids()[-1] == root
+            disk_loads = 0
+            for leaf in leaves:
+                t0 = time.perf_counter()
+                result = graph.traverse(leaf, types=(RelationType.EST_UN,), max_depth=64,
+                                        mode="best", weighted=True)
+                timings["parcours_pondere"].append(time.perf_counter() - t0)
+                disk_loads += result.disk_loads
+            for key in ("fermeture_froide", "fermeture_en_cache"):
+                for leaf in leaves:
+                    t0 = time.perf_counter()
+                    graph.closure(leaf)
+                    timings[key].append(time.perf_counter() - t0)
+            descendants = []
+            for node in rng.sample(range(1, min(size, 64)), min(samples, 32)):
+                t0 = time.perf_counter()
+                result = graph.traverse(f"taxon_{node:08d}", types=(RelationType.EST_UN,),
+                                        direction="entrant", max_depth=64, max_nodes=1000, weighted=True)
+                timings["descendants_ponderes"].append(time.perf_counter() - t0)
+                descendants.append(result.disk_loads)
+            graph.close()
+            
+            entry: Dict[str, Any] = {name: _latency_stats(samples_s) for name, samples_s in timings.items()}
+            entry["profondeur_moyenne"] = round(sum(depths) / len(depths), 1)
+            entry["chargements_disque_par_parcours_pondere"] = round(disk_loads / len(leaves), 1)
+            entry["chargements_disque_par_descendants"] = round(sum(descendants) / len(descendants), 1)
+            results[str(size)] = entry
+    return results
+
+def benchmark_sentence_cache(sizes=(1_000, 10_000)) -> Dict[str, Any]:
+    """
+    Coût de SentenceBuilder.build() sur des réponses répétées (social, heure,
+    question is-a, personne inconnue), chacune avec un identifiant neuf comme
+    dans process() : cache adressé par contenu contre cache désactivé (ancienne
+    clé par identifiant d'intent, jamais touchée). Vérifie aussi l'invalidation
+    après modification d'un concept cité.
+    """
+    from dataclasses import replace
+    results: Dict[str, Any] = {}
+    source = SourceInfo(type=SourceWeight.EDUCATIVE)
+    questions = ["bonjour", "merci", "au revoir", "quelle heure est-il ?",
+                 "est-ce qu'un chat est un animal ?", "le chien est-il un animal ?", "qui est Paul ?"]
+    for size in sizes:
+        entry = {}
+        for mode, cache_size in (("sans_cache", 0), ("contenu", CONFIG["sentence_cache_size"])):
+            with _bench_environment(sentence_cache_size=cache_size) as tmp:
+                gem_path = tmp / "gem.json"
+                gem_path.write_text(json.dumps({"gem": {"nom": "Shirka"}}), encoding="utf-8")
+                core = CognitionCore(tmp / "data", gem_path)
+                core.graph.add_relation("chat", RelationType.EST_UN, "animal", source)
+                core.graph.add_relation("chien", RelationType.EST_UN, "mammifère", source)
+                responses = [core._process(q, "text", "intent") for q in questions]
+                intents = [replace(responses[k % len(responses)], id=f"resp_{k:08d}") for k in range(size)]
+                
+                t0 = time.perf_counter()
+                for intent in intents:
+                    core.builder.build(intent)
+                elapsed = time.perf_counter() - t0
+                
+                # Le chien devient un animal : la réponse en cache doit disparaître
+                core.graph.add_relation("mammifère", RelationType.EST_UN, "animal", source)
+                after = core._process("le chien est-il un animal ?", "text", "text")
+                entry[mode] = {"us_per_build": round(elapsed / size * 1e6, 2),
+                               "cache": core.builder.get_cache_stats(),
+                               "reponse_apres_modification": after}
+                core.stop()
+        results[str(size)] = entry
+    return results
+
+def _legacy_route(text_lower: str) -> Tuple[str, str]:
+    """Ancienne chaîne de tests de _text_to_intent, pour comparaison."""
+    if text_lower.endswith("?"):
+        if "heure" in text_lower:
+            return "question", "time"
+        elif "qui" in text_lower:
+            return "question", "person"
+        elif "saison" in text_lower:
+            return "question", "saison"
+        elif IS_A_PATTERN.search(text_lower):
+            return "question", "is_a"
+        return "question", "general"
+    elif any(w in text_lower for w in ["bonjour", "salut", "coucou"]):
+        return "social", "greeting"
+    elif any(w in text_lower for w in ["au revoir", "bye"]):
+        return "social", "farewell"
+    elif any(w in text_lower for w in ["merci"]):
+        return "social", "thanks"
+    return "information", "statement"
+
+def benchmark_intent_router(sizes=(100_000,), repeats: int = 3) -> Dict[str, Any]:
+    """
+    Débit de process() sur le chemin à règles seules (social, heure, saison,
+    énoncé ; aucune lecture du graphe), sortie intent et texte, meilleur de
+    `repeats` passes : énoncés répétés (routage mémorisé) et énoncés tous
+    différents. Coût du routage seul : ancienne chaîne contre IntentRouter.
+    """
+    base = ["bonjour", "merci", "au revoir", "quelle heure est-il ?", "c'est quelle saison ?",
+            "il fait beau", "salut toi", "bye"]
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        with _bench_environment() as tmp:
+            gem_path = tmp / "gem.json"
+            gem_path.write_text(json.dumps({"gem": {"nom": "Shirka"}}), encoding="utf-8")
+            core = CognitionCore(tmp / "data", gem_path)
+            corpora = {
+                "repetes": [base[i % len(base)] for i in range(size)],
+                "uniques": [f"{base[i % len(base)].rstrip(' ?')} {i}" + (" ?" if base[i % len(base)].endswith("?") else "")
+                            for i in range(size)],
+            }
+            entry: Dict[str, Any] = {}
+            for corpus_name, corpus in corpora.items():
+                for output_type in ("intent", "text"):
+                    best = float("inf")
+                    for _ in range(repeats):
+                        core.router._memo.clear()
+                        t0 = time.perf_counter()
+                        for text in corpus:
+                            core.process(text, output_type=output_type)
+                        best = min(best, time.perf_counter() - t0)
+                    entry[f"process_{output_type}/{corpus_name}"] = {"utterances_per_s": round(size / best)}
+            
+            lowered = [text.lower() for text in corpora["uniques"]]
+            for name, route in (("ancien", _legacy_route), ("routeur", core.router.route)):
+                core.router._memo.clear()
+                t0 = time.perf_counter()
+                for text in lowered:
+                    route(text)
+                entry[f"routage_seul/uniques/{name}"] = {
+                    "us_per_utterance": round((time.perf_counter() - t0) / size * 1e6, 3)}
+            assert all(_legacy_route(t) == core.router.route(t) for t in lowered)
+            core.stop()
+            results[str(size)] = entry
+    return results
+
+def benchmark_batch(sizes=(10_000, 100_000), batch_sizes=(1, 8, 64, 256, 1024),
+                    utterances: int = 20_000, max_ram: int = 1000) -> Dict[str, Any]:
+    """
+    Débit de process_batch() pour des lots de 1 à 1024 énoncés (moitié
+    questions "qui est X ?" sur des personnes majoritairement sur disque,
+    moitié social/heure, huit interlocuteurs), comparé à une boucle de
+    process(), avec la durée par énoncé de chaque étape.
+    """
+    results: Dict[str, Any] = {}
+    social = ["bonjour", "merci", "quelle heure est-il ?", "au revoir"]
+    for size in sizes:
+        with _bench_environment(max_ram_concepts=max_ram) as tmp:
+            gem_path = tmp / "gem.json"
+            gem_path.write_text(json.dumps({"gem": {"nom": "Shirka"}}), encoding="utf-8")
+            core = CognitionCore(tmp / "data", gem_path)
+            graph = core.graph
+            for start in range(0, size, 10_000):
+                batch = [Concept(id=f"personne_{i:08d}", nom=f"personne {i}", nature=ConceptNature.PERSONNE,
+                                 memoire_type=MemoryType.SOCIAL) for i in range(start, min(size, start + 10_000))]
+                graph.disk.save_many(batch)
+                with graph._lock:
+                    for concept in batch:
+                        graph._index_set("nom", concept.nom.lower(), concept.id)
+                        graph._index_concept(concept)
+            graph.disk.flush()
+            graph._rebuild_lookup_filter()
+            
+            rng = random.Random(0)
+            corpus = [(f"locuteur {k % 8}",
+                       f"qui est personne {rng.randrange(size)} ?" if k % 2 else social[k % len(social)])
+                      for k in range(utterances)]
+            entry: Dict[str, Any] = {}
+            
+            t0 = time.perf_counter()
+            for speaker, text in corpus:
+                core.process(text, output_type="text", speaker=speaker)
+            entry["process_en_boucle"] = {"utterances_per_s": round(utterances / (time.perf_counter() - t0))}
+            
+            for batch_size in batch_sizes:
+                for samples in core._batch_stages.values():
+                    samples.clear()
+                t0 = time.perf_counter()
+                for i in range(0, utterances, batch_size):
+                    core.process_batch(corpus[i:i + batch_size], output_type="text")
+                elapsed = time.perf_counter() - t0
+                stages = core.get_batch_stats()
+                entry[f"lot_{batch_size}"] = {
+                    "utterances_per_s": round(utterances / elapsed),
+                    "us_par_enonce": {stage: round(stats["avg_ms"] * 1000, 2)
+                                      for stage, stats in stages.items() if stats},
+                }
+            core.stop()
+            results[str(size)] = entry
+    return results
+
+def _legacy_concept_classes():
+    """Ancienne représentation (dataclasses à __dict__, listes de Relation) pour comparaison."""
+    from dataclasses import make_dataclass
+    source_cls = make_dataclass("LegacySourceInfo", [
+        ("type", SourceWeight), ("speaker", Optional[str], None),
+        ("timestamp", float, field(default_factory=time.time)), ("confidence", float, 1.0),
+        ("metadata", dict, field(default_factory=dict))])
+    relation_cls = make_dataclass("LegacyRelation", [
+        ("type", RelationType), ("cible", str), ("source_info", Any), ("poids", float, 1.0),
+        ("bidirectionnelle", bool, True), ("metadata", dict, field(default_factory=dict))])
+    propriete_cls = make_dataclass("LegacyPropriete", [
+        ("nom", str), ("valeur", Any), ("type", str), ("source_info", Any), ("confiance", float, 1.0)])
+    concept_cls = make_dataclass("LegacyConcept", [
+        ("id", str), ("nom", str), ("nature", ConceptNature),
+        ("memoire_type", MemoryType, MemoryType.PERMANENT),
+        ("storage_level", StorageLevel, StorageLevel.RAM),
+        ("relations", list, field(default_factory=list)),
+        ("proprietes", dict, field(default_factory=dict)),
+        ("aliases", set, field(default_factory=set)),
+        ("created", float, field(default_factory=time.time)),
+        ("last_accessed", float, field(default_factory=time.time)),
+        ("access_count", int, 0), ("temperature", float, 1.0),
+        ("importance", float, 0.5), ("poids", float, 1.0)])
+    return source_cls, relation_cls, propriete_cls, concept_cls
+
+def benchmark_concept_memory(sizes=(10_000, 100_000), n_relations: int = 5) -> Dict[str, Any]:
+    """
+    Octets par concept en RAM (tracemalloc), ancienne représentation contre
+    représentation compacte, et coût de sérialisation (asdict contre to_record).
+    Chaque concept : n_relations relations, une propriété, un alias ; les
+    relations d'un même chargement partagent leur source, comme en pratique.
+    """
+    import tracemalloc
+    from dataclasses import asdict as dataclass_asdict
+    source_cls, relation_cls, propriete_cls, concept_cls = _legacy_concept_classes()
+    
+    def build_legacy(i: int):
+        c = concept_cls(id=f"concept_{i:08d}", nom=f"concept {i}", nature=ConceptNature.INSTANCE,
+                        memoire_type=MemoryType.EPISODIQUE, aliases={f"alias {i}"})
+        for k in range(n_relations):
+            c.relations.append(relation_cls(type=RelationType.EST_UN, cible=f"concept_{(i + k + 1):08d}",
+                                            source_info=source_cls(type=SourceWeight.EDUCATIVE, timestamp=0.0)))
+        c.proprietes["definition"] = propriete_cls(nom="definition", valeur=f"définition {i}", type="texte",
+                                                   source_info=source_cls(type=SourceWeight.EDUCATIVE,
+                                                                          timestamp=0.0))
+        return c
+    
+    def build_compact(i: int):
+        source = SourceInfo(type=SourceWeight.EDUCATIVE, timestamp=0.0)
+        c = Concept(id=f"concept_{i:08d}", nom=f"concept {i}", nature=ConceptNature.INSTANCE,
+                    memoire_type=MemoryType.EPISODIQUE, aliases={f"alias {i}"})
+        for k in range(n_relations):
+            c.add_relation(RelationType.EST_UN, f"concept_{(i + k + 1):08d}", source)
+        c.add_propriete("definition", f"définition {i}", "texte", source)
+        return c
+    
+    results: Dict[str, Any] = {}
+    for size in sizes:
+        entry = {}
+        for name, build, serialize in (("avant", build_legacy, dataclass_asdict),
+                                       ("apres", build_compact, Concept.to_record)):
+            # Les identifiants cibles sont internés avant mesure (partagés avec les index)
+            for i in range(size + n_relations + 1):
+                CONCEPT_IDS.to_int(f"concept_{i:08d}")
+            tracemalloc.start()
+            before = tracemalloc.get_traced_memory()[0]
+            concepts = [build(i) for i in range(size)]
+            used = tracemalloc.get_traced_memory()[0] - before
+            tracemalloc.stop()
+            
+            sample = concepts[:min(size, 5000)]
+            t0 = time.perf_counter()
+            for c in sample:
+                serialize(c)
+            serialize_us = (time.perf_counter() - t0) / len(sample) * 1e6
+            entry[name] = {"bytes_per_concept": round(used / size),
+                           "serialize_us_per_concept": round(serialize_us, 2)}
+            del concepts, sample
+        entry["ratio"] = round(entry["avant"]["bytes_per_concept"] / entry["apres"]["bytes_per_concept"], 2)
+        results[str(size)] = entry
+    return results
 
 # ============================================================
 # EXEMPLES DE FICHIERS DE CONNAISSANCES
@@ -1521,12 +7209,57 @@ Exemple gem.json:
 # ============================================================
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description=f"CognitionCore v{__version__}")
+    benchmarks = {
+        "disk": benchmark_disk_backends,
+        "index": benchmark_index_journal,
+        "query": benchmark_query,
+        "write-behind": benchmark_write_behind,
+        "lookup": benchmark_lookup_filter,
+        "bulk-load": benchmark_bulk_load,
+        "maintenance": benchmark_maintenance,
+        "memory": benchmark_concept_memory,
+        "concurrent-reads": benchmark_concurrent_reads,
+        "traversal": benchmark_traversal,
+        "sentence-cache": benchmark_sentence_cache,
+        "intent-router": benchmark_intent_router,
+        "batch": benchmark_batch,
+        "scheduler": benchmark_scheduler,
+        "startup": benchmark_startup,
+        "archive": benchmark_archive,
+        "decay": benchmark_decay,
+        "snapshot": benchmark_snapshot,
+        "signatures": benchmark_signatures,
+        "contexts": benchmark_contexts,
+    }
+    parser.add_argument("--benchmark", choices=sorted(benchmarks), help="Exécute un benchmark")
+    parser.add_argument("--sizes", type=str, default="10000,100000",
+                        help="Tailles de graphe pour les benchmarks (ex: 10000,100000,1000000)")
+    parser.add_argument("--migrate-disk", nargs=2, metavar=("SOURCE", "CIBLE"),
+                        help="Migre le niveau disque de ./data/graph (ex: files sqlite)")
+    args = parser.parse_args()
+    
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s.%(msecs)03d %(levelname)-8s [%(name)s] %(message)s",
         datefmt="%H:%M:%S"
     )
     
+    if args.benchmark:
+        sizes = tuple(int(x) for x in args.sizes.split(","))
+        print(json.dumps(benchmarks[args.benchmark](sizes=sizes), indent=2))
+        raise SystemExit(0)
+    
+    if args.migrate_disk:
+        graph_path = Path("./data") / "graph"
+        source = open_disk_backend(args.migrate_disk[0], graph_path)
+        target = open_disk_backend(args.migrate_disk[1], graph_path)
+        migrate_disk_backend(source, target)
+        source.close()
+        target.close()
+        raise SystemExit(0)
+    
     # Créer les répertoires
     data_path = Path("./data")
     bases_path = Path("./bases")
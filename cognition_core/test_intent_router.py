@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Routage des questions par IntentRouter : "qui" n'est une question sur une
+personne que lorsqu'il est un mot, pas une partie du sujet.
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from cognition_core import IntentRouter
+
+
+@pytest.mark.parametrize("text, target", [
+    ("qui est paul ?", ("question", "person")),
+    ("est-ce qu'un chat est un animal ?", ("question", "is_a")),
+    ("est-ce qu'un requin est un poisson ?", ("question", "is_a")),
+    ("est-ce qu'un coquillage est un animal ?", ("question", "is_a")),
+    ("l'équipe est-elle une famille ?", ("question", "is_a")),
+])
+def test_question_routes(text, target):
+    assert IntentRouter().route(text) == target
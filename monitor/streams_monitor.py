@@ -5,12 +5,18 @@ import threading
 import time
 import json
 import logging
-from collections import deque
+from collections import deque, OrderedDict
+import socket
 import numpy as np
 import zenoh
-import pygame
 import math
 
+try:
+    import pygame
+    PYGAME_AVAILABLE = True
+except ImportError:
+    PYGAME_AVAILABLE = False
+
 # --- Configuration des logs ---
 logger = logging.getLogger("StreamsMonitor")
 logger.setLevel(logging.INFO)
@@ -43,6 +49,87 @@ class ConfigLoader:
             logger.error(f"Invalid JSON in configuration file: {e}")
             raise
 
+# ============================================================================
+# Zenoh helpers
+# ============================================================================
+
+def open_zenoh_session(config):
+    """Ouvre une session Zenoh à partir de la section 'zenoh' de la configuration."""
+    conf = zenoh.Config()
+    zc = config.get('zenoh', {})
+    
+    if 'mode' in zc:
+        conf.insert_json5("mode", json.dumps(zc['mode']))
+    
+    if 'connect' in zc and 'endpoints' in zc['connect']:
+        endpoints = zc['connect']['endpoints']
+        if isinstance(endpoints, list):
+            conf.insert_json5("connect/endpoints", json.dumps(endpoints))
+    
+    try:
+        session = zenoh.open(conf)
+        logger.info("Zenoh session opened successfully")
+        return session
+    except Exception as e:
+        logger.error(f"Failed to open Zenoh session: {e}")
+        raise
+
+def group_key_exprs(group):
+    """
+    Expressions wildcard couvrant un groupe : 'key_expr' explicite, sinon
+    préfixe commun des topics suivi de '/**' (ex: soma/energy + soma/cpu → soma/**).
+    """
+    if group.get('key_expr'):
+        return [group['key_expr']]
+    topics = [el['topic'].split('/') for el in group['elements']]
+    if not topics:
+        return []
+    if len(topics) == 1:
+        return ['/'.join(topics[0])]
+    prefix = []
+    for parts in zip(*topics):
+        if len(set(parts)) != 1:
+            break
+        prefix.append(parts[0])
+    if prefix:
+        return ['/'.join(prefix) + '/**']
+    # Aucun préfixe commun : un abonnement par topic
+    return list(dict.fromkeys('/'.join(t) for t in topics))
+
+def subscription_plan(config):
+    """
+    Liste des abonnements à déclarer : {'key_expr', 'group', 'type'}.
+    Les groupes de la configuration donnent leurs wildcards, la section
+    'discovery' ajoute des expressions libres (groupées ensuite par préfixe).
+    Une expression déjà incluse dans une précédente est ignorée pour ne pas
+    recevoir deux fois le même échantillon.
+    """
+    default_type = config.get('discovery', {}).get(
+        'default_type', next(iter(config['element_types']), 'nerf'))
+    candidates = []
+    for group in config['groups']:
+        group_type = group['elements'][0]['type'] if group['elements'] else default_type
+        for key_expr in group_key_exprs(group):
+            candidates.append({'key_expr': key_expr, 'group': group['name'], 'type': group_type})
+    for entry in config.get('discovery', {}).get('key_exprs', []):
+        if isinstance(entry, str):
+            entry = {'key_expr': entry}
+        candidates.append({'key_expr': entry['key_expr'], 'group': entry.get('group'),
+                           'type': entry.get('type', default_type)})
+    
+    plan = []
+    for candidate in candidates:
+        ke = zenoh.KeyExpr(candidate['key_expr'])
+        if any(zenoh.KeyExpr(p['key_expr']).includes(ke) for p in plan):
+            continue
+        plan = [p for p in plan if not ke.includes(zenoh.KeyExpr(p['key_expr']))]
+        plan.append(candidate)
+    return plan
+
+def wildcard_key_exprs(config):
+    """Expressions wildcard à souscrire pour couvrir toute la configuration."""
+    return [p['key_expr'] for p in subscription_plan(config)]
+
 # ============================================================================
 # Color Pulse Engine
 # ============================================================================
@@ -99,60 +186,160 @@ class ColorPulseEngine:
 # ============================================================================
 
 class StreamLine:
+    """
+    Modèle d'un flux observé.
+    Chemin d'ingestion minimal : seul l'horodatage de chaque impulsion est
+    conservé dans un anneau NumPy préalloué, le dernier payload est gardé par
+    référence (brut ou décodé) et la fréquence est calculée au rendu.
+    """
+
+    FREQUENCY_SAMPLES = 10   # Nombre d'intervalles utilisés pour la fréquence
+    MAX_FREQUENCY = 1000.0   # Max 1000 Hz
+
     def __init__(self, topic, type_name, color_engine, window_duration=5.0, max_impulses=1000):
         self.topic = topic
         self.type = type_name
         self.color_engine = color_engine
         self.window_duration = window_duration  # Durée de la fenêtre temporelle
         self.max_impulses = max_impulses
-        self.impulse_history = deque(maxlen=max_impulses)  # (timestamp, payload)
+        self._timestamps = np.zeros(max_impulses, dtype=np.float64)  # Anneau d'horodatages
+        self._head = 0  # Prochaine case d'écriture
+        self._count = 0  # Nombre de cases valides
         self.last_message_time = None
-        self.current_frequency = 0.0
-        self.frequency_history = deque(maxlen=10)
-        self.last_payload = {}
         self.message_count = 0
+        self._last_payload = None  # Référence brute (bytes/str) ou déjà décodée
+        self._payload_raw = False
         self._lock = threading.Lock()
-        
-    def on_message_received(self, payload):
+
+    def on_message_received(self, payload, raw=False):
+        """
+        Enregistre une impulsion. Appelé depuis le thread Zenoh : aucune copie,
+        aucun décodage, aucun calcul de fréquence ici.
+
+        Args:
+            payload: payload décodé, ou octets bruts si raw=True
+            raw: True si le payload doit être décodé paresseusement au rendu
+        """
+        now = time.time()
         with self._lock:
-            now = time.time()
-            self.impulse_history.append((now, payload.copy()))  # Stocker le payload complet
+            self._timestamps[self._head] = now
+            self._head = (self._head + 1) % self.max_impulses
+            if self._count < self.max_impulses:
+                self._count += 1
             self.message_count += 1
-            self.last_payload = payload.copy()
-            
-            # Calcul de la fréquence instantanée
-            if self.last_message_time:
-                dt = now - self.last_message_time
-                if dt > 0.001:
-                    instant_freq = 1.0 / dt
-                    if instant_freq < 1000:  # Max 1000 Hz
-                        self.frequency_history.append(instant_freq)
-                        self.current_frequency = np.mean(self.frequency_history) if self.frequency_history else 0.0
-            
             self.last_message_time = now
-    
+            self._last_payload = payload
+            self._payload_raw = raw
+
+    @property
+    def last_payload(self):
+        """Dernier payload, décodé à la demande (uniquement pour les flux affichés)."""
+        with self._lock:
+            payload, raw = self._last_payload, self._payload_raw
+        if not raw:
+            return payload if payload is not None else {}
+        try:
+            decoded = json.loads(payload)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            logger.error(f"JSON decode error for topic {self.topic}: {e}")
+            decoded = {"raw": repr(payload)[:200]}
+        with self._lock:
+            # Ne mémoriser le décodage que si aucun message plus récent n'est arrivé
+            if self._last_payload is payload:
+                self._last_payload = decoded
+                self._payload_raw = False
+        return decoded
+
+    @property
+    def current_frequency(self):
+        """Fréquence moyenne sur les derniers intervalles, calculée depuis l'anneau."""
+        with self._lock:
+            n = min(self._count, self.FREQUENCY_SAMPLES + 1)
+            if n < 2:
+                return 0.0
+            idx = (self._head - n + np.arange(n)) % self.max_impulses
+            recent = self._timestamps[idx]
+        dt = np.diff(recent)
+        dt = dt[dt > 0.001]
+        if dt.size == 0:
+            return 0.0
+        freqs = 1.0 / dt
+        freqs = freqs[freqs < self.MAX_FREQUENCY]
+        return float(freqs.mean()) if freqs.size else 0.0
+
+    @property
+    def payload_version(self):
+        """Compteur changeant à chaque nouveau payload (invalidation des rendus)."""
+        return self.message_count
+
     def get_recent_impulses(self, current_time):
-        """Retourne les impulsions dans la fenêtre temporelle"""
+        """
+        Retourne les horodatages (np.ndarray chronologique) dans la fenêtre temporelle.
+        L'anneau est formé de deux segments triés : la borne est trouvée par
+        recherche dichotomique dans chacun, sans parcourir l'historique.
+        """
+        cutoff = current_time - self.window_duration
         with self._lock:
-            cutoff = current_time - self.window_duration
-            recent = [(ts, payload) for ts, payload in self.impulse_history if ts >= cutoff]
-            return recent
+            if self._count < self.max_impulses:
+                segment = self._timestamps[:self._count]
+                return segment[np.searchsorted(segment, cutoff):].copy()
+            older = self._timestamps[self._head:]
+            newer = self._timestamps[:self._head]
+            if newer.size == 0:  # tête revenue à 0 : l'anneau entier est trié
+                return older[np.searchsorted(older, cutoff):].copy()
+            if newer[0] >= cutoff:
+                return np.concatenate((older[np.searchsorted(older, cutoff):], newer))
+            return newer[np.searchsorted(newer, cutoff):].copy()
+
+# ============================================================================
+# Cache de surfaces de texte
+# ============================================================================
+
+class TextSurfaceCache:
+    """
+    Cache LRU des surfaces rendues par font.render, indexé par (police, texte,
+    couleur). Réservé aux textes stables (noms de topics, titres) : un texte
+    qui change à chaque image chasserait les entrées utiles.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+
+    def render(self, font, text, color):
+        key = (id(font), text, color)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            return surf
+        surf = font.render(text, True, color)
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()
 
 # ============================================================================
 # Groupe pliable/dépliable
 # ============================================================================
 
 class CollapsibleGroup:
-    def __init__(self, name, elements, x, y, width):
+    def __init__(self, name, elements, x, y, width, discovered=False):
         self.name = name
         self.elements = elements
         self.x = x
         self.y = y
         self.width = width
+        self.discovered = discovered  # Groupe créé automatiquement (préfixe de clé)
         self.expanded = True
         self.height = 30  # Hauteur du titre uniquement
         self.collapsed_height = 30
-        self.expanded_height = 30 + len(elements) * 120  # Titre + éléments
+    
+    @property
+    def expanded_height(self):
+        return 30 + len(self.elements) * 120  # Titre + éléments
         
     def toggle(self):
         self.expanded = not self.expanded
@@ -170,6 +357,8 @@ class CollapsibleGroup:
 
 class StreamsMonitor:
     def __init__(self, config_filepath):
+        if not PYGAME_AVAILABLE:
+            raise RuntimeError("pygame is required for the GUI monitor (use --headless)")
         pygame.init()
         
         # Configuration
@@ -177,6 +366,8 @@ class StreamsMonitor:
         self.color_engine = ColorPulseEngine(self.config)
         self.window_duration = self.config.get('oscilloscope', {}).get('window_duration', 5.0)
         self.target_fps = self.config.get('oscilloscope', {}).get('fps', 30)
+        # Décodage JSON paresseux : seuls les flux affichés décodent leur dernier payload
+        self.lazy_decode = self.config.get('oscilloscope', {}).get('lazy_decode', True)
         
         # Signal handlers pour fermeture propre
         self._setup_signal_handlers()
@@ -184,9 +375,24 @@ class StreamsMonitor:
         # Zenoh Init
         self.zenoh_session = self._setup_zenoh()
         
+        # Découverte dynamique des flux (wildcards)
+        dc = self.config.get('discovery', {})
+        self.max_streams = dc.get('max_streams', 256)
+        self.idle_timeout = dc.get('idle_timeout', 300.0)  # 0 = jamais d'éviction périodique
+        self.evict_min_idle = dc.get('evict_min_idle', 10.0)  # Inactivité minimale pour céder sa place
+        self.group_depth = dc.get('group_depth', 2)
+        self.discovered_max_impulses = dc.get('max_impulses', 500)
+        self.dropped_streams = 0
+        self._streams_lock = threading.Lock()
+        self._pending_added = deque()  # (nom de groupe, StreamLine) à intégrer au rendu
+        self._pending_removed = deque()  # StreamLine évincés à retirer des groupes
+        
         # Streams & Groups
         self.streams = {}
+        self.pinned_topics = set()  # Topics déclarés dans la configuration (jamais évincés)
         self.groups = []
+        self._groups_by_name = {}
+        self.subscribers = []
         self._setup_subscribers()
         
         # Pygame Setup - Taille initiale 800x600
@@ -198,6 +404,11 @@ class StreamsMonitor:
         self.font_small = pygame.font.SysFont("Monospace", 11)
         self.font_payload = pygame.font.SysFont("Monospace", 9)
         
+        # Caches de rendu : surfaces de texte, fonds de titre, lignes de payload
+        self.text_cache = TextSurfaceCache()
+        self._title_backgrounds = {}  # largeur → Surface du dégradé de titre
+        self._payload_surfaces = {}  # topic → (version, largeur, [Surface])
+        
         self.clock = pygame.time.Clock()
         self.running = True
         self.last_stats_time = time.time()
@@ -219,24 +430,7 @@ class StreamsMonitor:
         signal.signal(signal.SIGTERM, signal_handler)
 
     def _setup_zenoh(self):
-        conf = zenoh.Config()
-        zc = self.config.get('zenoh', {})
-        
-        if 'mode' in zc:
-            conf.insert_json5("mode", json.dumps(zc['mode']))
-        
-        if 'connect' in zc and 'endpoints' in zc['connect']:
-            endpoints = zc['connect']['endpoints']
-            if isinstance(endpoints, list):
-                conf.insert_json5("connect/endpoints", json.dumps(endpoints))
-        
-        try:
-            session = zenoh.open(conf)
-            logger.info("Zenoh session opened successfully")
-            return session
-        except Exception as e:
-            logger.error(f"Failed to open Zenoh session: {e}")
-            raise
+        return open_zenoh_session(self.config)
 
     def _setup_subscribers(self):
         for group in self.config['groups']:
@@ -248,11 +442,17 @@ class StreamsMonitor:
                     self.color_engine, 
                     self.window_duration
                 )
-                try:
-                    self.zenoh_session.declare_subscriber(topic, self._zenoh_callback)
-                    logger.info(f"Subscribed to topic: {topic}")
-                except Exception as e:
-                    logger.error(f"Failed to subscribe to {topic}: {e}")
+                self.pinned_topics.add(topic)
+        
+        # Quelques expressions wildcard couvrent tous les topics, connus ou non
+        for origin in subscription_plan(self.config):
+            key_expr = origin['key_expr']
+            try:
+                self.subscribers.append(self.zenoh_session.declare_subscriber(
+                    key_expr, lambda sample, origin=origin: self._zenoh_callback(sample, origin)))
+                logger.info(f"Subscribed to key expression: {key_expr}")
+            except Exception as e:
+                logger.error(f"Failed to subscribe to {key_expr}: {e}")
 
     def _setup_groups(self):
         """Initialise les groupes pliables"""
@@ -267,14 +467,100 @@ class StreamsMonitor:
                 self.screen.get_width() - 20  # width
             )
             self.groups.append(group)
+            self._groups_by_name[group.name] = group
             y_offset += group.get_height() + 10
 
-    def _zenoh_callback(self, sample):
+    def _prefix_group(self, topic):
+        """Nom de groupe automatique : les group_depth premiers segments de la clé."""
+        parts = topic.split('/')
+        depth = max(1, min(self.group_depth, len(parts) - 1))
+        return '/'.join(parts[:depth])
+
+    def _discover_stream(self, topic, origin):
+        """Crée un StreamLine à la première apparition d'une clé (thread Zenoh)."""
+        with self._streams_lock:
+            stream = self.streams.get(topic)
+            if stream is not None:
+                return stream
+            if len(self.streams) >= self.max_streams and not self._evict_lru_stream():
+                self.dropped_streams += 1
+                return None
+            stream = StreamLine(
+                topic,
+                origin['type'] if origin else next(iter(self.config['element_types'])),
+                self.color_engine,
+                self.window_duration,
+                max_impulses=self.discovered_max_impulses
+            )
+            stream.last_message_time = time.time()  # Protège le flux neuf de l'éviction
+            self.streams[topic] = stream
+            group_name = origin['group'] if origin and origin['group'] else self._prefix_group(topic)
+            self._pending_added.append((group_name, stream))
+        logger.info(f"Discovered stream: {topic}")
+        return stream
+
+    def _evict_lru_stream(self):
+        """Évince le flux découvert le moins récemment actif s'il est inactif (sous verrou)."""
+        now = time.time()
+        candidates = [s for t, s in self.streams.items() if t not in self.pinned_topics]
+        if not candidates:
+            return False
+        lru = min(candidates, key=lambda s: s.last_message_time or 0.0)
+        if now - (lru.last_message_time or 0.0) < self.evict_min_idle:
+            return False
+        del self.streams[lru.topic]
+        self._pending_removed.append(lru)
+        logger.info(f"Evicted idle stream: {lru.topic}")
+        return True
+
+    def _evict_idle_streams(self, now):
+        """Éviction périodique des flux découverts inactifs depuis idle_timeout."""
+        if self.idle_timeout <= 0:
+            return
+        with self._streams_lock:
+            idle = [s for t, s in self.streams.items()
+                    if t not in self.pinned_topics
+                    and now - (s.last_message_time or 0.0) > self.idle_timeout]
+            for stream in idle:
+                del self.streams[stream.topic]
+                self._pending_removed.append(stream)
+        for stream in idle:
+            logger.info(f"Evicted idle stream: {stream.topic}")
+
+    def _sync_groups(self):
+        """Intègre les flux découverts/évincés dans les groupes (thread de rendu)."""
+        while self._pending_added:
+            group_name, stream = self._pending_added.popleft()
+            group = self._groups_by_name.get(group_name)
+            if group is None:
+                group = CollapsibleGroup(group_name, [], 10, 0,
+                                         self.screen.get_width() - 20, discovered=True)
+                self.groups.append(group)
+                self._groups_by_name[group_name] = group
+            group.elements.append(stream)
+        while self._pending_removed:
+            stream = self._pending_removed.popleft()
+            self._payload_surfaces.pop(stream.topic, None)
+            for group in self.groups:
+                if stream in group.elements:
+                    group.elements.remove(stream)
+                    if group.discovered and not group.elements:
+                        self.groups.remove(group)
+                        del self._groups_by_name[group.name]
+                    break
+
+    def _zenoh_callback(self, sample, origin=None):
         topic = str(sample.key_expr)
+        stream = self.streams.get(topic)
+        if stream is None:
+            stream = self._discover_stream(topic, origin)
+            if stream is None:
+                return
         try:
-            payload = json.loads(sample.payload.to_string())
-            if topic in self.streams:
-                self.streams[topic].on_message_received(payload)
+            if self.lazy_decode:
+                stream.on_message_received(sample.payload.to_bytes(), raw=True)
+            else:
+                stream.on_message_received(json.loads(sample.payload.to_string()))
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error for topic {topic}: {e}")
         except Exception as e:
@@ -294,9 +580,15 @@ class StreamsMonitor:
             self.fps = self.frame_count
             self.frame_count = 0
             self.last_stats_time = now
+            self._evict_idle_streams(now)
+        
+        # Flux découverts ou évincés depuis la dernière image
+        self._sync_groups()
         
         # Header
-        header_text = f"🧠 STREAMS MONITOR - {self.window_duration}s | FPS: {getattr(self, 'fps', 0)}/{self.target_fps}"
+        header_text = (f"🧠 STREAMS MONITOR - {self.window_duration}s | FPS: {getattr(self, 'fps', 0)}/{self.target_fps}"
+                       f" | {len(self.streams)} streams")
+        # Texte changeant à chaque image : rendu direct, hors cache
         header_surf = self.font_main.render(header_text, True, (0, 255, 255))
         self.screen.blit(header_surf, (win_w//2 - header_surf.get_width()//2, 15))
         
@@ -321,22 +613,19 @@ class StreamsMonitor:
         # Titre du groupe (toujours visible)
         title_rect = pygame.Rect(group.x, group.y, group.width, 30)
         
-        # Fond du titre avec dégradé
-        for i in range(30):
-            color_value = 20 + i
-            pygame.draw.line(self.screen, (color_value, color_value, color_value), 
-                           (group.x, group.y + i), (group.x + group.width, group.y + i))
+        # Fond du titre avec dégradé (pré-rendu une fois par largeur)
+        self.screen.blit(self._get_title_background(group.width), (group.x, group.y))
         
         # Bordure du titre
         pygame.draw.rect(self.screen, (60, 60, 60), title_rect, 1)
         
         # Icône de pliage/dépliage
         icon = "▼" if group.expanded else "▶"
-        icon_surf = self.font_main.render(icon, True, (0, 191, 255))
+        icon_surf = self.text_cache.render(self.font_main, icon, (0, 191, 255))
         self.screen.blit(icon_surf, (group.x + 5, group.y + 7))
         
         # Nom du groupe
-        name_surf = self.font_main.render(f"GROUPE: {group.name}", True, (0, 191, 255))
+        name_surf = self.text_cache.render(self.font_main, f"GROUPE: {group.name}", (0, 191, 255))
         self.screen.blit(name_surf, (group.x + 25, group.y + 7))
         
         # Si le groupe est expandé, dessiner les streams
@@ -346,7 +635,13 @@ class StreamsMonitor:
                            (group.x, group.y + 30), (group.x + group.width, group.y + 30), 1)
             
             stream_y = group.y + 40
+            win_h = self.screen.get_height()
             for stream in group.elements:
+                # Flux hors écran : ni rendu, ni décodage du payload
+                if stream_y + 90 < 0 or stream_y > win_h:
+                    stream_y += 100
+                    continue
+
                 # Largeurs adaptatives
                 osc_width = int(win_w * 0.55)  # 55% pour l'oscilloscope
                 payload_width = win_w - osc_width - 40  # Le reste pour le payload
@@ -356,10 +651,11 @@ class StreamsMonitor:
 
     def _draw_stream(self, stream, x, y, w, h, payload_width):
         now = time.time()
+        frequency = stream.current_frequency
         
         # Couleur de base basée sur la fréquence (couleur du cadre)
-        base_color = stream.color_engine.get_color_from_frequency(stream.current_frequency, stream.type)
-        halo_intensity = stream.color_engine.get_halo_intensity(stream.current_frequency, stream.type)
+        base_color = stream.color_engine.get_color_from_frequency(frequency, stream.type)
+        halo_intensity = stream.color_engine.get_halo_intensity(frequency, stream.type)
         
         # ===== DESSIN DE L'OSCILLOSCOPE =====
         # Dessiner le halo uniquement sur le cadre
@@ -385,26 +681,27 @@ class StreamsMonitor:
         # Hauteur fixe des pics
         peak_h = int(h * 0.4)  # 40% de la hauteur totale
         
-        # Dessiner les pics (simples lignes verticales de la couleur du cadre)
-        for timestamp, payload in recent_impulses:
-            # Calculer la position x basée sur le timestamp
-            age = now - timestamp
-            progress = 1.0 - (age / stream.window_duration)  # 0 = vieux, 1 = récent
-            px = x + int(w * progress)
-            
-            # Dessiner une simple ligne verticale de la couleur du cadre
-            if px > x and px < x + w:
-                pygame.draw.line(self.screen, base_color,
-                               (px, mid_y - peak_h),
-                               (px, mid_y), 1)
+        # Dessiner les pics en un seul appel : positions calculées en bloc,
+        # dédoublonnées par colonne, puis tracées comme une ligne brisée
+        # qui revient sur la ligne centrale entre deux pics.
+        if recent_impulses.size:
+            progress = 1.0 - (now - recent_impulses) / stream.window_duration  # 0 = vieux, 1 = récent
+            px = x + (w * progress).astype(np.int32)
+            px = np.unique(px[(px > x) & (px < x + w)])
+            if px.size:
+                points = np.empty((px.size * 3, 2), dtype=np.int32)
+                points[:, 0] = np.repeat(px, 3)
+                points[:, 1] = mid_y
+                points[1::3, 1] = mid_y - peak_h
+                pygame.draw.lines(self.screen, base_color, False, points.tolist(), 1)
         
         # Informations textuelles sur l'oscilloscope
         topic_color = (0, 191, 255) if stream.type == "nerf" else (255, 165, 0)
-        txt_topic = self.font_small.render(f"{stream.topic}", True, topic_color)
+        txt_topic = self.text_cache.render(self.font_small, stream.topic, topic_color)
         self.screen.blit(txt_topic, (x + 5, y + 5))
         
         # Fréquence et compteur
-        freq_text = f"{stream.current_frequency:.1f} Hz | {stream.message_count} msgs"
+        freq_text = f"{frequency:.1f} Hz | {stream.message_count} msgs"
         txt_freq = self.font_small.render(freq_text, True, base_color)
         self.screen.blit(txt_freq, (x + 5, y + h - 35))
         
@@ -417,40 +714,58 @@ class StreamsMonitor:
         pygame.draw.rect(self.screen, (15, 15, 15), (payload_x, payload_y, payload_width, payload_h))
         pygame.draw.rect(self.screen, base_color, (payload_x, payload_y, payload_width, payload_h), 1)
         
-        # Afficher le dernier payload
-        if stream.last_payload:
-            # Formater le payload de façon lisible
-            payload_str = json.dumps(stream.last_payload)
-            
-            # Découper le payload en lignes
-            max_chars = int(payload_width / 6)
-            lines = []
-            current_line = ""
-            
-            for char in payload_str:
-                if len(current_line) < max_chars:
-                    current_line += char
-                else:
-                    lines.append(current_line)
-                    current_line = char
-            
-            if current_line:
-                lines.append(current_line)
-            
-            # Limiter à 3 lignes maximum
-            lines = lines[:3]
-            
-            # Afficher chaque ligne
+        # Afficher le dernier payload (re-rendu seulement s'il a changé)
+        payload_surfaces = self._get_payload_surfaces(stream, payload_width)
+        if payload_surfaces:
             line_y = payload_y + 10
-            for line in lines:
-                payload_surf = self.font_payload.render(line, True, (200, 200, 200))
+            for payload_surf in payload_surfaces:
                 self.screen.blit(payload_surf, (payload_x + 5, line_y))
                 line_y += 12
         else:
             # Aucun message reçu
-            no_data = self.font_payload.render("⏳...", True, (100, 100, 100))
+            no_data = self.text_cache.render(self.font_payload, "⏳...", (100, 100, 100))
             self.screen.blit(no_data, (payload_x + 5, payload_y + 15))
 
+    def _get_title_background(self, width):
+        """Dégradé du titre de groupe, rendu une fois par largeur de fenêtre."""
+        surf = self._title_backgrounds.get(width)
+        if surf is None:
+            surf = pygame.Surface((max(1, width), 30))
+            for i in range(30):
+                color_value = 20 + i
+                pygame.draw.line(surf, (color_value, color_value, color_value), (0, i), (width, i))
+            self._title_backgrounds = {width: surf}
+        return surf
+
+    def _get_payload_surfaces(self, stream, payload_width):
+        """
+        Lignes de payload rendues pour un flux. Le décodage, le formatage et
+        font.render ne sont refaits que si un nouveau payload est arrivé ou si
+        la largeur de la zone a changé.
+        """
+        version = stream.payload_version
+        cached = self._payload_surfaces.get(stream.topic)
+        if cached and cached[0] == version and cached[1] == payload_width:
+            return cached[2]
+        
+        last_payload = stream.last_payload
+        if not last_payload:
+            surfaces = []
+        else:
+            # Formater le payload de façon lisible
+            payload_str = json.dumps(last_payload)
+            if cached and cached[3] == payload_str and cached[1] == payload_width:
+                surfaces = cached[2]
+            else:
+                # Découper le payload en lignes (3 lignes maximum)
+                max_chars = max(1, int(payload_width / 6))
+                lines = [payload_str[i:i + max_chars] for i in range(0, len(payload_str), max_chars)][:3]
+                surfaces = [self.font_payload.render(line, True, (200, 200, 200)) for line in lines]
+            self._payload_surfaces[stream.topic] = (version, payload_width, surfaces, payload_str)
+            return surfaces
+        self._payload_surfaces[stream.topic] = (version, payload_width, surfaces, None)
+        return surfaces
+
     def _interpolate_color(self, c1, c2, t):
         """Interpole entre deux couleurs RGB"""
         return tuple(int(c1[i] * (1 - t) + c2[i] * t) for i in range(3))
@@ -509,6 +824,11 @@ class StreamsMonitor:
 
     def cleanup(self):
         logger.info("Cleaning up resources...")
+        for sub in self.subscribers:
+            try:
+                sub.undeclare()
+            except Exception:
+                pass
         if self.zenoh_session:
             try:
                 self.zenoh_session.close()
@@ -518,13 +838,268 @@ class StreamsMonitor:
         pygame.quit()
         logger.info("Pygame closed")
 
+# ============================================================================
+# Mode headless (agrégation de métriques)
+# ============================================================================
+
+class TopicStats:
+    """
+    Statistiques d'un topic en mémoire fixe : compteurs cumulés et anneaux
+    NumPy des derniers échantillons (arrivée, latence, taille du payload).
+    """
+
+    def __init__(self, topic, group=None, window=256):
+        self.topic = topic
+        self.group = group
+        self.window = window
+        self._arrivals = np.zeros(window, dtype=np.float64)
+        self._latencies = np.full(window, np.nan, dtype=np.float32)
+        self._sizes = np.zeros(window, dtype=np.float32)
+        self._head = 0
+        self._count = 0
+        self.message_count = 0
+        self.bytes_total = 0
+        self.last_message_time = None
+        self._lock = threading.Lock()
+
+    def record(self, now, size, latency=None):
+        with self._lock:
+            i = self._head
+            self._arrivals[i] = now
+            self._latencies[i] = np.nan if latency is None else latency
+            self._sizes[i] = size
+            self._head = (i + 1) % self.window
+            if self._count < self.window:
+                self._count += 1
+            self.message_count += 1
+            self.bytes_total += size
+            self.last_message_time = now
+
+    def summary(self, now, rate_window=10.0):
+        """Photographie des statistiques (taux sur rate_window secondes)."""
+        with self._lock:
+            n = self._count
+            arrivals = self._arrivals[:n].copy()
+            latencies = self._latencies[:n].copy()
+            sizes = self._sizes[:n].copy()
+            message_count = self.message_count
+            bytes_total = self.bytes_total
+            last = self.last_message_time
+        recent = arrivals >= now - rate_window
+        n_recent = int(recent.sum())
+        if n_recent == n and n > 1:
+            # Anneau plein dans la fenêtre : taux estimé sur l'étendue de l'anneau
+            span = now - arrivals.min()
+            rate = n / span if span > 0 else 0.0
+        else:
+            rate = n_recent / rate_window
+        known = latencies[~np.isnan(latencies)]
+        return {
+            "topic": self.topic,
+            "group": self.group,
+            "messages": message_count,
+            "bytes": bytes_total,
+            "rate_hz": round(float(rate), 3),
+            "bytes_per_s": round(float(rate * sizes[recent].mean()), 1) if n_recent else 0.0,
+            "payload_bytes_avg": round(float(sizes.mean()), 1) if n else 0.0,
+            "payload_bytes_max": int(sizes.max()) if n else 0,
+            "latency_ms_avg": round(float(known.mean()) * 1000, 3) if known.size else None,
+            "latency_ms_max": round(float(known.max()) * 1000, 3) if known.size else None,
+            "idle_s": round(now - last, 3) if last else None,
+        }
+
+class HeadlessMonitor:
+    """
+    Agrégateur de métriques sans interface : mêmes groupes que le moniteur
+    graphique, abonnés par expressions wildcard, exportés périodiquement en
+    JSON / texte Prometheus (réécriture atomique) et/ou sur le canal meta.
+    """
+
+    def __init__(self, config_filepath):
+        self.config = ConfigLoader.load(config_filepath)
+        hc = self.config.get('headless', {})
+        self.export_interval = hc.get('export_interval', 5.0)
+        self.rate_window = hc.get('rate_window', 10.0)
+        self.stats_window = hc.get('stats_window', 256)
+        self.max_topics = hc.get('max_topics', 1024)
+        self.json_path = hc.get('json_path')
+        self.prometheus_path = hc.get('prometheus_path')
+        self.meta_topic = hc.get('meta_topic')
+        self.node = hc.get('node', socket.gethostname())
+        
+        # Topics connus (groupe d'origine) ; les autres topics découverts
+        # via les wildcards sont suivis jusqu'à max_topics
+        self.known_groups = {
+            el['topic']: group['name']
+            for group in self.config['groups'] for el in group['elements']
+        }
+        self.key_exprs = hc.get('key_exprs') or wildcard_key_exprs(self.config)
+        self.stats = {}
+        self.dropped_topics = 0
+        self._stats_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self.running = True
+        
+        self._setup_signal_handlers()
+        self.zenoh_session = open_zenoh_session(self.config)
+        self.subscribers = []
+        for key_expr in self.key_exprs:
+            try:
+                self.subscribers.append(
+                    self.zenoh_session.declare_subscriber(key_expr, self._zenoh_callback))
+                logger.info(f"Subscribed to key expression: {key_expr}")
+            except Exception as e:
+                logger.error(f"Failed to subscribe to {key_expr}: {e}")
+        
+        logger.info(f"HeadlessMonitor initialized ({len(self.key_exprs)} key expressions, "
+                    f"export every {self.export_interval}s)")
+
+    def _setup_signal_handlers(self):
+        def signal_handler(sig, frame):
+            logger.info("Received interrupt signal, shutting down...")
+            self.running = False
+            self._stop_event.set()
+        
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+
+    def _get_stats(self, topic):
+        stats = self.stats.get(topic)
+        if stats is not None:
+            return stats
+        with self._stats_lock:
+            stats = self.stats.get(topic)
+            if stats is None:
+                if len(self.stats) >= self.max_topics:
+                    self.dropped_topics += 1
+                    return None
+                stats = TopicStats(topic, self.known_groups.get(topic), self.stats_window)
+                self.stats[topic] = stats
+            return stats
+
+    def _zenoh_callback(self, sample):
+        now = time.time()
+        try:
+            stats = self._get_stats(str(sample.key_expr))
+            if stats is None:
+                return
+            latency = None
+            if sample.timestamp is not None:
+                latency = max(0.0, now - sample.timestamp.get_time().timestamp())
+            stats.record(now, len(sample.payload), latency)
+        except Exception as e:
+            logger.error(f"Zenoh callback error: {e}")
+
+    def snapshot(self):
+        now = time.time()
+        with self._stats_lock:
+            stats = list(self.stats.values())
+        return {
+            "node": self.node,
+            "timestamp": now,
+            "topics_tracked": len(stats),
+            "topics_dropped": self.dropped_topics,
+            "topics": {s.topic: s.summary(now, self.rate_window) for s in stats},
+        }
+
+    @staticmethod
+    def _label_value(value):
+        """Échappe une valeur d'étiquette Prometheus (\\, " et saut de ligne)."""
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @staticmethod
+    def to_prometheus(snapshot):
+        """Formate une photographie au format texte d'exposition Prometheus."""
+        metrics = [
+            ("streams_messages_total", "counter", "messages", "Messages received"),
+            ("streams_bytes_total", "counter", "bytes", "Payload bytes received"),
+            ("streams_rate_hz", "gauge", "rate_hz", "Message rate"),
+            ("streams_bytes_per_second", "gauge", "bytes_per_s", "Payload throughput"),
+            ("streams_payload_bytes_avg", "gauge", "payload_bytes_avg", "Mean payload size"),
+            ("streams_payload_bytes_max", "gauge", "payload_bytes_max", "Max payload size"),
+            ("streams_latency_ms_avg", "gauge", "latency_ms_avg", "Mean delivery latency"),
+            ("streams_latency_ms_max", "gauge", "latency_ms_max", "Max delivery latency"),
+        ]
+        label = HeadlessMonitor._label_value
+        node = label(snapshot["node"])
+        lines = []
+        for name, kind, field, help_text in metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for topic, summary in snapshot["topics"].items():
+                value = summary[field]
+                if value is None:
+                    continue
+                labels = f'node="{node}",topic="{label(topic)}",group="{label(summary["group"] or "")}"'
+                lines.append(f"{name}{{{labels}}} {value}")
+        lines.append("# TYPE streams_topics_tracked gauge")
+        lines.append(f'streams_topics_tracked{{node="{node}"}} {snapshot["topics_tracked"]}')
+        lines.append("# TYPE streams_topics_dropped_total counter")
+        lines.append(f'streams_topics_dropped_total{{node="{node}"}} {snapshot["topics_dropped"]}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _write_atomic(path, text):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def export(self):
+        snapshot = self.snapshot()
+        if self.json_path:
+            self._write_atomic(self.json_path, json.dumps(snapshot, indent=2))
+        if self.prometheus_path:
+            self._write_atomic(self.prometheus_path, self.to_prometheus(snapshot))
+        if self.meta_topic:
+            self.zenoh_session.put(self.meta_topic, json.dumps(snapshot))
+        return snapshot
+
+    def run(self):
+        logger.info(f"Starting headless aggregation (export every {self.export_interval}s)")
+        try:
+            while self.running:
+                if self._stop_event.wait(self.export_interval):
+                    break
+                try:
+                    self.export()
+                except Exception as e:
+                    logger.error(f"Export failed: {e}")
+        finally:
+            self.cleanup()
+
+    def cleanup(self):
+        logger.info("Cleaning up resources...")
+        for sub in self.subscribers:
+            try:
+                sub.undeclare()
+            except Exception:
+                pass
+        if self.zenoh_session:
+            try:
+                self.zenoh_session.close()
+                logger.info("Zenoh session closed")
+            except Exception as e:
+                logger.error(f"Error closing Zenoh session: {e}")
+
 if __name__ == "__main__":
-    config_path = sys.argv[1] if len(sys.argv) > 1 else "streams_config.json"
+    import argparse
+    parser = argparse.ArgumentParser(description="StreamsMonitor — visualisation des flux Zenoh")
+    parser.add_argument("config", nargs="?", default="streams_config.json")
+    parser.add_argument("--headless", action="store_true",
+                        help="Agrégation de métriques sans interface graphique")
+    args = parser.parse_args()
+    config_path = args.config
     
     try:
-        logger.info(f"Starting StreamsMonitor with config: {config_path}")
-        viz = StreamsMonitor(config_path)
-        viz.run()
+        if args.headless:
+            logger.info(f"Starting HeadlessMonitor with config: {config_path}")
+            monitor = HeadlessMonitor(config_path)
+            monitor.run()
+        else:
+            logger.info(f"Starting StreamsMonitor with config: {config_path}")
+            viz = StreamsMonitor(config_path)
+            viz.run()
     except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         sys.exit(1)
@@ -533,4 +1108,4 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         logger.error(f"Startup failed: {e}", exc_info=True)
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Anneau d'horodatages de StreamLine : fenêtre récente avant et après
+retour de la tête d'écriture au début de l'anneau.
+"""
+
+import time
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("zenoh")
+
+from streams_monitor import StreamLine
+
+
+def _fill(stream, count):
+    for _ in range(count):
+        stream.on_message_received({})
+
+
+@pytest.mark.parametrize("count", [3, 4, 6, 8])
+def test_recent_impulses_follow_ring(count):
+    # 4 = anneau rempli exactement, 8 = tête revenue à 0 après un tour complet
+    stream = StreamLine("t", "nerf", None, window_duration=60.0, max_impulses=4)
+    _fill(stream, count)
+    recent = stream.get_recent_impulses(time.time())
+    assert recent.size == min(count, 4)
+    assert (recent[1:] >= recent[:-1]).all()
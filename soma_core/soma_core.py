@@ -201,41 +201,250 @@ class OverrideManager:
         return self.data["timestamp"]
 
 
+# ============================================================================
+# BUS BUDGET (backpressure and load shedding)
+# ============================================================================
+
+# Nerve classes, from most to least protected
+NERVE_PRIORITY = {
+    "organ": 3,
+    "health": 3,
+    "pain": 2,
+    "diagnostic": 2,
+    "flux": 1,
+    "heartbeat": 0,
+}
+
+# Fraction of the bucket that must remain for a class to be admitted
+NERVE_RESERVE = {
+    "organ": 0.0,
+    "health": 0.0,
+    "pain": 0.1,
+    "diagnostic": 0.1,
+    "flux": 0.25,
+    "heartbeat": 0.5,
+}
+
+# Classes never shed: organ failure, and organ health (it carries the shed statistics)
+RESERVED_CLASSES = {"organ", "health"}
+
+
+def classify_nerve(alias: str) -> str:
+    """Default nerve class derived from the scheduler alias."""
+    if alias.startswith("organ_"):
+        return "organ"
+    if alias.startswith("pain_"):
+        return "pain"
+    if alias.startswith("health_"):
+        return "health"
+    return "flux"
+
+
+class BusBudget:
+    """
+    Bus budget shared by the PubScheduler instances of one or more organs.
+    Each organ gets a message/s and bytes/s token bucket. Low-priority classes
+    must leave a reserve in the bucket, so they are shed first; organ failure
+    and health are always admitted (and still accounted). A degradation level (0..3) rises
+    while shedding occurs and falls once utilization is low again: nerves whose
+    priority is below the level have their period multiplied by degrade_factor.
+    """
+    
+    MAX_LEVEL = 3
+    
+    def __init__(self, max_msgs_per_s: float = 500.0, max_bytes_per_s: float = 256_000.0,
+                 burst_seconds: float = 1.0, degrade_factor: float = 4.0,
+                 window: float = 1.0, recover_utilization: float = 0.6):
+        self.max_msgs_per_s = max_msgs_per_s
+        self.max_bytes_per_s = max_bytes_per_s
+        self.burst_seconds = burst_seconds
+        self.degrade_factor = degrade_factor
+        self.window = window
+        self.recover_utilization = recover_utilization
+        self._lock = threading.Lock()
+        self._organs: Dict[str, Dict[str, Any]] = {}
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> 'BusBudget':
+        return cls(
+            max_msgs_per_s=config.get("max_msgs_per_s", 500.0),
+            max_bytes_per_s=config.get("max_bytes_per_s", 256_000.0),
+            burst_seconds=config.get("burst_seconds", 1.0),
+            degrade_factor=config.get("degrade_factor", 4.0),
+            window=config.get("window", 1.0),
+            recover_utilization=config.get("recover_utilization", 0.6)
+        )
+    
+    def _organ(self, organ: str, now: float) -> Dict[str, Any]:
+        state = self._organs.get(organ)
+        if state is None:
+            state = {
+                "msg_tokens": self.max_msgs_per_s * self.burst_seconds,
+                "byte_tokens": self.max_bytes_per_s * self.burst_seconds,
+                "refill_time": now,
+                "window_start": now,
+                "window_msgs": 0,
+                "window_bytes": 0,
+                "window_shed": 0,
+                "msgs_per_s": 0.0,
+                "bytes_per_s": 0.0,
+                "level": 0,
+                "published": collections.Counter(),
+                "shed": collections.Counter(),
+            }
+            self._organs[organ] = state
+        return state
+    
+    def _refill(self, state: Dict[str, Any], now: float):
+        dt = now - state["refill_time"]
+        if dt > 0:
+            state["msg_tokens"] = min(self.max_msgs_per_s * self.burst_seconds,
+                                      state["msg_tokens"] + dt * self.max_msgs_per_s)
+            state["byte_tokens"] = min(self.max_bytes_per_s * self.burst_seconds,
+                                       state["byte_tokens"] + dt * self.max_bytes_per_s)
+            state["refill_time"] = now
+        elapsed = now - state["window_start"]
+        if elapsed >= self.window:
+            state["msgs_per_s"] = state["window_msgs"] / elapsed
+            state["bytes_per_s"] = state["window_bytes"] / elapsed
+            utilization = max(state["msgs_per_s"] / self.max_msgs_per_s,
+                              state["bytes_per_s"] / self.max_bytes_per_s)
+            if state["window_shed"]:
+                state["level"] = min(self.MAX_LEVEL, state["level"] + 1)
+            elif utilization < self.recover_utilization:
+                state["level"] = max(0, state["level"] - 1)
+            state["window_start"] = now
+            state["window_msgs"] = 0
+            state["window_bytes"] = 0
+            state["window_shed"] = 0
+    
+    def admit(self, organ: str, nerve_class: str) -> bool:
+        """Reserves one message for a nerve class; False means the message is shed."""
+        now = time.monotonic()
+        reserve = NERVE_RESERVE.get(nerve_class, NERVE_RESERVE["flux"])
+        with self._lock:
+            state = self._organ(organ, now)
+            self._refill(state, now)
+            msg_floor = reserve * self.max_msgs_per_s * self.burst_seconds
+            byte_floor = reserve * self.max_bytes_per_s * self.burst_seconds
+            if nerve_class not in RESERVED_CLASSES and (state["msg_tokens"] - 1.0 < msg_floor
+                                           or state["byte_tokens"] <= byte_floor):
+                state["shed"][nerve_class] += 1
+                state["window_shed"] += 1
+                return False
+            state["msg_tokens"] -= 1.0
+            state["window_msgs"] += 1
+            state["published"][nerve_class] += 1
+            return True
+    
+    def refund(self, organ: str, nerve_class: str):
+        """Returns the token of an admitted message that was not sent after all."""
+        with self._lock:
+            state = self._organ(organ, time.monotonic())
+            state["msg_tokens"] = min(self.max_msgs_per_s * self.burst_seconds, state["msg_tokens"] + 1.0)
+            state["window_msgs"] = max(0, state["window_msgs"] - 1)
+            state["published"][nerve_class] -= 1
+            if state["published"][nerve_class] <= 0:
+                del state["published"][nerve_class]
+    
+    def consume_bytes(self, organ: str, nbytes: int):
+        """Charges the bytes actually published after an admitted message."""
+        if not nbytes:
+            return
+        with self._lock:
+            state = self._organ(organ, time.monotonic())
+            state["byte_tokens"] -= nbytes
+            state["window_bytes"] += nbytes
+    
+    def period_factor(self, organ: str, nerve_class: str) -> float:
+        """Period multiplier to apply to a nerve class under the current pressure."""
+        with self._lock:
+            state = self._organs.get(organ)
+            if state is None:
+                return 1.0
+            self._refill(state, time.monotonic())
+            level = state["level"]
+        if NERVE_PRIORITY.get(nerve_class, 1) < level:
+            return self.degrade_factor
+        return 1.0
+    
+    def get_stats(self, organ: Optional[str] = None) -> Dict:
+        """Budget usage and shed counts (one organ, or all organs)."""
+        with self._lock:
+            organs = [organ] if organ else list(self._organs)
+            stats = {}
+            for name in organs:
+                state = self._organs.get(name)
+                if state is None:
+                    continue
+                stats[name] = {
+                    "msgs_per_s": round(state["msgs_per_s"], 1),
+                    "bytes_per_s": round(state["bytes_per_s"], 1),
+                    "max_msgs_per_s": self.max_msgs_per_s,
+                    "max_bytes_per_s": self.max_bytes_per_s,
+                    "degradation_level": state["level"],
+                    "published": dict(state["published"]),
+                    "shed": dict(state["shed"]),
+                    "shed_total": sum(state["shed"].values()),
+                }
+        return stats[organ] if organ else stats
+
+
 # ============================================================================
 # PUB SCHEDULER
 # ============================================================================
 
 class PubScheduler(threading.Thread):
-    """Publication scheduler with silence support (frequency = 0)."""
+    """
+    Publication scheduler with silence support (frequency = 0).
+    With a shared BusBudget, every publication is admitted per nerve class,
+    and low-priority nerves are slowed down while the organ is over budget.
+    The publish callback returns the number of bytes sent for accounting, or
+    None when nothing was sent (the budget token is then refunded).
+    """
+    
+    # Re-evaluation period of the budget degradation factors (seconds)
+    BUDGET_REFRESH = 0.5
     
-    def __init__(self, publish_callback: Callable[[str, Any], None],
-                 base_period: float = 0.01, name: str = "PubScheduler"):
+    def __init__(self, publish_callback: Callable[[str, Any], Optional[int]],
+                 base_period: float = 0.01, name: str = "PubScheduler",
+                 budget: Optional[BusBudget] = None, organ: Optional[str] = None):
         super().__init__(daemon=True, name=name)
         self.base_period = base_period
         self.publish = publish_callback
         self.running = True
         self._lock = threading.RLock()
+        self.budget = budget
+        self.organ = organ or name
         
         self.nerfs: Dict[str, List[float]] = {}      # alias -> [counter, step]
         self.active_flags: Dict[str, bool] = {}      # True if active
         self.base_periods: Dict[str, float] = {}     # base period (before sleep modulation)
+        self.nerve_classes: Dict[str, str] = {}      # alias -> nerve class (budget priority)
         self.registry: Dict[str, Any] = {}
         self.pending_steps: Dict[str, float] = {}
-        self.stats = {'cycles': 0, 'publications': 0, 'errors': 0}
+        self.stats = {'cycles': 0, 'publications': 0, 'errors': 0, 'shed': 0}
 
     def _period_to_step(self, period: float) -> float:
         if period <= 0:
             return 0.0
         return self.base_period / max(period, self.base_period)
 
-    def add_nerve(self, alias: str, target_period: float, active: bool = True):
+    def add_nerve(self, alias: str, target_period: float, active: bool = True,
+                  nerve_class: Optional[str] = None):
         step = self._period_to_step(target_period)
         with self._lock:
             self.nerfs[alias] = [0.0, step]
             self.base_periods[alias] = target_period
             self.active_flags[alias] = active and (target_period > 0)
+            self.nerve_classes[alias] = nerve_class or classify_nerve(alias)
             self.registry.setdefault(alias, None)
 
+    def set_nerve_class(self, alias: str, nerve_class: str):
+        with self._lock:
+            if alias in self.nerfs:
+                self.nerve_classes[alias] = nerve_class
+
     def update_payload(self, alias: str, payload: Any):
         with self._lock:
             self.registry[alias] = payload
@@ -263,6 +472,7 @@ class PubScheduler(threading.Thread):
             self.nerfs.pop(alias, None)
             self.active_flags.pop(alias, None)
             self.base_periods.pop(alias, None)
+            self.nerve_classes.pop(alias, None)
             self.registry.pop(alias, None)
             self.pending_steps.pop(alias, None)
 
@@ -271,21 +481,35 @@ class PubScheduler(threading.Thread):
             self.nerfs.clear()
             self.active_flags.clear()
             self.base_periods.clear()
+            self.nerve_classes.clear()
             self.registry.clear()
             self.pending_steps.clear()
-            self.stats = {'cycles': 0, 'publications': 0, 'errors': 0}
+            self.stats = {'cycles': 0, 'publications': 0, 'errors': 0, 'shed': 0}
+
+    def _budget_factors(self) -> Dict[str, float]:
+        if not self.budget:
+            return {}
+        return {cls: self.budget.period_factor(self.organ, cls) for cls in NERVE_PRIORITY}
 
     def run(self):
+        factors = self._budget_factors()
+        next_refresh = time.perf_counter() + self.BUDGET_REFRESH
         while self.running:
             cycle_start = time.perf_counter()
+            if self.budget and cycle_start >= next_refresh:
+                factors = self._budget_factors()
+                next_refresh = cycle_start + self.BUDGET_REFRESH
             with self._lock:
                 nerves_items = list(self.nerfs.items())
                 active_flags = self.active_flags.copy()
+                nerve_classes = self.nerve_classes.copy()
             
             for alias, state in nerves_items:
                 if not active_flags.get(alias, False):
                     continue
-                state[0] += state[1]
+                nerve_class = nerve_classes.get(alias, "flux")
+                # Degraded classes advance more slowly (longer period)
+                state[0] += state[1] / factors.get(nerve_class, 1.0)
                 if state[0] >= 1.0:
                     state[0] = 0.0
                     with self._lock:
@@ -293,11 +517,23 @@ class PubScheduler(threading.Thread):
                         if alias in self.pending_steps:
                             state[1] = self.pending_steps.pop(alias)
                     if payload is not None:
+                        if self.budget and not self.budget.admit(self.organ, nerve_class):
+                            with self._lock:
+                                self.stats['shed'] += 1
+                            continue
                         try:
-                            self.publish(alias, payload)
+                            sent = self.publish(alias, payload)
+                            if sent is None:
+                                if self.budget:
+                                    self.budget.refund(self.organ, nerve_class)
+                                continue
+                            if self.budget:
+                                self.budget.consume_bytes(self.organ, sent)
                             with self._lock:
                                 self.stats['publications'] += 1
                         except Exception as e:
+                            if self.budget:
+                                self.budget.refund(self.organ, nerve_class)
                             with self._lock:
                                 self.stats['errors'] += 1
             
@@ -312,6 +548,10 @@ class PubScheduler(threading.Thread):
         self.running = False
         time.sleep(self.base_period * 2)
 
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return self.stats.copy()
+
 
 # ============================================================================
 # FREQUENCY MAPPER
@@ -733,7 +973,8 @@ class PainSignal:
         self.last_stress = 0.0
         self.last_value = 0.0
         self.last_metadata = {}
-        self.scheduler.add_nerve(self.nerve_alias, 1.0 / self.HEARTBEAT_FREQ, active=True)
+        self.scheduler.add_nerve(self.nerve_alias, 1.0 / self.HEARTBEAT_FREQ, active=True,
+                                 nerve_class="heartbeat")
         self._update_heartbeat_payload()
     
     def update(self, stress: float, value: float, metadata=None):
@@ -757,6 +998,7 @@ class PainSignal:
         if transition:
             self.last_metadata["transition"] = transition
             self.last_metadata["transition_time"] = time.time()
+            self.scheduler.set_nerve_class(self.nerve_alias, "pain" if self.active else "heartbeat")
         if self.active:
             self._publish()
         else:
@@ -803,10 +1045,11 @@ class OrganFailureSignal:
     
     HEARTBEAT_FREQ = 1.0
     
-    def __init__(self, component: str, scheduler, zenoh):
+    def __init__(self, component: str, scheduler, zenoh, budget: Optional[BusBudget] = None):
         self.component = component
         self.scheduler = scheduler
         self.zenoh = zenoh
+        self.budget = budget
         self.topic = f"nerve/organ/{component}"
         self.heartbeat_alias = f"organ_{component}_heartbeat"
         self.failing = False
@@ -830,7 +1073,12 @@ class OrganFailureSignal:
                         "total": count,
                         "timestamp": time.time()
                     }
-                    self.zenoh.put(self.topic, json.dumps(payload))
+                    data = json.dumps(payload)
+                    if self.budget:
+                        # Never shed, only accounted
+                        self.budget.admit(self.component, "organ")
+                        self.budget.consume_bytes(self.component, len(data))
+                    self.zenoh.put(self.topic, data)
                     time.sleep(0.01)
             except queue.Empty:
                 continue
@@ -839,7 +1087,8 @@ class OrganFailureSignal:
         self.failing = True
         self.reason = reason
         self._spike_queue.put(("failure_enter", reason, 10))
-        self.scheduler.add_nerve(self.heartbeat_alias, 1.0 / self.HEARTBEAT_FREQ, active=True)
+        self.scheduler.add_nerve(self.heartbeat_alias, 1.0 / self.HEARTBEAT_FREQ, active=True,
+                                 nerve_class="organ")
         self._update_heartbeat()
     
     def update_reason(self, reason: Dict):
@@ -874,24 +1123,47 @@ class OrganFailureSignal:
 class NeuralSignalingSystem:
     """Unified neural signaling system."""
     
-    def __init__(self, component: str, nerve_session, nerve_scheduler):
+    def __init__(self, component: str, nerve_session, nerve_scheduler,
+                 budget: Optional[BusBudget] = None):
         self.component = component
         self.zenoh = nerve_session
         self.scheduler = nerve_scheduler
+        self.budget = budget
         self.pain_signals: Dict[Tuple[str, str], PainSignal] = {}
+        self.pain_topics: Dict[str, str] = {}  # scheduler alias -> pain topic
         self.organ_failure: Optional[OrganFailureSignal] = None
     
     def emit_pain(self, domain: str, metric: str, stress: float, value: float, metadata=None):
         key = (domain, metric)
         if key not in self.pain_signals:
-            self.pain_signals[key] = PainSignal(domain, metric, self.scheduler, self.zenoh)
+            signal = PainSignal(domain, metric, self.scheduler, self.zenoh)
+            self.pain_signals[key] = signal
+            self.pain_topics[signal.nerve_alias] = signal.topic
         self.pain_signals[key].update(stress, value, metadata)
     
     def stop_pain(self, domain: str, metric: str):
         key = (domain, metric)
         if key in self.pain_signals:
-            self.pain_signals[key].stop()
-            del self.pain_signals[key]
+            signal = self.pain_signals.pop(key)
+            signal.stop()
+            self.pain_topics.pop(signal.nerve_alias, None)
+    
+    def nerve_topic(self, alias: str) -> Optional[str]:
+        """Topic of a pain or organ-failure nerve scheduled under `alias`."""
+        failure = self.organ_failure
+        if failure is not None and alias == failure.heartbeat_alias:
+            return failure.topic
+        return self.pain_topics.get(alias)
+    
+    def _put_diagnostic(self, topic: str, payload: Dict) -> bool:
+        """Publishes a diagnostic spike if the bus budget admits it."""
+        if self.budget and not self.budget.admit(self.component, "diagnostic"):
+            return False
+        data = json.dumps(payload)
+        self.zenoh.put(topic, data)
+        if self.budget:
+            self.budget.consume_bytes(self.component, len(data))
+        return True
     
     def emit_sensor_fault(self, sensor: str, reason: str, severity: str) -> int:
         severity_map = {"info": 1, "warning": 5, "error": 20, "critical": 100}
@@ -907,7 +1179,8 @@ class NeuralSignalingSystem:
                 "total": spikes,
                 "timestamp": time.time()
             }
-            self.zenoh.put(topic, json.dumps(payload))
+            if not self._put_diagnostic(topic, payload):
+                return i
             time.sleep(0.01)
         return spikes
     
@@ -918,7 +1191,7 @@ class NeuralSignalingSystem:
             "sensor": sensor,
             "timestamp": time.time()
         }
-        self.zenoh.put(topic, json.dumps(payload))
+        self._put_diagnostic(topic, payload)
     
     def emit_self_fault(self, fault_type: str, reason: str, severity: str) -> int:
         severity_map = {"warning": 5, "error": 20, "critical": 100}
@@ -934,13 +1207,15 @@ class NeuralSignalingSystem:
                 "total": spikes,
                 "timestamp": time.time()
             }
-            self.zenoh.put(topic, json.dumps(payload))
+            if not self._put_diagnostic(topic, payload):
+                return i
             time.sleep(0.01)
         return spikes
     
     def emit_organ_failure(self, reason: Dict):
         if not self.organ_failure:
-            self.organ_failure = OrganFailureSignal(self.component, self.scheduler, self.zenoh)
+            self.organ_failure = OrganFailureSignal(self.component, self.scheduler, self.zenoh,
+                                                    self.budget)
         self.organ_failure.enter(reason)
     
     def update_organ_failure(self, reason: Dict):
@@ -1123,7 +1398,8 @@ class HealthMonitor:
     
     def __init__(self, component: str, version: str,
                  get_incoming: Callable, get_outgoing: Callable, get_sensors: Callable,
-                 get_self_metrics: Optional[Callable] = None):
+                 get_self_metrics: Optional[Callable] = None,
+                 get_bus_stats: Optional[Callable] = None):
         self.component = component
         self.version = version
         self.health_version = "2.3"
@@ -1133,6 +1409,7 @@ class HealthMonitor:
         self.get_outgoing = get_outgoing
         self.get_sensors = get_sensors
         self.get_self_metrics = get_self_metrics
+        self.get_bus_stats = get_bus_stats
     
     def get_payload(self) -> Dict:
         payload = {
@@ -1153,6 +1430,10 @@ class HealthMonitor:
         sensors = self.get_sensors()
         if sensors:
             payload["sensors"] = sensors
+        if self.get_bus_stats:
+            bus = self.get_bus_stats()
+            if bus:
+                payload["bus"] = bus
         return payload
 
 
@@ -1247,23 +1528,31 @@ class SomaCore:
         self.hormonal_session = zenoh.open(base_conf.clone()) # not used by SomaCore
         self.meta_session = zenoh.open(base_conf.clone())     # config, health, validation
         
+        # Bus budget shared by both schedulers (per-organ ceiling)
+        self.bus_budget = BusBudget.from_config(self.tech_config.get('bus_budget', {}))
+        
         # Dedicated schedulers
         self.nerve_scheduler = PubScheduler(
             publish_callback=self._publish_nerve,
             base_period=self.tech_config.get('scheduler', {}).get('base_period', 0.01),
-            name=f"{self.name}_nerve_sched"
+            name=f"{self.name}_nerve_sched",
+            budget=self.bus_budget,
+            organ=self.name
         )
         self.nerve_scheduler.start()
         
         self.meta_scheduler = PubScheduler(
             publish_callback=self._publish_meta,
             base_period=0.1,   # slower for meta channel
-            name=f"{self.name}_meta_sched"
+            name=f"{self.name}_meta_sched",
+            budget=self.bus_budget,
+            organ=self.name
         )
         self.meta_scheduler.start()
         
         # Neural signaling system (uses nerve session)
-        self.neural = NeuralSignalingSystem(self.name, self.nerve_session, self.nerve_scheduler)
+        self.neural = NeuralSignalingSystem(self.name, self.nerve_session, self.nerve_scheduler,
+                                            self.bus_budget)
         
         # Collectors
         self.system_collector = SystemMetricCollector()
@@ -1307,7 +1596,8 @@ class SomaCore:
             get_incoming=self._get_incoming_stats,
             get_outgoing=self._get_outgoing_stats,
             get_sensors=self._get_sensor_summary,
-            get_self_metrics=self._get_self_metrics
+            get_self_metrics=self._get_self_metrics,
+            get_bus_stats=self._get_bus_stats
         )
         self.health.boot_count = self.override.get("boot_count", 0) + 1
         self.override.set("boot_count", self.health.boot_count)
@@ -1364,17 +1654,28 @@ class SomaCore:
     
     def _register_nerves(self):
         for name, cfg in self.sensors.items():
-            self.nerve_scheduler.add_nerve(cfg.nerve_alias, cfg.effective_period)
+            self.nerve_scheduler.add_nerve(cfg.nerve_alias, cfg.effective_period, nerve_class="flux")
     
-    def _publish_nerve(self, alias: str, payload: Any):
+    def _publish_nerve(self, alias: str, payload: Any) -> Optional[int]:
         for rule in self.rules + self.self_rules:
             if rule.alias == alias:
-                self.nerve_session.put(rule.flux_topic, json.dumps(payload))
-                return
+                data = json.dumps(payload)
+                self.nerve_session.put(rule.flux_topic, data)
+                return len(data)
+        # Pain and organ-failure nerves, arbitrated by the budget like flux
+        topic = self.neural.nerve_topic(alias)
+        if topic is None:
+            return None
+        data = json.dumps(payload)
+        self.nerve_session.put(topic, data)
+        return len(data)
     
-    def _publish_meta(self, alias: str, payload: Any):
+    def _publish_meta(self, alias: str, payload: Any) -> Optional[int]:
         if alias.startswith("health_"):
-            self.meta_session.put(f"health/{self.name}", json.dumps(payload))
+            data = json.dumps(payload)
+            self.meta_session.put(f"health/{self.name}", data)
+            return len(data)
+        return None
     
     def _on_config_update(self, sample):
         """Receive new configuration (retention topic)."""
@@ -1484,10 +1785,22 @@ class SomaCore:
             "memory_trend": round(self.self_monitor.trends.get("memory", 0.0), 4)
         }
     
+    def _get_bus_stats(self) -> Dict:
+        stats = self.bus_budget.get_stats(self.name) or {}
+        if stats:
+            stats["scheduler_shed"] = {
+                "nerve": self.nerve_scheduler.get_stats()["shed"],
+                "meta": self.meta_scheduler.get_stats()["shed"]
+            }
+        return stats
+    
     def _health_loop(self):
         while self.running:
-            payload = self.health.get_payload()
-            self.meta_session.put(f"health/{self.name}", json.dumps(payload))
+            data = json.dumps(self.health.get_payload())
+            # Reserved class: never shed, only accounted
+            self.bus_budget.admit(self.name, "health")
+            self.bus_budget.consume_bytes(self.name, len(data))
+            self.meta_session.put(f"health/{self.name}", data)
             time.sleep(1.0)
     
     def stop(self):